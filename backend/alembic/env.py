@@ -7,6 +7,9 @@ from alembic import context
 from app.database import Base
 from app.models.session import Session
 from app.models.transcript import Transcript
+from app.models.transcript_cache import TranscriptCacheEntry
+from app.models.keyword_hit import KeywordHit
+from app.models.session_rollup import SessionRollup
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
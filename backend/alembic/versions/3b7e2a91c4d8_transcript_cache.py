@@ -0,0 +1,40 @@
+"""transcript cache
+
+Revision ID: 3b7e2a91c4d8
+Revises: f50c0cf82cfc
+Create Date: 2026-10-19 11:20:04.118532
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e2a91c4d8'
+down_revision: Union[str, Sequence[str], None] = 'f50c0cf82cfc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'transcript_cache',
+        sa.Column('id', sa.String(length=64), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('last_hit_at', sa.DateTime(), nullable=True),
+        sa.Column('hit_count', sa.Integer(), nullable=True),
+        sa.Column('transcript_text', sa.Text(), nullable=False),
+        sa.Column('confidence', sa.Float(), nullable=True),
+        sa.Column('word_count', sa.Integer(), nullable=True),
+        sa.Column('audio_duration', sa.Float(), nullable=True),
+        sa.Column('words', sa.JSON(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('transcript_cache')
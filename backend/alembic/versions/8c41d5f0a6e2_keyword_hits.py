@@ -0,0 +1,44 @@
+"""keyword hits
+
+Revision ID: 8c41d5f0a6e2
+Revises: 3b7e2a91c4d8
+Create Date: 2026-10-19 12:02:37.540218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41d5f0a6e2'
+down_revision: Union[str, Sequence[str], None] = '3b7e2a91c4d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'keyword_hits',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('session_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('phrase', sa.String(length=255), nullable=False),
+        sa.Column('channel', sa.Integer(), nullable=True),
+        sa.Column('start_time', sa.Float(), nullable=True),
+        sa.Column('end_time', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['session_id'], ['sessions.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_keyword_hits_session_id', 'keyword_hits', ['session_id'])
+    op.create_index('ix_keyword_hits_phrase_created_at', 'keyword_hits', ['phrase', 'created_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_keyword_hits_phrase_created_at', table_name='keyword_hits')
+    op.drop_index('ix_keyword_hits_session_id', table_name='keyword_hits')
+    op.drop_table('keyword_hits')
@@ -0,0 +1,53 @@
+"""session metadata jsonb
+
+Revision ID: d2b8e4f61a93
+Revises: 5e9a3c17b2f4
+Create Date: 2026-10-19 15:08:44.902716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b8e4f61a93'
+down_revision: Union[str, Sequence[str], None] = '5e9a3c17b2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'sessions',
+        'session_metadata',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        postgresql_using='session_metadata::jsonb'
+    )
+    op.create_index(
+        'ix_sessions_session_metadata',
+        'sessions',
+        ['session_metadata'],
+        postgresql_using='gin',
+        postgresql_ops={'session_metadata': 'jsonb_path_ops'}
+    )
+    op.create_index('ix_sessions_status_created_at', 'sessions', ['status', 'created_at'])
+    op.create_index('ix_sessions_created_at', 'sessions', ['created_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_sessions_created_at', table_name='sessions')
+    op.drop_index('ix_sessions_status_created_at', table_name='sessions')
+    op.drop_index('ix_sessions_session_metadata', table_name='sessions')
+    op.alter_column(
+        'sessions',
+        'session_metadata',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        postgresql_using='session_metadata::json'
+    )
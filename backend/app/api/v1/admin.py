@@ -0,0 +1,118 @@
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import JSONResponse
+from starlette import status
+from uuid import UUID
+
+from app.services.decode_scheduler import decode_scheduler
+from app.services.load_monitor import load_monitor
+from app.services.response_cache import session_response_cache
+from app.services.session_registry import session_registry
+from app.services.drain import drain_controller
+from app.services.tracing import trace_registry
+from app.services.transcript_cache import transcript_cache
+
+router = APIRouter()
+
+
+@router.get("/load")
+async def get_load():
+    """
+    Report decode load on this node
+
+    Intended for load balancer health checks: responds 200 while the node
+    accepts new sessions and 503 once admission control would refuse them.
+
+    Returns:
+    - Active sessions, aggregate real-time factor and decode load
+    - Detached (resumable) session counts
+    """
+    snapshot = load_monitor.snapshot()
+    snapshot.update(session_registry.snapshot())
+    snapshot["draining"] = drain_controller.draining
+    snapshot["accepting"] = snapshot["accepting"] and not drain_controller.draining
+    return JSONResponse(
+        content=snapshot,
+        status_code=status.HTTP_200_OK if snapshot["accepting"] else status.HTTP_503_SERVICE_UNAVAILABLE
+    )
+
+
+@router.get("/cache")
+async def get_cache_stats():
+    """
+    Report transcript and session response cache effectiveness
+
+    Returns:
+    - Transcript cache memory and database hit counts, misses, stores and hit ratio
+    - Session response cache entries, hits, misses and hit ratio under "sessions"
+    """
+    snapshot = transcript_cache.snapshot()
+    snapshot["sessions"] = session_response_cache.snapshot()
+    return snapshot
+
+
+@router.get("/decode")
+async def get_decode_usage():
+    """
+    Report decode scheduler usage
+
+    Returns:
+    - Decode threads and queued jobs per priority
+    - Per tenant: jobs run and queued, audio and CPU seconds decoded, time
+      jobs spent queued, and the tenant's weight
+    """
+    return decode_scheduler.snapshot()
+
+
+@router.post("/sessions/{session_id}/trace", status_code=status.HTTP_202_ACCEPTED)
+async def request_session_trace(session_id: UUID):
+    """
+    Enable stage tracing for a session
+
+    Takes effect from the session's next audio chunk, so it can be requested
+    before the session starts or while it is running.
+
+    Path Parameters:
+    - session_id: UUID of the session
+    """
+    trace_registry.request(session_id)
+    return {"session_id": str(session_id), "status": "requested"}
+
+
+@router.get("/sessions/{session_id}/trace")
+async def get_session_trace(session_id: UUID):
+    """
+    Retrieve a session's stage timings as Chrome trace JSON
+
+    Load the response in chrome://tracing or ui.perfetto.dev.
+
+    Raises:
+    - 404: If the session was not traced or its trace was evicted
+    """
+    tracer = trace_registry.get(session_id)
+    if not tracer:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No trace recorded for session {session_id}"
+        )
+    return tracer.to_chrome_trace()
+
+
+@router.post("/drain", status_code=status.HTTP_202_ACCEPTED)
+async def start_drain(timeout: int = Query(None, ge=0)):
+    """
+    Drain this node before a deploy
+
+    New sessions are refused (close code 1012), active sessions get until
+    the deadline to finish, and any left are then stopped and persisted.
+
+    Query Parameters:
+    - timeout: Seconds to wait for active sessions (default: DRAIN_TIMEOUT_SECONDS)
+    """
+    drain_controller.start(timeout)
+    return drain_controller.snapshot()
+
+
+@router.get("/drain")
+async def get_drain_status():
+    """Report drain progress"""
+    return drain_controller.snapshot()
@@ -0,0 +1,75 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import Dict, Literal, Optional
+from datetime import datetime, timedelta
+
+from app.database import get_db
+from app.crud import session_rollup_crud
+from app.crud.session_rollup import COUNTERS, bucket_start
+from app.schemas.analytics import AnalyticsBucket, AnalyticsResponse
+
+router = APIRouter()
+
+
+def _bucket(start: datetime, counters: Dict[str, float]) -> AnalyticsBucket:
+    sessions = counters["sessions"]
+    return AnalyticsBucket(
+        bucket_start=start,
+        sessions=sessions,
+        completed=counters["completed"],
+        failed=counters["failed"],
+        completion_rate=counters["completed"] / sessions if sessions else None,
+        duration_hours=counters["duration_seconds"] / 3600,
+        words=counters["words"],
+        mean_confidence=(
+            counters["confidence_sum"] / counters["confidence_count"] if counters["confidence_count"] else None
+        )
+    )
+
+
+@router.get("", response_model=AnalyticsResponse)
+async def get_analytics(
+    granularity: Literal["hour", "day"] = "day",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Retrieve session totals per hour or day
+    
+    Served from precomputed rollups, see app/services/analytics.py.
+    
+    Query Parameters:
+    - granularity: hour or day (default: day)
+    - start: Range start, rounded down to its hour or day so the first
+      bucket is included (default: 30 days before end)
+    - end: Range end (default: now)
+    
+    Returns:
+    - Sessions, completion rate, session hours, words and mean confidence
+      per bucket, and for the whole range
+    
+    Raises:
+    - 400: If start is not before end
+    """
+    end = end or datetime.utcnow()
+    start = start or end - timedelta(days=30)
+    if start >= end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must be before end"
+        )
+    start = bucket_start(start, granularity)
+
+    rollups = session_rollup_crud.get_range(db, granularity, start, end)
+    totals = {name: sum(getattr(rollup, name) for rollup in rollups) for name in COUNTERS}
+    return AnalyticsResponse(
+        granularity=granularity,
+        start=start,
+        end=end,
+        totals=_bucket(start, totals),
+        buckets=[
+            _bucket(rollup.bucket_start, {name: getattr(rollup, name) for name in COUNTERS})
+            for rollup in rollups
+        ]
+    )
@@ -1,33 +1,82 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Any, List, Optional
 from uuid import UUID
+from datetime import datetime
+import asyncio
+import itertools
+import json
 
 from app.database import get_db
-from app.crud import session_crud
+from app.crud import keyword_hit_crud, session_crud
 from app.schemas.session import SessionResponse, SessionListResponse
+from app.schemas.keyword_hit import KeywordHitResponse
+from app.services.audio_archive import audio_archive
+from app.services.audio_processor import audio_processor
+from app.services.response_cache import session_response_cache
 
 router = APIRouter()
 
 
+def _metadata_value(value: str) -> Any:
+    """A metadata filter value: a JSON number, boolean, null or quoted string, else the raw text"""
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        return value
+    return parsed if parsed is None or isinstance(parsed, (str, int, float, bool)) else value
+
+
 @router.get("", response_model=SessionListResponse)
 async def get_sessions(
     skip: int = 0,
     limit: int = 100,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    metadata: List[str] = Query([]),
     db: Session = Depends(get_db)
 ):
     """
-    Retrieve all transcription sessions
+    Retrieve transcription sessions, newest first
     
     Query Parameters:
     - skip: Number of records to skip (default: 0)
     - limit: Maximum number of records to return (default: 100)
+    - status: Only sessions with this status (in_progress, completed, failed)
+    - created_after: Only sessions created at or after this time
+    - created_before: Only sessions created before this time
+    - metadata: key:value metadata filter, repeatable (e.g. metadata=tenant:acme);
+      values are parsed as JSON, so channels:2 and cached:true match numbers and
+      booleans, a quoted value ("2") matches a string, and anything else is
+      compared as text
     
     Returns:
-    - List of sessions with metadata
+    - Matching sessions with metadata, and the total number of matches
+    
+    Raises:
+    - 400: If a metadata filter is not key:value
     """
-    sessions = session_crud.get_multi(db, skip=skip, limit=limit)
-    total = session_crud.count(db)
+    metadata_filter = {}
+    for item in metadata:
+        key, separator, value = item.partition(":")
+        if not separator or not key:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid metadata filter {item!r}, expected key:value"
+            )
+        metadata_filter[key] = _metadata_value(value)
+
+    sessions, total = session_crud.search(
+        db,
+        status=status_filter,
+        created_after=created_after,
+        created_before=created_before,
+        metadata=metadata_filter,
+        skip=skip,
+        limit=limit
+    )
     
     return SessionListResponse(
         total=total,
@@ -38,11 +87,16 @@ async def get_sessions(
 @router.get("/{session_id}", response_model=SessionResponse)
 async def get_session(
     session_id: UUID,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
     Retrieve a specific transcription session with transcript
     
+    Completed sessions are served from an in-memory cache of serialized
+    responses. ETag and Last-Modified follow the session's updated_at, and
+    If-None-Match or If-Modified-Since requests get 304 when unchanged.
+    
     Path Parameters:
     - session_id: UUID of the session
     
@@ -52,15 +106,118 @@ async def get_session(
     Raises:
     - 404: If session not found
     """
-    session = session_crud.get_with_transcripts(db, session_id)
+    cached = session_response_cache.get(session_id)
+    if cached is None:
+        session = session_crud.get_with_transcripts(db, session_id)
+
+        if not session:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Session with id {session_id} not found"
+            )
+
+        cached = session_response_cache.build(session)
+
+    return cached.respond(request)
+
+
+@router.get("/{session_id}/keywords", response_model=List[KeywordHitResponse])
+async def get_session_keywords(
+    session_id: UUID,
+    db: Session = Depends(get_db)
+):
+    """
+    Retrieve the keywords spotted in a session's final transcript
     
-    if not session:
+    Path Parameters:
+    - session_id: UUID of the session
+    
+    Returns:
+    - Keyword hits with word timestamps, in stream order
+    
+    Raises:
+    - 404: If session not found
+    """
+    if not session_crud.get(db, session_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Session with id {session_id} not found"
         )
     
-    return session
+    return keyword_hit_crud.get_by_session(db, session_id)
+
+
+def _get_archive(session_id: UUID):
+    reader = audio_archive.reader(session_id)
+    if reader is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No archived audio for session {session_id}"
+        )
+    return reader
+
+
+@router.get("/{session_id}/audio")
+async def get_session_audio(
+    session_id: UUID,
+    start: Optional[float] = Query(None, ge=0),
+    end: Optional[float] = Query(None, ge=0)
+):
+    """
+    Stream a session's archived audio as WAV
+    
+    Path Parameters:
+    - session_id: UUID of the session
+    
+    Query Parameters:
+    - start: Range start in seconds (default: beginning)
+    - end: Range end in seconds (default: end of the recording)
+    
+    Returns:
+    - audio/wav with the interleaved PCM of the requested range
+    
+    Raises:
+    - 404: If the session has no archived audio
+    - 416: If the range is empty
+    """
+    reader = _get_archive(session_id)
+    start_byte, end_byte = reader.byte_range(start, end)
+    if end_byte <= start_byte:
+        raise HTTPException(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            detail="Requested audio range is empty"
+        )
+
+    header = audio_processor.wav_header(end_byte - start_byte, reader.sample_rate, reader.channels)
+    return StreamingResponse(
+        itertools.chain([header], reader.iter_range(start_byte, end_byte)),
+        media_type="audio/wav",
+        headers={"Content-Length": str(len(header) + end_byte - start_byte)}
+    )
+
+
+@router.get("/{session_id}/audio/index")
+async def get_session_audio_index(session_id: UUID):
+    """
+    List the archived final chunks of a session
+    
+    Path Parameters:
+    - session_id: UUID of the session
+    
+    Returns:
+    - Stream byte offset, channel and text of each final chunk, with the
+      archive's sample rate and channel count
+    
+    Raises:
+    - 404: If the session has no archived audio
+    """
+    reader = _get_archive(session_id)
+    return {
+        "sample_rate": reader.sample_rate,
+        "channels": reader.channels,
+        "total_bytes": reader.total_bytes,
+        "chunks": reader.index()
+    }
 
 
 @router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -89,4 +246,5 @@ async def delete_session(
         )
     
     session_crud.delete(db, id=session_id)
+    await asyncio.to_thread(audio_archive.delete, session_id)
     return None
@@ -0,0 +1,146 @@
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+import time
+
+from app.config import settings
+from app.database import get_db
+from app.crud import session_crud, session_rollup_crud, transcript_crud
+from app.schemas.transcript import TranscriptionResult
+from app.services.audio_processor import audio_processor
+from app.services.decode_scheduler import DEFAULT_TENANT, decode_scheduler
+from app.services.load_monitor import load_monitor
+from app.services.recognizer_profiles import get_profile
+from app.services.transcription import transcription_service
+from app.services.transcript_cache import transcript_cache
+
+router = APIRouter()
+
+# Recognizer options of an upload, part of its cache key. Uploads decode with
+# a fresh recognizer, i.e. the balanced profile.
+UPLOAD_OPTIONS = {
+    "sample_rate": settings.VOSK_SAMPLE_RATE,
+    "channels": 1,
+    "grammar": None,
+    "profile": get_profile("balanced").options()
+}
+
+
+def _decode_step(recognizer: Any, pcm_data: bytes, last: bool) -> Tuple[List[Dict[str, Any]], float]:
+    """Decode one piece of an upload on a decode thread, returns its results and CPU seconds spent"""
+    cpu_start = time.thread_time()
+    results = transcription_service.transcribe_step(recognizer, pcm_data, last)
+    return results, time.thread_time() - cpu_start
+
+
+async def _transcribe(pcm_data: bytes, tenant: Optional[str], session_id: UUID) -> Tuple[Dict[str, Any], float]:
+    """
+    Decode an upload as a series of batch jobs on one recognizer
+
+    Each job decodes a second of audio, so a long upload never holds a
+    decode thread that a live session is waiting for.
+    """
+    recognizer = transcription_service.create_recognizer()
+    get_profile("balanced").apply(recognizer)
+    step = settings.VOSK_SAMPLE_RATE * 2
+    results, cpu_seconds = [], 0.0
+    for start in range(0, len(pcm_data), step):
+        chunk = pcm_data[start:start + step]
+        chunk_results, cpu = await decode_scheduler.run(
+            _decode_step, recognizer, chunk, start + step >= len(pcm_data),
+            tenant=tenant,
+            session=session_id,
+            cost=audio_processor.calculate_duration(chunk, settings.VOSK_SAMPLE_RATE),
+            priority="batch"
+        )
+        results.extend(chunk_results)
+        cpu_seconds += cpu
+    return transcription_service.combine_results(results), cpu_seconds
+
+
+@router.post("", response_model=TranscriptionResult, status_code=status.HTTP_201_CREATED)
+async def transcribe_upload(
+    file: UploadFile = File(...),
+    tenant: Optional[str] = Query(None, min_length=1, max_length=64),
+    db: Session = Depends(get_db)
+):
+    """
+    Transcribe an uploaded WAV recording
+
+    The audio is normalized to 16-bit mono PCM and looked up in the transcript
+    cache before decoding, so identical audio is only decoded once. The upload
+    is recorded as a completed session. Decoding is scheduled as batch work,
+    a second of audio per job, so it only uses decode threads that live
+    sessions leave idle.
+
+    Query Parameters:
+    - tenant: Tenant the decode time is billed to (default: "default")
+
+    Returns:
+    - Transcript with word timings, and whether it came from the cache
+
+    Raises:
+    - 400: If the file is not a 16-bit PCM WAV or contains no audio
+    - 413: If the recording is longer than MAX_AUDIO_DURATION
+    """
+    # Check the length in the header before reading the audio
+    try:
+        if audio_processor.wav_duration(file.file) > settings.MAX_AUDIO_DURATION:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Recording is longer than {settings.MAX_AUDIO_DURATION} seconds"
+            )
+        pcm_data = audio_processor.wav_to_pcm(file.file, settings.VOSK_SAMPLE_RATE)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    audio_duration = audio_processor.calculate_duration(pcm_data, settings.VOSK_SAMPLE_RATE)
+    if not pcm_data:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Recording contains no audio")
+
+    key, result = None, None
+    if transcript_cache.enabled:
+        digest = transcript_cache.hasher(UPLOAD_OPTIONS)
+        digest.update(pcm_data)
+        key = digest.hexdigest()
+        result = transcript_cache.get(db, key)
+    cached = result is not None
+
+    session_id = uuid4()
+    if not cached:
+        result, cpu_seconds = await _transcribe(pcm_data, tenant, session_id)
+        load_monitor.record_decode(cpu_seconds, audio_duration)
+        result["audio_duration"] = audio_duration
+        if key:
+            transcript_cache.put(db, key, result)
+
+    # Record the upload like a finished streaming session
+    session_crud.upsert(db, id=session_id, metadata={
+        "source": "upload", "filename": file.filename, "cached": cached, "tenant": tenant or DEFAULT_TENANT
+    })
+    if result["text"]:
+        transcript_crud.create_for_session(db, session_id=session_id, text=result["text"], confidence=result["confidence"])
+    db_session = session_crud.update(
+        db,
+        db_obj=session_crud.get(db, session_id),
+        obj_in={"duration_seconds": audio_duration, "word_count": result["word_count"], "status": "completed"}
+    )
+    session_rollup_crud.record_session(
+        db,
+        created_at=db_session.created_at,
+        status="completed",
+        duration=audio_duration,
+        word_count=result["word_count"],
+        confidence=result["confidence"] if result["text"] else None
+    )
+
+    return TranscriptionResult(
+        session_id=session_id,
+        text=result["text"],
+        confidence=result["confidence"],
+        word_count=result["word_count"],
+        audio_duration=audio_duration,
+        words=result["words"],
+        cached=cached
+    )
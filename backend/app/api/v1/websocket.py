@@ -1,112 +1,602 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
-import json
+from typing import Any, Dict, List, Optional, Tuple, Union
+import asyncio
 import logging
 from datetime import datetime
-from uuid import uuid4
+from uuid import UUID, uuid4
 import time
 
+from app.config import settings
 from app.database import SessionLocal
-from app.services.transcription import transcription_service
+from app.services.transcription import grammar_cache, transcription_service
+from app.services.transcript_cache import transcript_cache
+from app.services.audio_archive import audio_archive
+from app.services.recognizer_profiles import RecognizerProfile, get_profile
+from app.services.keyword_spotter import PhraseMatcher, keyword_spotter
 from app.services.audio_processor import audio_processor
-from app.crud import session_crud, transcript_crud
-from app.schemas.session import SessionCreate
+from app.services.load_monitor import load_monitor
+from app.services.decode_scheduler import DEFAULT_TENANT, decode_scheduler
+from app.services.tracing import NULL_TRACER, trace_registry
+from app.services.session_registry import session_registry
+from app.services.heartbeat import Heartbeat
+from app.services.drain import drain_controller
+from app.services.broadcast import broadcast
+from app.crud import keyword_hit_crud, session_crud, session_rollup_crud, transcript_crud
+from app.schemas.websocket import WSResumeMessage, WSStartMessage
+from app.utils.serialization import serializer
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Close code sent when the node refuses a session for lack of capacity
+WS_CLOSE_TRY_AGAIN_LATER = 1013
+# Close code sent when the node is draining for a restart
+WS_CLOSE_SERVICE_RESTART = 1012
+# Close code sent when the client stopped answering heartbeats
+WS_CLOSE_HEARTBEAT_TIMEOUT = 4408
+# Close code sent to a watcher that fell too far behind the live session
+WS_CLOSE_SLOW_CONSUMER = 1008
+# Close code sent to a watcher of a session that is not running on this node
+WS_CLOSE_SESSION_NOT_FOUND = 4404
+
 class TranscriptionSession:
     """Manages a single transcription session"""
     def __init__(self, websocket: WebSocket, db: Session):
         self.websocket = websocket
         self.db = db
         self.session_id = None
-        self.recognizer = None
+        self.recognizers = []
+        self.grammar = None
         self.start_time = None
         self.accumulated_text = []
+        self.words = []
+        # Multi-channel state: one recognizer per channel, finals kept as
+        # timestamped segments and merged into a speaker-attributed transcript
+        self.channels = 1
+        self.channel_labels = []
+        self.segments = []
+        self._partial_frame = b""
+        # Profile state: audio held for re-chunking, audio seconds since each channel's last final
+        self.profile = get_profile()
+        self._chunk_buffer = []
+        self._buffered = 0
+        self._since_final = []
+        # Keyword spotting: hits to persist, and partial hits already sent per utterance
+        self.keyword_matcher: Optional[PhraseMatcher] = None
+        self.keyword_partials = False
+        self.keyword_hits = []
+        self._partial_hits = set()
+        # Decode scheduling: fair share of the decode threads
+        self.tenant = DEFAULT_TENANT
+        self.priority = "live"
         self.is_active = False
+        self.tracer = NULL_TRACER
+        self.encoding = "json"
+        self.metadata = {}
+        self._persist_task: Optional[asyncio.Task] = None
+        # Set when the session row must not be written
+        self.rejected = False
+        # Held while the recognizers decode, so stop() never flushes them mid-decode
+        self._decode_lock = asyncio.Lock()
+        # Resume state: PCM bytes decoded so far
+        self.resume_token = None
+        self.audio_offset = 0
+        self.detached = False
+        # Running transcript cache key over the decoded PCM
+        self._audio_hash = None
+        self.archive = None
+
+    async def send(self, message: Dict[str, Any]):
+        """Send a message to the client in the negotiated wire encoding"""
+        if self.websocket is None:
+            # Detached or disconnected, nobody to send to
+            return
+        if self.encoding == "msgpack":
+            await self.websocket.send_bytes(serializer.packb(message))
+        else:
+            await self.websocket.send_text(serializer.dumps(message))
+
+    async def emit(self, message: Dict[str, Any]):
+        """Send a transcript event to the client and publish it to watchers"""
+        await self.send(message)
+        broadcast.publish(self.session_id, message)
 
-    async def start(self):
-        """Initialize transcription session"""
-        # Create database session
-        session_create = SessionCreate(metadata={"started_at": datetime.utcnow().isoformat()})
-        db_session = session_crud.create(self.db, obj_in=session_create)
-        self.session_id = db_session.id
+    def _insert_session_row(self, client_session_id: bool) -> bool:
+        """
+        Insert the session row using a DB session owned by the calling thread
+
+        A retried start may reuse the client-supplied ID of its own
+        in-progress row, but not that of a finished session.
+
+        Returns:
+            False, writing nothing, if the client-supplied ID belongs to a finished session
+        """
+        db = SessionLocal()
+        try:
+            if client_session_id:
+                existing = session_crud.get(db, self.session_id)
+                if existing is not None and existing.status != "in_progress":
+                    return False
+            session_crud.upsert(db, id=self.session_id, metadata=self.metadata)
+            return True
+        finally:
+            db.close()
+
+    async def _persist_start(self, client_session_id: bool = False) -> bool:
+        """Persist the session row off the event loop, returns False if it was not written"""
+        try:
+            if await asyncio.to_thread(self._insert_session_row, client_session_id):
+                return True
+        except Exception as e:
+            logger.error(f"Error persisting session {self.session_id}: {e}")
+            return False
+        await self._reject(f"Session {self.session_id} has already ended")
+        return False
+
+    async def _reject(self, message: str):
+        """Abandon a session without writing anything, e.g. one reusing a finished session's ID"""
+        self.rejected = True
+        # Drop the buffered audio rather than overwrite the other session's archive
+        self.archive = None
+        await self.send({"type": "error", "message": message})
+        if not self.is_active:
+            # stop() is waiting for the row and cleans up
+            return
+        self.is_active = False
+        load_monitor.session_ended(self.session_id)
+        session_registry.remove_active(self)
+        broadcast.close_session(self.session_id)
+        self._release_recognizers()
+
+    def _release_recognizers(self):
+        """Return grammar recognizers to the cache"""
+        if self.grammar:
+            for recognizer in self.recognizers:
+                grammar_cache.release(self.grammar, recognizer)
+            self.recognizers = []
+
+    async def start(
+        self,
+        session_id: Optional[UUID] = None,
+        trace: bool = False,
+        encoding: str = "json",
+        channels: int = 1,
+        channel_labels: Optional[List[str]] = None,
+        grammar: Optional[Tuple[str, ...]] = None,
+        profile: Optional[RecognizerProfile] = None,
+        keyword_matcher: Optional[PhraseMatcher] = None,
+        keyword_partials: bool = False,
+        tenant: Optional[str] = None,
+        priority: str = "live"
+    ) -> bool:
+        """
+        Initialize transcription session, returns False if it was refused
+
+        The client may supply the session ID. The reply is sent and decoding
+        can begin before the session row is written; the row is inserted in
+        the background and the insert is idempotent, so a retried start with
+        the same ID is harmless.
+
+        Multi-channel audio is sent interleaved; each channel is decoded by
+        its own recognizer and results are tagged with the channel index.
+        A grammar session takes pooled recognizers from the grammar cache.
+        The recognizer profile trades latency for accuracy. A keyword matcher
+        spots phrases in final chunks, and in partials if keyword_partials.
+        Decoding runs on the shared decode scheduler, billed to the tenant;
+        batch priority yields to live sessions.
+        """
+        if encoding == "msgpack" and not serializer.supports_msgpack:
+            await self.send({
+                "type": "error",
+                "message": "MessagePack encoding is not available, using JSON"
+            })
+        else:
+            self.encoding = encoding
+
+        # Refuse the session if this node is draining or cannot decode it in real time
+        if drain_controller.draining:
+            code, reason, close_code = "draining", "Server is restarting", WS_CLOSE_SERVICE_RESTART
+        else:
+            code, reason, close_code = "overloaded", load_monitor.check_admission(), WS_CLOSE_TRY_AGAIN_LATER
+        if reason:
+            message = {"type": "error", "code": code, "message": reason}
+            if settings.ADMISSION_REDIRECT_URL:
+                message["redirect"] = settings.ADMISSION_REDIRECT_URL
+            await self.send(message)
+            await self.websocket.close(code=close_code, reason=code)
+            return False
+
+        self.session_id = session_id or uuid4()
+        self.resume_token = session_registry.new_token()
+        self.tenant = tenant or DEFAULT_TENANT
+        self.priority = priority
+        self.metadata = {"started_at": datetime.utcnow().isoformat(), "tenant": self.tenant}
+        if priority != "live":
+            self.metadata["priority"] = priority
         self.start_time = time.time()
+        if trace:
+            self.tracer = trace_registry.start(self.session_id)
 
-        # Create Vosk recognizer
-        self.recognizer = transcription_service.create_recognizer()
+        self.channels = channels
+        if channels > 1:
+            labels = list(channel_labels or [])[:channels]
+            self.channel_labels = labels + [f"Speaker {i + 1}" for i in range(len(labels), channels)]
+            self.metadata["channels"] = channels
+            self.metadata["channel_labels"] = self.channel_labels
+
+        # Create Vosk recognizers
+        self.grammar = grammar
+        self.profile = profile or get_profile()
+        self.metadata["profile"] = self.profile.name
+        if transcript_cache.enabled and settings.TRANSCRIPT_CACHE_STREAMING:
+            self._audio_hash = transcript_cache.hasher({
+                "sample_rate": settings.VOSK_SAMPLE_RATE,
+                "channels": channels,
+                "grammar": grammar,
+                "profile": self.profile.options()
+            })
+        if audio_archive.enabled:
+            self.archive = audio_archive.writer(self.session_id, settings.VOSK_SAMPLE_RATE, channels)
+            self.metadata["audio_archive"] = True
+        if grammar:
+            self.recognizers = [grammar_cache.acquire(grammar) for _ in range(channels)]
+        else:
+            self.recognizers = [transcription_service.create_recognizer() for _ in range(channels)]
+        for recognizer in self.recognizers:
+            self.profile.apply(recognizer)
+        self._since_final = [0.0] * channels
+        self.keyword_matcher = keyword_matcher
+        self.keyword_partials = keyword_partials
         self.is_active = True
+        load_monitor.session_started(self.session_id)
+        session_registry.add_active(self)
         logger.info(f"Started transcription session: {self.session_id}")
 
-        # Send session ID to client
-        await self.websocket.send_json({
+        # Send session ID to client, then write the session row in the background
+        await self.send({
             "type": "session_started",
-            "session_id": str(self.session_id)
+            "session_id": str(self.session_id),
+            "resume_token": self.resume_token
+        })
+        self._persist_task = asyncio.create_task(self._persist_start(client_session_id=session_id is not None))
+        return True
+
+    def detach(self) -> bool:
+        """
+        Keep the session alive after its socket dropped so the client can resume
+
+        Returns:
+            False if resuming is disabled and the session should be stopped
+        """
+        self.websocket = None
+        if not session_registry.detach(self):
+            return False
+        self.detached = True
+        load_monitor.session_ended(self.session_id)
+        session_registry.remove_active(self)
+        return True
+
+    async def attach(self, websocket: WebSocket):
+        """
+        Resume a detached session on a new socket
+
+        The client continues with the audio after the offset in
+        session_resumed; all audio received from then on is decoded.
+        """
+        self.websocket = websocket
+        self.detached = False
+        # Buffered audio is not counted in the offset, the client resends it
+        self._partial_frame = b""
+        self._chunk_buffer, self._buffered = [], 0
+        load_monitor.session_started(self.session_id)
+        session_registry.add_active(self)
+        await self.send({
+            "type": "session_resumed",
+            "session_id": str(self.session_id),
+            "offset": self.audio_offset
         })
 
-    async def process_audio(self, audio_data: str):
-        """Process incoming audio chunk"""
+    async def expire(self):
+        """Finalize a detached session whose client did not come back"""
+        self.detached = False
+        try:
+            await self.stop()
+        finally:
+            self.db.close()
+
+    async def terminate(self):
+        """Stop the session for a server restart and close its socket"""
+        websocket = self.websocket
+        await self.stop()
+        if websocket is not None:
+            try:
+                await websocket.close(code=WS_CLOSE_SERVICE_RESTART, reason="draining")
+            except Exception:
+                pass
+
+    async def process_audio(self, audio_data: Union[str, bytes]):
+        """Process incoming audio chunk, base64 from a JSON message or raw PCM from a binary frame"""
         if not self.is_active:
             return
 
+        # Pick up tracing requested by an operator mid-session
+        if not self.tracer.enabled and trace_registry.pending:
+            self.tracer = trace_registry.claim(self.session_id) or self.tracer
+        tracer = self.tracer
+
         try:
             # Decode base64 audio
-            pcm_data = audio_processor.base64_to_pcm(audio_data)
+            if isinstance(audio_data, str):
+                with tracer.stage("decode_b64"):
+                    pcm_data = audio_processor.base64_to_pcm(audio_data)
+            else:
+                pcm_data = audio_data
 
             # Validate audio
-            if not audio_processor.validate_audio_format(pcm_data):
+            with tracer.stage("validate"):
+                is_valid = audio_processor.validate_audio_format(pcm_data, expected_channels=self.channels)
+            if not is_valid:
                 logger.warning("Invalid audio format received")
                 return
 
-            # Process with Vosk
-            result = transcription_service.process_audio_chunk(self.recognizer, pcm_data)
+            # Re-chunk to the profile's decode size
+            chunk_bytes = self.profile.chunk_bytes(self.channels)
+            if chunk_bytes:
+                self._chunk_buffer.append(pcm_data)
+                self._buffered += len(pcm_data)
+                if self._buffered < chunk_bytes:
+                    return
+                pcm_data = b"".join(self._chunk_buffer)
+                self._chunk_buffer, self._buffered = [], 0
 
-            if result["type"] == "partial":
-                # Send partial result to client
-                await self.websocket.send_json({
-                    "type": "partial",
-                    "text": result["text"]
-                })
-            elif result["type"] == "final":
-                # Accumulate final text
-                text = result["text"].strip()
-                if text:
-                    self.accumulated_text.append(text)
-                # Send final chunk to client
-                await self.websocket.send_json({
-                    "type": "final_chunk",
-                    "text": text,
-                    "confidence": result.get("confidence")
-                })
+            async with self._decode_lock:
+                # The session may have been stopped while waiting
+                if self.is_active:
+                    await self._decode(pcm_data, tracer)
         except Exception as e:
             logger.error(f"Error processing audio: {e}")
-            await self.websocket.send_json({
+            await self.send({
                 "type": "error",
                 "message": "Error processing audio"
             })
 
-    async def stop(self):
-        """Finalize transcription session"""
+    async def _decode(self, pcm_data: bytes, tracer):
+        """Decode audio and send the results"""
+        # Process with Vosk, recording decode cost for admission control
+        if self.channels == 1:
+            result, cpu_seconds = await self._schedule(0, pcm_data, audio_processor.calculate_duration(pcm_data), tracer)
+            results = [result]
+        else:
+            # Hold back a trailing partial frame until the next chunk
+            pcm_data = self._partial_frame + pcm_data
+            usable = len(pcm_data) - len(pcm_data) % (2 * self.channels)
+            pcm_data, self._partial_frame = pcm_data[:usable], pcm_data[usable:]
+            if not pcm_data:
+                return
+            results, cpu_seconds = await self._decode_channels(pcm_data, tracer)
+        # Mono duration of interleaved audio is the channel-seconds decoded
+        load_monitor.record_decode(cpu_seconds, audio_processor.calculate_duration(pcm_data))
+        self.audio_offset += len(pcm_data)
+        if self._audio_hash is not None:
+            self._audio_hash.update(pcm_data)
+        if self.archive is not None:
+            self.archive.append(pcm_data)
+
+        seconds = audio_processor.calculate_duration(pcm_data, channels=self.channels)
+        for channel, result in enumerate(results):
+            result = await self._force_final(channel, result, seconds)
+            await self._emit_result(result, channel, tracer)
+
+    async def _force_final(self, channel: int, result: Dict[str, Any], seconds: float) -> Dict[str, Any]:
+        """Finalize the utterance if the profile's forced-final interval passed without a final"""
+        if result["type"] == "final":
+            self._since_final[channel] = 0.0
+            return result
+        self._since_final[channel] += seconds
+        force_final_ms = self.profile.force_final_ms
+        if force_final_ms and result["text"] and self._since_final[channel] * 1000 >= force_final_ms:
+            self._since_final[channel] = 0.0
+            result = await self._final_result(channel)
+            result["forced"] = True
+        return result
+
+    def _decode_channel(self, channel: int, samples, tracer) -> Tuple[Dict[str, Any], float]:
+        """Decode one channel's samples, returns the result and CPU seconds spent"""
+        cpu_start = time.thread_time()
+        # The recognizer needs contiguous bytes, copying a strided view once
+        pcm_data = samples if isinstance(samples, bytes) else samples.tobytes()
+        result = transcription_service.process_audio_chunk(self.recognizers[channel], pcm_data, tracer)
+        return result, time.thread_time() - cpu_start
+
+    async def _schedule(self, channel: int, samples, seconds: float, tracer) -> Tuple[Dict[str, Any], float]:
+        """
+        Decode one channel's audio on a decode thread, charging its seconds to this session
+
+        Each channel's recognizer is its own scheduler flow: the scheduler runs
+        one job per flow at a time, and channels decode in parallel.
+        """
+        return await decode_scheduler.run(
+            self._decode_channel, channel, samples, tracer,
+            tenant=self.tenant,
+            session=(self.session_id, channel),
+            cost=seconds,
+            priority=self.priority
+        )
+
+    async def _final_result(self, channel: int) -> Dict[str, Any]:
+        """Flush one channel's recognizer on a decode thread"""
+        return await decode_scheduler.run(
+            transcription_service.get_final_result, self.recognizers[channel],
+            tenant=self.tenant,
+            session=(self.session_id, channel),
+            priority=self.priority
+        )
+
+    async def _decode_channels(self, pcm_data: bytes, tracer) -> Tuple[List[Dict[str, Any]], float]:
+        """Decode every channel of interleaved audio concurrently"""
+        with tracer.stage("deinterleave"):
+            channel_samples = audio_processor.deinterleave(pcm_data, self.channels)
+        seconds = audio_processor.calculate_duration(pcm_data, channels=self.channels)
+        decoded = await asyncio.gather(*(
+            self._schedule(channel, samples, seconds, tracer)
+            for channel, samples in enumerate(channel_samples)
+        ))
+        return [result for result, _ in decoded], sum(cpu for _, cpu in decoded)
+
+    def _add_segment(self, channel: int, result: Dict[str, Any], text: str):
+        """Record a channel's final text with the start time of its first word"""
+        words = result.get("words") or []
+        start = words[0].get("start") if words else None
+        if start is None:
+            # No word timings, fall back to the stream position
+            start = self.audio_offset / (2 * self.channels * settings.VOSK_SAMPLE_RATE)
+        self.segments.append({"channel": channel, "start": start, "text": text})
+
+    async def _emit_result(self, result: Dict[str, Any], channel: int, tracer):
+        """Send a recognizer result to the client, tagged with its channel for multi-channel sessions"""
+        if result["type"] == "partial":
+            # Send partial result to client
+            message = {
+                "type": "partial",
+                "text": result["text"],
+                "offset": self.audio_offset
+            }
+            if "words" in result:
+                message["words"] = result["words"]
+        elif result["type"] == "final":
+            # Accumulate final text
+            text = result["text"].strip()
+            self.words.extend(result.get("words") or [])
+            if text:
+                if self.channels == 1:
+                    self.accumulated_text.append(text)
+                else:
+                    self._add_segment(channel, result, text)
+            if self.archive is not None:
+                self.archive.mark(self.audio_offset, channel=channel, text=text)
+            # Send final chunk to client
+            message = {
+                "type": "final_chunk",
+                "text": text,
+                "confidence": result.get("confidence"),
+                "offset": self.audio_offset
+            }
+            if "alternatives" in result:
+                message["alternatives"] = result["alternatives"]
+            if result.get("forced"):
+                message["forced"] = True
+        else:
+            return
+        if self.channels > 1:
+            message["channel"] = channel
+        with tracer.stage("send"):
+            await self.emit(message)
+
+        if self.keyword_matcher is not None and (result["type"] == "final" or self.keyword_partials):
+            await self._spot_keywords(result, channel, tracer)
+
+    async def _spot_keywords(self, result: Dict[str, Any], channel: int, tracer):
+        """Send a keyword_hit for each phrase in a result, keeping final hits for persistence"""
+        words = result.get("words") or []
+        tokens = [word.get("word", "") for word in words] if words else result["text"].split()
+        with tracer.stage("keyword_spot"):
+            matches = self.keyword_matcher.find(tokens)
+
+        final = result["type"] == "final"
+        for phrase, first, last in matches:
+            if not final:
+                # A growing partial repeats earlier matches
+                if (channel, phrase, first) in self._partial_hits:
+                    continue
+                self._partial_hits.add((channel, phrase, first))
+            hit = {
+                "phrase": phrase,
+                "start": words[first].get("start") if words else None,
+                "end": words[last].get("end") if words else None,
+                "channel": channel
+            }
+            if final:
+                self.keyword_hits.append(hit)
+            message = {"type": "keyword_hit", **hit, "offset": self.audio_offset}
+            if self.channels == 1:
+                del message["channel"]
+            if not final:
+                message["partial"] = True
+            await self.emit(message)
+        if final and self._partial_hits:
+            self._partial_hits = {key for key in self._partial_hits if key[0] != channel}
+
+    async def _finish_channels(self) -> Tuple[str, int, Optional[float]]:
+        """Flush every channel's recognizer and merge the segments by start time"""
+        final_results = await asyncio.gather(*(self._final_result(channel) for channel in range(self.channels)))
+        for channel, final_result in enumerate(final_results):
+            await self._spot_flushed(final_result, channel)
+            self.words.extend(final_result.get("words") or [])
+            text = final_result.get("text", "").strip()
+            if text:
+                self._add_segment(channel, final_result, text)
+        transcript = transcription_service.merge_channel_segments(self.segments, self.channel_labels)
+        word_count = sum(transcription_service.calculate_word_count(s["text"]) for s in self.segments)
+        return transcript, word_count, transcription_service.calculate_confidence(self.words)
+
+    async def _spot_flushed(self, result: Dict[str, Any], channel: int):
+        """Spot keywords in the last utterance, which is flushed rather than emitted"""
+        if self.keyword_matcher is not None and result["text"].strip():
+            await self._spot_keywords(result, channel, self.tracer)
+
+    async def _finish_mono(self) -> Tuple[str, int, Optional[float]]:
+        """Flush the recognizer and join the final texts"""
+        final_result = await self._final_result(0)
+        await self._spot_flushed(final_result, 0)
+        final_text = final_result.get("text", "").strip()
+        self.words.extend(final_result.get("words") or [])
+
+        if final_text:
+            self.accumulated_text.append(final_text)
+
+        # Combine all text
+        full_transcript = " ".join(self.accumulated_text).strip()
+        word_count = transcription_service.calculate_word_count(full_transcript)
+        confidence = transcription_service.calculate_confidence(final_result.get("words", []))
+        return full_transcript, word_count, confidence
+
+    async def _flush(self) -> Tuple[str, int, Optional[float]]:
+        """Decode audio still held for re-chunking, then flush the recognizers"""
+        if self._chunk_buffer:
+            pcm_data = b"".join(self._chunk_buffer)
+            self._chunk_buffer, self._buffered = [], 0
+            await self._decode(pcm_data, self.tracer)
+        if self.channels == 1:
+            return await self._finish_mono()
+        return await self._finish_channels()
+
+    async def stop(self, status: str = "completed"):
+        """Finalize transcription session, recording it with the given status"""
         if not self.is_active:
             return
 
         self.is_active = False
+        load_monitor.session_ended(self.session_id)
+        session_registry.remove_active(self)
         try:
-            # Get final result from Vosk
-            final_result = transcription_service.get_final_result(self.recognizer)
-            final_text = final_result.get("text", "").strip()
+            # The session row must exist before it is updated
+            if not await self._persist_task:
+                if self.rejected:
+                    return
+                session_crud.upsert(self.db, id=self.session_id, metadata=self.metadata)
 
-            if final_text:
-                self.accumulated_text.append(final_text)
-
-            # Combine all text
-            full_transcript = " ".join(self.accumulated_text).strip()
+            # A drain can stop the session while the receive loop is decoding,
+            # wait for that decode before flushing the same recognizers
+            async with self._decode_lock:
+                full_transcript, word_count, confidence = await self._flush()
 
             # Calculate metrics
             duration = time.time() - self.start_time
-            word_count = transcription_service.calculate_word_count(full_transcript)
-            confidence = transcription_service.calculate_confidence(final_result.get("words", []))
+
+            if self.keyword_hits:
+                keyword_hit_crud.create_for_session(self.db, self.session_id, self.keyword_hits)
 
             # Save to database
             if full_transcript:
@@ -118,37 +608,68 @@ class TranscriptionSession:
                     confidence=confidence
                 )
                 # Update session
-                session_crud.update(
+                db_session = session_crud.update(
                     self.db,
                     db_obj=session_crud.get(self.db, self.session_id),
                     obj_in={
                         "duration_seconds": duration,
                         "word_count": word_count,
-                        "status": "completed"
+                        "status": status
                     }
                 )
+                session_rollup_crud.record_session(
+                    self.db,
+                    created_at=db_session.created_at,
+                    status=status,
+                    duration=duration,
+                    word_count=word_count,
+                    confidence=confidence
+                )
                 logger.info(f"Session {self.session_id} completed: {word_count} words in {duration:.2f}s")
 
+                # Cache the transcript so replays of the same audio skip decoding
+                if self._audio_hash is not None and status == "completed":
+                    transcript_cache.put(self.db, self._audio_hash.hexdigest(), {
+                        "text": full_transcript,
+                        "confidence": confidence,
+                        "word_count": word_count,
+                        "audio_duration": self.audio_offset / (2 * self.channels * settings.VOSK_SAMPLE_RATE),
+                        "words": self.words
+                    })
+
                 # Send final result to client
-                await self.websocket.send_json({
+                message = {
                     "type": "final",
                     "text": full_transcript,
                     "word_count": word_count,
                     "duration": round(duration, 2),
                     "confidence": confidence
-                })
+                }
+                if self.channels > 1:
+                    message["segments"] = [
+                        dict(segment, speaker=self.channel_labels[segment["channel"]])
+                        for segment in sorted(self.segments, key=lambda s: (s["start"], s["channel"]))
+                    ]
+                await self.emit(message)
             else:
                 # No transcription
-                session_crud.update(
+                db_session = session_crud.update(
                     self.db,
                     db_obj=session_crud.get(self.db, self.session_id),
                     obj_in={
                         "duration_seconds": duration,
                         "word_count": 0,
-                        "status": "completed"
+                        "status": status
                     }
                 )
-                await self.websocket.send_json({
+                session_rollup_crud.record_session(
+                    self.db,
+                    created_at=db_session.created_at,
+                    status=status,
+                    duration=duration,
+                    word_count=0
+                )
+                await self.emit({
                     "type": "final",
                     "text": "",
                     "word_count": 0,
@@ -157,10 +678,50 @@ class TranscriptionSession:
 
         except Exception as e:
             logger.error(f"Error finalizing session: {e}")
-            await self.websocket.send_json({
+            await self.send({
                 "type": "error",
                 "message": "Error finalizing transcription"
             })
+        finally:
+            broadcast.close_session(self.session_id)
+            if self.archive is not None:
+                await self.archive.close()
+            self._release_recognizers()
+
+def check_client_session_id(session_id: UUID):
+    """
+    Make sure a client-supplied session ID is not running on this node
+
+    Finished sessions are checked when the session row is written, off the
+    event loop, see TranscriptionSession._persist_start.
+
+    Raises:
+        ValueError: If the ID belongs to a running session
+    """
+    if session_registry.get(session_id) is not None:
+        raise ValueError(f"Session {session_id} is already running")
+
+
+async def reap_connection(websocket: WebSocket, session: TranscriptionSession, reason: str):
+    """
+    Reclaim a connection whose client died or stopped sending audio
+
+    A dead client's session is detached for resume if possible, otherwise it
+    is finalized as failed. An idle session is finalized as completed.
+    """
+    logger.warning(f"Reaping session {session.session_id}: {reason}")
+    load_monitor.record_reaped(reason)
+    if reason == "audio_idle":
+        await session.stop()
+        code = 1000
+    else:
+        if session.is_active and not session.detach():
+            await session.stop(status="failed")
+        code = WS_CLOSE_HEARTBEAT_TIMEOUT
+    try:
+        await websocket.close(code=code, reason=reason)
+    except Exception:
+        pass
 
 @router.websocket("/transcribe")
 async def websocket_transcribe(websocket: WebSocket):
@@ -168,15 +729,55 @@ async def websocket_transcribe(websocket: WebSocket):
     WebSocket endpoint for real-time transcription
     Protocol:
     Client -> Server:
-        {"type": "start"}
+        {"type": "start", "session_id": "<optional uuid>", "trace": false,
+         "encoding": "json" | "msgpack", "channels": 1, "channel_labels": ["agent", ...],
+         "grammar": ["yes", "no", ...] | "grammar_name": "<name in settings.GRAMMARS>",
+         "profile": "low_latency" | "balanced" | "accurate",
+         "keywords": ["cancel my account", ...] | "keyword_list": "<name in settings.KEYWORD_LISTS>",
+         "keyword_partials": false, "tenant": "<tenant>", "priority": "live" | "batch"}
+        {"type": "resume", "session_id": "<uuid>", "resume_token": "<token>"}
         {"type": "audio", "data": "<base64_audio>"}
+        <binary frame> raw 16-bit PCM audio, same as an audio message without base64
         {"type": "stop"}
+        {"type": "pong"}
     Server -> Client:
-        {"type": "session_started", "session_id": "<uuid>"}
-        {"type": "partial", "text": "<partial_text>"}
-        {"type": "final_chunk", "text": "<final_chunk_text>"}
+        {"type": "session_started", "session_id": "<uuid>", "resume_token": "<token>"}
+        {"type": "session_resumed", "session_id": "<uuid>", "offset": N}
+        {"type": "partial", "text": "<partial_text>", "offset": N}
+        {"type": "final_chunk", "text": "<final_chunk_text>", "offset": N}
         {"type": "final", "text": "<full_transcript>", "word_count": N, "duration": X}
+        {"type": "keyword_hit", "phrase": "<phrase>", "start": X, "end": X, "offset": N}
+            "partial": true when spotted in a partial result (not persisted)
         {"type": "error", "message": "<error_message>"}
+            also after session_started when "session_id" belongs to a finished
+            session; that session is then abandoned
+        {"type": "ping"} every WS_HEARTBEAT_INTERVAL seconds
+        {"type": "error", "code": "overloaded", "message": "...", "redirect": "<url>"}
+            followed by close code 1013 when the node is at capacity
+        {"type": "error", "code": "draining", "message": "...", "redirect": "<url>"}
+            followed by close code 1012 when the node is draining for a restart
+    Server messages are JSON text frames, or MessagePack binary frames when the
+    session was started with "encoding": "msgpack".
+
+    With "channels" > 1, audio is interleaved 16-bit PCM and each channel is
+    decoded by its own recognizer. Partial and final_chunk messages carry a
+    "channel" index, and the final transcript has one "<speaker>: <text>" line
+    per speaker turn plus a "segments" list ordered by start time.
+
+    The profile selects recognizer settings: "low_latency" adds word timings
+    to partials and forces a final_chunk ("forced": true) after a second of
+    audio without one; "accurate" adds N-best "alternatives" to final_chunk
+    and decodes in half-second chunks.
+
+    "offset" acknowledges the PCM bytes decoded so far. If the socket drops,
+    the session is kept for WS_RESUME_GRACE_SECONDS; the client reconnects,
+    sends "resume", and continues sending audio from the offset in
+    "session_resumed" (resending anything after it that it had already
+    sent). The server decodes every byte received after the resume.
+
+    A client silent for WS_HEARTBEAT_TIMEOUT seconds is disconnected (close
+    code 4408); a session without audio for WS_AUDIO_IDLE_TIMEOUT seconds is
+    finalized.
     """
     await websocket.accept()
     logger.info("WebSocket connection established")
@@ -184,40 +785,180 @@ async def websocket_transcribe(websocket: WebSocket):
     session = None
     try:
         session = TranscriptionSession(websocket, db)
+        heartbeat = Heartbeat()
         while True:
-            # Receive message from client
-            data = await websocket.receive_text()
-            message = json.loads(data)
-            msg_type = message.get("type")
-
-            if msg_type == "start":
-                await session.start()
-            elif msg_type == "audio":
+            # Receive message from client, waking up for pings and timeouts
+            try:
+                frame = await asyncio.wait_for(
+                    websocket.receive(),
+                    timeout=heartbeat.wait_time(session.is_active)
+                )
+                # Time handling the frame, not waiting for the client to send it
+                with session.tracer.stage("receive"):
+                    if frame["type"] == "websocket.disconnect":
+                        raise WebSocketDisconnect(frame.get("code", 1000))
+                    audio_frame = frame.get("bytes")
+                    message = serializer.loads(frame["text"]) if audio_frame is None else None
+            except asyncio.TimeoutError:
+                reason = heartbeat.expired(session.is_active)
+                if reason:
+                    await reap_connection(websocket, session, reason)
+                    break
+                if heartbeat.ping_due():
+                    await session.send({"type": "ping"})
+                    heartbeat.pinged()
+                continue
+
+            # Binary frames are raw PCM, skipping base64 and JSON entirely
+            if audio_frame is not None:
+                heartbeat.seen(is_audio=True)
+                await session.process_audio(audio_frame)
+                continue
+            msg_type = message.get("type") if isinstance(message, dict) else None
+
+            # Audio frames are checked by hand; the rarer control messages are
+            # validated against the Pydantic schemas
+            heartbeat.seen(is_audio=msg_type == "audio")
+            if msg_type == "audio":
                 audio_data = message.get("data")
-                if audio_data:
+                if audio_data and isinstance(audio_data, str):
                     await session.process_audio(audio_data)
+                elif audio_data:
+                    await session.send({
+                        "type": "error",
+                        "message": "Audio data must be a base64 string"
+                    })
+            elif msg_type == "start":
+                if session.is_active:
+                    await session.send({"type": "error", "message": "Session already started"})
+                    continue
+                try:
+                    start = WSStartMessage.model_validate(message)
+                    grammar = grammar_cache.resolve(start.grammar, start.grammar_name)
+                    profile = get_profile(start.profile)
+                    keyword_matcher = keyword_spotter.resolve(start.keywords, start.keyword_list)
+                    if start.session_id is not None:
+                        check_client_session_id(start.session_id)
+                except ValidationError as e:
+                    await session.send({
+                        "type": "error",
+                        "message": f"Invalid start message: {e.errors()[0]['msg']}"
+                    })
+                    continue
+                except ValueError as e:
+                    await session.send({"type": "error", "message": str(e)})
+                    continue
+                if not await session.start(
+                    session_id=start.session_id,
+                    trace=start.trace,
+                    encoding=start.encoding,
+                    channels=start.channels,
+                    channel_labels=start.channel_labels,
+                    grammar=grammar,
+                    profile=profile,
+                    keyword_matcher=keyword_matcher,
+                    keyword_partials=start.keyword_partials,
+                    tenant=start.tenant,
+                    priority=start.priority
+                ):
+                    break
+            elif msg_type == "resume":
+                try:
+                    resume = WSResumeMessage.model_validate(message)
+                except ValidationError as e:
+                    await session.send({
+                        "type": "error",
+                        "message": f"Invalid resume message: {e.errors()[0]['msg']}"
+                    })
+                    continue
+                if session.is_active:
+                    await session.send({"type": "error", "message": "Session already started"})
+                    continue
+                resumed = session_registry.resume(resume.session_id, resume.resume_token)
+                if resumed is None:
+                    await session.send({
+                        "type": "error",
+                        "code": "resume_failed",
+                        "message": "Session cannot be resumed, start a new one"
+                    })
+                    continue
+                # The resumed session keeps its own DB session
+                db.close()
+                session, db = resumed, resumed.db
+                await session.attach(websocket)
             elif msg_type == "stop":
                 await session.stop()
                 break
+            elif msg_type == "pong":
+                pass
             else:
                 logger.warning(f"Unknown message type: {msg_type}")
-                await websocket.send_json({
+                await session.send({
                     "type": "error",
                     "message": f"Unknown message type: {msg_type}"
                 })
     except WebSocketDisconnect:
         logger.info("WebSocket disconnected")
-        if session and session.is_active:
+        if session and session.is_active and not session.detach():
             await session.stop()
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
         try:
-            await websocket.send_json({
+            await session.send({
                 "type": "error",
                 "message": str(e)
             })
         except:
             pass
+        # The connection is over, treat it like a dropped socket
+        if session and session.is_active and not session.detach():
+            await session.stop(status="failed")
     finally:
-        db.close()
+        if session and session.session_id:
+            load_monitor.session_ended(session.session_id)
+        # A detached session keeps its DB session until it is resumed or expires
+        if not (session and session.detached):
+            db.close()
         logger.info("WebSocket connection closed")
+
+@router.websocket("/sessions/{session_id}/watch")
+async def websocket_watch(websocket: WebSocket, session_id: UUID):
+    """
+    WebSocket endpoint for watching a live session
+    Server -> Client:
+        {"type": "watching", "session_id": "<uuid>"}
+        {"type": "partial", "text": "<partial_text>", "offset": N}
+        {"type": "final_chunk", "text": "<final_chunk_text>", "offset": N}
+        {"type": "final", "text": "<full_transcript>", "word_count": N, "duration": X}
+    The socket is closed with code 1000 after the final event, 1008 if the
+    watcher falls more than BROADCAST_SUBSCRIBER_BUFFER events behind, or
+    4404 right away if the session is unknown or has already ended.
+    Messages from the watcher are ignored.
+    """
+    await websocket.accept()
+    if session_registry.get(session_id) is None:
+        await websocket.close(code=WS_CLOSE_SESSION_NOT_FOUND, reason="session_not_found")
+        return
+    subscription = broadcast.subscribe(session_id)
+
+    async def wait_for_disconnect():
+        try:
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+        finally:
+            subscription.close("disconnected")
+
+    receiver = asyncio.create_task(wait_for_disconnect())
+    try:
+        await websocket.send_text(serializer.dumps({"type": "watching", "session_id": str(session_id)}))
+        while (payload := await subscription.get()) is not None:
+            await websocket.send_text(payload)
+        if subscription.close_reason == "slow_consumer":
+            await websocket.close(code=WS_CLOSE_SLOW_CONSUMER, reason="slow_consumer")
+        elif subscription.close_reason == "session_ended":
+            await websocket.close(code=1000, reason="session_ended")
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        receiver.cancel()
+        broadcast.unsubscribe(subscription)
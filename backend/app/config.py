@@ -23,7 +23,65 @@ class Settings(BaseSettings):
 
     # WebSocket
     WS_MESSAGE_QUEUE_SIZE: int = 100
-    WS_HEARTBEAT_INTERVAL: int = 30
+    WS_HEARTBEAT_INTERVAL: int = 30  # seconds between server pings, 0 = no pings
+    WS_HEARTBEAT_TIMEOUT: int = 75  # seconds without any client message before reaping
+    WS_AUDIO_IDLE_TIMEOUT: int = 120  # seconds without audio before finalizing a session
+    JSON_BACKEND: str = "auto"  # auto, orjson, msgspec or json
+
+    # Session resume after a dropped socket
+    WS_RESUME_GRACE_SECONDS: int = 30  # 0 = sessions end when the socket drops
+    WS_RESUME_MAX_DETACHED: int = 100
+    WS_RESUME_MAX_RSS_MB: int = 0  # evict detached sessions above this RSS, 0 = no limit
+
+    # Live fan-out to session watchers
+    BROADCAST_BACKEND: str = "app.services.broadcast.InMemoryBroadcastHub"
+    BROADCAST_SUBSCRIBER_BUFFER: int = 256  # events a watcher may lag before it is dropped
+
+    # Graceful drain (SIGTERM or POST /api/v1/admin/drain)
+    DRAIN_TIMEOUT_SECONDS: int = 120  # time active sessions get to finish
+    DRAIN_POLL_INTERVAL: float = 1.0
+
+    # Admission control
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_MAX_SESSIONS: int = 0  # 0 = no hard session limit
+    ADMISSION_MAX_DECODE_LOAD: float = 0.8  # decode CPU seconds per wall second, per decode worker
+    ADMISSION_MAX_RTF: float = 0.9  # decode CPU seconds per audio second
+    ADMISSION_REDIRECT_URL: str = ""  # optional node to suggest when refusing
+    LOAD_WINDOW_SECONDS: int = 30
+
+    # Decode scheduling
+    DECODE_WORKERS: int = 0  # decode threads, 0 = one per CPU
+    DECODE_TENANT_WEIGHTS: dict = {}  # relative decode share per tenant, default 1.0
+
+    # Keyword spotting
+    KEYWORD_LISTS: dict = {}  # named phrase lists, e.g. {"tenant_a": ["cancel my account", ...]}
+    KEYWORD_CACHE_SIZE: int = 32  # compiled phrase matchers kept
+
+    # Recognizer profile used when the start message names none
+    RECOGNIZER_PROFILE: str = "balanced"  # low_latency, balanced or accurate
+
+    # Grammar-constrained recognizers
+    GRAMMARS: dict = {}  # named phrase lists, e.g. {"yes_no": ["yes", "no", "[unk]"]}
+    GRAMMAR_CACHE_SIZE: int = 64  # grammars kept with idle recognizers
+    GRAMMAR_POOL_SIZE: int = 8  # idle recognizers kept per grammar
+
+    # Transcript cache for repeated audio
+    TRANSCRIPT_CACHE_ENABLED: bool = True
+    TRANSCRIPT_CACHE_SIZE: int = 1024  # results kept in memory, all are kept in the database
+    TRANSCRIPT_CACHE_STREAMING: bool = True  # store completed streaming sessions too
+
+    # Serialized GET /sessions/{id} responses of completed sessions
+    SESSION_RESPONSE_CACHE_SIZE: int = 512  # 0 disables
+
+    # Raw audio archive
+    AUDIO_ARCHIVE_ENABLED: bool = False
+    AUDIO_ARCHIVE_DIR: str = "/app/audio_archive"
+    AUDIO_ARCHIVE_SEGMENT_MB: int = 64  # size of each append-only segment file
+    AUDIO_ARCHIVE_FLUSH_KB: int = 256  # audio buffered per background write
+
+    # Per-session tracing
+    TRACE_RING_SIZE: int = 10000  # stage events kept per traced session
+    TRACE_MAX_SESSIONS: int = 50  # traced sessions kept for retrieval
 
     # CORS
     CORS_ORIGINS: list = [
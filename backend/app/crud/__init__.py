@@ -1,4 +1,7 @@
 from app.crud.session import session_crud
 from app.crud.transcript import transcript_crud
+from app.crud.transcript_cache import transcript_cache_crud
+from app.crud.keyword_hit import keyword_hit_crud
+from app.crud.session_rollup import session_rollup_crud
 
-__all__ = ["session_crud", "transcript_crud"]
\ No newline at end of file
+__all__ = ["session_crud", "transcript_crud", "transcript_cache_crud", "keyword_hit_crud", "session_rollup_crud"]
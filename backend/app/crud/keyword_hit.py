@@ -0,0 +1,34 @@
+from typing import Any, Dict, List
+from sqlalchemy.orm import Session
+from uuid import UUID
+
+from app.crud.base import CRUDBase
+from app.models.keyword_hit import KeywordHit
+
+class CRUDKeywordHit(CRUDBase[KeywordHit, dict, dict]):
+    """CRUD operations for KeywordHit"""
+
+    def get_by_session(self, db: Session, session_id: UUID) -> List[KeywordHit]:
+        """Get a session's keyword hits in stream order"""
+        return (
+            db.query(KeywordHit)
+            .filter(KeywordHit.session_id == session_id)
+            .order_by(KeywordHit.start_time)
+            .all()
+        )
+
+    def create_for_session(self, db: Session, session_id: UUID, hits: List[Dict[str, Any]]) -> None:
+        """Store a session's keyword hits in one transaction"""
+        db.add_all([
+            KeywordHit(
+                session_id=session_id,
+                phrase=hit["phrase"],
+                channel=hit.get("channel", 0),
+                start_time=hit.get("start"),
+                end_time=hit.get("end")
+            )
+            for hit in hits
+        ])
+        db.commit()
+
+keyword_hit_crud = CRUDKeywordHit(KeywordHit)
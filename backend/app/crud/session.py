@@ -1,10 +1,26 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session, joinedload
+from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy import and_, desc, func, type_coerce
+from sqlalchemy.orm import Query, Session, joinedload
+from sqlalchemy.dialects import postgresql, sqlite
 from uuid import UUID
+from datetime import datetime
 
 from app.crud.base import CRUDBase
 from app.models.session import Session as SessionModel
 from app.schemas.session import SessionCreate, SessionUpdate
+from app.services.response_cache import session_response_cache
+
+
+def _sqlite_json_equals(key: str, value: Any):
+    """Match a top-level metadata value, type included (JSON_EXTRACT alone turns true into 1)"""
+    path = f'$."{key}"'
+    json_type = func.json_type(SessionModel.session_metadata, path)
+    if value is None:
+        return json_type == "null"
+    if isinstance(value, bool):
+        return json_type == ("true" if value else "false")
+    value_types = ["text"] if isinstance(value, str) else ["integer", "real"]
+    return and_(json_type.in_(value_types), func.json_extract(SessionModel.session_metadata, path) == value)
 
 class CRUDSession(CRUDBase[SessionModel, SessionCreate, SessionUpdate]):
     """CRUD operations for Session"""
@@ -18,12 +34,81 @@ class CRUDSession(CRUDBase[SessionModel, SessionCreate, SessionUpdate]):
             .first()
         )
 
+    def upsert(self, db: Session, *, id: UUID, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Insert an in-progress session row unless one with this ID exists (idempotent)"""
+        values = {"id": id, "session_metadata": metadata or {}}
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            statement = postgresql.insert(SessionModel).values(**values).on_conflict_do_nothing(index_elements=["id"])
+        elif dialect == "sqlite":
+            statement = sqlite.insert(SessionModel).values(**values).on_conflict_do_nothing(index_elements=["id"])
+        else:
+            if self.get(db, id) is None:
+                db.add(SessionModel(**values))
+                db.commit()
+            return
+        db.execute(statement)
+        db.commit()
+
+    def update(
+        self, db: Session, *, db_obj: SessionModel, obj_in: SessionUpdate | Dict[str, Any]
+    ) -> SessionModel:
+        """Update session, dropping its cached response"""
+        session_response_cache.invalidate(db_obj.id)
+        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+
+    def delete(self, db: Session, *, id: UUID) -> SessionModel:
+        """Delete session, dropping its cached response"""
+        session_response_cache.invalidate(id)
+        return super().delete(db, id=id)
+
+    def search(
+        self,
+        db: Session,
+        *,
+        status: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[SessionModel], int]:
+        """
+        Get a page of sessions matching all filters, newest first, and the total match count
+
+        Metadata values must equal the given JSON values, type included, so
+        {"channels": 2} does not match "2". On PostgreSQL this is a JSONB
+        containment (@>) query, answered from the GIN index.
+        """
+        query = db.query(SessionModel)
+        if status is not None:
+            query = query.filter(SessionModel.status == status)
+        if created_after is not None:
+            query = query.filter(SessionModel.created_at >= created_after)
+        if created_before is not None:
+            query = query.filter(SessionModel.created_at < created_before)
+        if metadata:
+            query = self._filter_metadata(db, query, metadata)
+
+        total = query.count()
+        sessions = query.order_by(desc(SessionModel.created_at)).offset(skip).limit(limit).all()
+        return sessions, total
+
+    def _filter_metadata(self, db: Session, query: Query, metadata: Dict[str, Any]) -> Query:
+        if db.get_bind().dialect.name == "postgresql":
+            # The column type is a JSON/JSONB variant, coerce to get JSONB's @> operator
+            return query.filter(type_coerce(SessionModel.session_metadata, postgresql.JSONB).contains(metadata))
+        for key, value in metadata.items():
+            query = query.filter(_sqlite_json_equals(key, value))
+        return query
+
     def get_by_status(self, db: Session, status: str) -> List[SessionModel]:
         """Get sessions by status"""
         return db.query(SessionModel).filter(SessionModel.status == status).all()
 
     def update_status(self, db: Session, session_id: UUID, status: str) -> Optional[SessionModel]:
         """Update session status"""
+        session_response_cache.invalidate(session_id)
         db_obj = self.get(db, session_id)
         if db_obj:
             db_obj.status = status
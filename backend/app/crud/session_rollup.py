@@ -0,0 +1,99 @@
+from typing import Any, Dict, List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql, sqlite
+from datetime import datetime
+
+from app.crud.base import CRUDBase
+from app.models.session_rollup import SessionRollup
+
+GRANULARITIES = ("hour", "day")
+COUNTERS = ("sessions", "completed", "failed", "duration_seconds", "words", "confidence_sum", "confidence_count")
+
+
+def bucket_start(timestamp: datetime, granularity: str) -> datetime:
+    """Truncate a timestamp to the start of its hour or day bucket"""
+    if granularity == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def session_counters(
+    status: str, duration: Optional[float], word_count: Optional[int], confidence: Optional[float]
+) -> Dict[str, Any]:
+    """Counter increments contributed by one finished session"""
+    return {
+        "sessions": 1,
+        "completed": int(status == "completed"),
+        "failed": int(status == "failed"),
+        "duration_seconds": duration or 0.0,
+        "words": word_count or 0,
+        "confidence_sum": confidence or 0.0,
+        "confidence_count": int(confidence is not None),
+    }
+
+
+class CRUDSessionRollup(CRUDBase[SessionRollup, dict, dict]):
+    """CRUD operations for SessionRollup"""
+
+    def add(self, db: Session, *, granularity: str, bucket: datetime, counters: Dict[str, Any], commit: bool = True) -> None:
+        """Add counters to a bucket, creating it if needed (atomic on PostgreSQL and SQLite)"""
+        values = {"granularity": granularity, "bucket_start": bucket, "updated_at": datetime.utcnow(), **counters}
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            statement = insert(SessionRollup).values(**values)
+            statement = statement.on_conflict_do_update(
+                index_elements=["granularity", "bucket_start"],
+                set_={
+                    "updated_at": statement.excluded.updated_at,
+                    **{name: getattr(SessionRollup, name) + statement.excluded[name] for name in COUNTERS}
+                }
+            )
+            db.execute(statement)
+        else:
+            rollup = db.get(SessionRollup, (granularity, bucket))
+            if rollup is None:
+                db.add(SessionRollup(**values))
+            else:
+                for name in COUNTERS:
+                    setattr(rollup, name, getattr(rollup, name) + counters[name])
+        if commit:
+            db.commit()
+
+    def record_session(
+        self,
+        db: Session,
+        *,
+        created_at: datetime,
+        status: str,
+        duration: Optional[float],
+        word_count: Optional[int],
+        confidence: Optional[float] = None
+    ) -> None:
+        """Count a finished session in the hour and day buckets it started in"""
+        counters = session_counters(status, duration, word_count, confidence)
+        for granularity in GRANULARITIES:
+            self.add(db, granularity=granularity, bucket=bucket_start(created_at, granularity), counters=counters, commit=False)
+        db.commit()
+
+    def get_range(self, db: Session, granularity: str, start: datetime, end: datetime) -> List[SessionRollup]:
+        """Get the buckets starting in [start, end)"""
+        return (
+            db.query(SessionRollup)
+            .filter(
+                SessionRollup.granularity == granularity,
+                SessionRollup.bucket_start >= start,
+                SessionRollup.bucket_start < end
+            )
+            .order_by(SessionRollup.bucket_start)
+            .all()
+        )
+
+    def delete_range(self, db: Session, start: datetime, end: datetime) -> None:
+        """Delete all buckets starting in [start, end), e.g. before a rebuild"""
+        db.query(SessionRollup).filter(
+            SessionRollup.bucket_start >= start,
+            SessionRollup.bucket_start < end
+        ).delete(synchronize_session=False)
+
+session_rollup_crud = CRUDSessionRollup(SessionRollup)
@@ -0,0 +1,34 @@
+from typing import Any, Dict, Optional
+from sqlalchemy.orm import Session
+from datetime import datetime
+
+from app.crud.base import CRUDBase
+from app.models.transcript_cache import TranscriptCacheEntry
+
+class CRUDTranscriptCache(CRUDBase[TranscriptCacheEntry, dict, dict]):
+    """CRUD operations for cached transcripts"""
+
+    def record_hit(self, db: Session, db_obj: TranscriptCacheEntry) -> None:
+        """Count a cache hit on an entry"""
+        db_obj.hit_count = (db_obj.hit_count or 0) + 1
+        db_obj.last_hit_at = datetime.utcnow()
+        db.commit()
+
+    def put(self, db: Session, *, id: str, result: Dict[str, Any]) -> Optional[TranscriptCacheEntry]:
+        """Store a transcript under its cache key, keeping an existing entry"""
+        db_obj = self.get(db, id)
+        if db_obj is not None:
+            return db_obj
+        db_obj = TranscriptCacheEntry(
+            id=id,
+            transcript_text=result["text"],
+            confidence=result.get("confidence"),
+            word_count=result.get("word_count", 0),
+            audio_duration=result.get("audio_duration"),
+            words=result.get("words", [])
+        )
+        db.add(db_obj)
+        db.commit()
+        return db_obj
+
+transcript_cache_crud = CRUDTranscriptCache(TranscriptCacheEntry)
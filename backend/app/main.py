@@ -5,7 +5,8 @@ import logging
 
 from app.config import settings
 from app.database import init_db
-from app.api.v1 import sessions, websocket
+from app.services.drain import drain_controller
+from app.api.v1 import admin, analytics, sessions, transcriptions, websocket
 
 # Configure logging
 logging.basicConfig(
@@ -23,9 +24,12 @@ async def lifespan(app: FastAPI):
     logger.info("Starting up application...")
     init_db()
     logger.info("Database initialized")
+    drain_controller.install_signal_handler()
     yield
     # Shutdown
     logger.info("Shutting down application...")
+    # Persist any session the drain (or the server's own shutdown) left behind
+    await drain_controller.force_stop_all()
 
 # Create FastAPI app
 app = FastAPI(
@@ -51,6 +55,21 @@ app.include_router(
     prefix=f"{settings.API_V1_PREFIX}/sessions",
     tags=["sessions"]
 )
+app.include_router(
+    transcriptions.router,
+    prefix=f"{settings.API_V1_PREFIX}/transcriptions",
+    tags=["transcriptions"]
+)
+app.include_router(
+    analytics.router,
+    prefix=f"{settings.API_V1_PREFIX}/analytics",
+    tags=["analytics"]
+)
+app.include_router(
+    admin.router,
+    prefix=f"{settings.API_V1_PREFIX}/admin",
+    tags=["admin"]
+)
 app.include_router(
     websocket.router,
     prefix="/ws",
@@ -1,4 +1,7 @@
 from app.models.session import Session
 from app.models.transcript import Transcript
+from app.models.transcript_cache import TranscriptCacheEntry
+from app.models.keyword_hit import KeywordHit
+from app.models.session_rollup import SessionRollup
 
-__all__ = ["Session", "Transcript"]
\ No newline at end of file
+__all__ = ["Session", "Transcript", "TranscriptCacheEntry", "KeywordHit", "SessionRollup"]
@@ -0,0 +1,34 @@
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from datetime import datetime
+import uuid
+
+from app.database import Base
+
+class KeywordHit(Base):
+    """Keyword hit model - a phrase spotted in a session's transcript"""
+    __tablename__ = "keyword_hits"
+    __table_args__ = (
+        # Compliance queries look up a phrase over a time range
+        Index("ix_keyword_hits_phrase_created_at", "phrase", "created_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    session_id = Column(
+        UUID(as_uuid=True), ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+
+    # Match
+    phrase = Column(String(255), nullable=False)
+    channel = Column(Integer, default=0)
+    start_time = Column(Float, nullable=True)  # seconds into the stream
+    end_time = Column(Float, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationship
+    session = relationship("Session", back_populates="keyword_hits")
+
+    def __repr__(self):
+        return f"<KeywordHit(session_id={self.session_id}, phrase={self.phrase!r})>"
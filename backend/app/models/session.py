@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, Integer, Float, DateTime, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, Float, DateTime, JSON, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -20,10 +20,23 @@ class Session(Base):
     status = Column(String(20), default="in_progress")  # in_progress, completed, failed
     
     # Additional metadata (browser info, model version, etc.)
-    session_metadata = Column(JSON, default={})
+    # JSONB on PostgreSQL so key/value filters can use the GIN index below
+    session_metadata = Column(JSON().with_variant(JSONB(), "postgresql"), default=dict)
 
     # Relationship
     transcripts = relationship("Transcript", back_populates="session", cascade="all, delete-orphan")
+    keyword_hits = relationship("KeywordHit", back_populates="session", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        Index("ix_sessions_created_at", "created_at"),
+        Index("ix_sessions_status_created_at", "status", "created_at"),
+        Index(
+            "ix_sessions_session_metadata",
+            "session_metadata",
+            postgresql_using="gin",
+            postgresql_ops={"session_metadata": "jsonb_path_ops"}
+        ),
+    )
 
     def __repr__(self):
         return f"<Session(id={self.id}, status={self.status}, words={self.word_count})>"
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, String, Integer, Float, DateTime
+from datetime import datetime
+
+from app.database import Base
+
+class SessionRollup(Base):
+    """Session totals per hour or day of their start, maintained as sessions finish"""
+    __tablename__ = "session_rollups"
+
+    granularity = Column(String(8), primary_key=True)  # hour, day
+    bucket_start = Column(DateTime, primary_key=True)  # session created_at, truncated
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Counters, summed over the sessions that started (created_at) in the bucket
+    sessions = Column(Integer, default=0, nullable=False)
+    completed = Column(Integer, default=0, nullable=False)
+    failed = Column(Integer, default=0, nullable=False)
+    duration_seconds = Column(Float, default=0.0, nullable=False)
+    words = Column(Integer, default=0, nullable=False)
+    confidence_sum = Column(Float, default=0.0, nullable=False)
+    confidence_count = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<SessionRollup(granularity={self.granularity}, bucket_start={self.bucket_start}, sessions={self.sessions})>"
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, String, Text, Float, Integer, DateTime, JSON
+from datetime import datetime
+
+from app.database import Base
+
+class TranscriptCacheEntry(Base):
+    """Cached transcript of a recording, keyed by a hash of its audio and decode options"""
+    __tablename__ = "transcript_cache"
+
+    # sha256 of model id, recognizer options and normalized PCM
+    id = Column(String(64), primary_key=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_hit_at = Column(DateTime, nullable=True)
+    hit_count = Column(Integer, default=0)
+
+    # Cached result
+    transcript_text = Column(Text, nullable=False)
+    confidence = Column(Float, nullable=True)
+    word_count = Column(Integer, default=0)
+    audio_duration = Column(Float, nullable=True)
+    words = Column(JSON, default=list)  # Vosk word timings
+
+    def __repr__(self):
+        return f"<TranscriptCacheEntry(id={self.id}, hits={self.hit_count})>"
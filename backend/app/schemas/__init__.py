@@ -1,4 +1,8 @@
 from app.schemas.session import SessionCreate, SessionResponse, SessionListResponse
-from app.schemas.transcript import TranscriptResponse
+from app.schemas.transcript import TranscriptResponse, TranscriptionResult
+from app.schemas.keyword_hit import KeywordHitResponse
 
-__all__ = ["SessionCreate", "SessionResponse", "SessionListResponse", "TranscriptResponse"]
\ No newline at end of file
+__all__ = [
+    "SessionCreate", "SessionResponse", "SessionListResponse",
+    "TranscriptResponse", "TranscriptionResult", "KeywordHitResponse"
+]
@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Literal, Optional
+
+class AnalyticsBucket(BaseModel):
+    """Totals of the sessions that started in one hour or day"""
+    bucket_start: datetime
+    sessions: int
+    completed: int
+    failed: int
+    completion_rate: Optional[float] = None
+    duration_hours: float
+    words: int
+    mean_confidence: Optional[float] = None
+
+class AnalyticsResponse(BaseModel):
+    """Schema for session analytics over a time range"""
+    granularity: Literal["hour", "day"]
+    start: datetime
+    end: datetime
+    totals: AnalyticsBucket
+    buckets: List[AnalyticsBucket]
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from datetime import datetime
+from uuid import UUID
+from typing import Optional
+
+class KeywordHitResponse(BaseModel):
+    """Schema for a spotted keyword"""
+    id: UUID
+    session_id: UUID
+    phrase: str
+    channel: int
+    start_time: Optional[float]
+    end_time: Optional[float]
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 from datetime import datetime
 from uuid import UUID
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 class TranscriptBase(BaseModel):
     """Base transcript schema"""
@@ -22,3 +22,13 @@ class TranscriptResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+class TranscriptionResult(BaseModel):
+    """Schema for a transcribed upload"""
+    session_id: UUID
+    text: str
+    confidence: Optional[float] = None
+    word_count: int
+    audio_duration: float
+    words: List[Dict[str, Any]] = []  # Vosk word timings
+    cached: bool = False  # served from the transcript cache
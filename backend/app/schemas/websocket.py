@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Literal, Optional
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
 from uuid import UUID
 
 class WebSocketMessage(BaseModel):
@@ -10,6 +10,24 @@ class WSStartMessage(WebSocketMessage):
     """WebSocket start session message"""
     type: Literal["start"]
     session_id: Optional[UUID] = None
+    trace: bool = False  # record per-stage timings for this session
+    encoding: Literal["json", "msgpack"] = "json"  # server -> client wire encoding
+    channels: int = Field(1, ge=1, le=8)  # interleaved audio channels, one recognizer each
+    channel_labels: Optional[List[str]] = None  # speaker label per channel
+    grammar: Optional[List[str]] = Field(None, min_length=1)  # phrases to constrain recognition to
+    grammar_name: Optional[str] = None  # named phrase list from settings.GRAMMARS
+    profile: Optional[str] = None  # low_latency, balanced or accurate
+    keywords: Optional[List[str]] = Field(None, min_length=1)  # phrases to spot
+    keyword_list: Optional[str] = None  # named phrase list from settings.KEYWORD_LISTS
+    keyword_partials: bool = False  # also spot keywords in partial results
+    tenant: Optional[str] = Field(None, min_length=1, max_length=64)  # decode time is shared fairly between tenants
+    priority: Literal["live", "batch"] = "live"  # batch (e.g. replayed recordings) yields to live streams
+
+class WSResumeMessage(WebSocketMessage):
+    """WebSocket resume detached session message"""
+    type: Literal["resume"]
+    session_id: UUID
+    resume_token: str
 
 class WSAudioMessage(WebSocketMessage):
     """WebSocket audio data message"""
@@ -0,0 +1,109 @@
+"""
+Session analytics rollups
+
+Finished sessions are counted into hourly and daily buckets of the
+session_rollups table as they stop, so dashboards read a few hundred bucket
+rows instead of aggregating the sessions table. Buckets are keyed by the
+session's created_at and are not decremented when a session is deleted.
+
+Rebuild the buckets from the sessions table (e.g. after deploying, or to
+include sessions that never reached stop) with:
+
+    python -m app.services.analytics [--since 2026-01-01] [--until 2026-02-01]
+"""
+import argparse
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+import logging
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.crud import session_rollup_crud
+from app.crud.session_rollup import COUNTERS, GRANULARITIES, bucket_start, session_counters
+from app.models.session import Session as SessionModel
+from app.models.transcript import Transcript
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = ("completed", "failed")
+
+
+def backfill(db: Session, since: Optional[datetime] = None, until: Optional[datetime] = None, batch_size: int = 1000) -> int:
+    """
+    Rebuild rollup buckets from the sessions table
+
+    The range is widened to whole days so hourly and daily buckets are
+    rebuilt consistently.
+
+    Args:
+        db: Database session
+        since: Start of the range (default: the oldest session)
+        until: End of the range (default: now)
+        batch_size: Sessions fetched per round trip
+
+    Returns:
+        Number of sessions counted
+    """
+    if since is None:
+        since = db.query(func.min(SessionModel.created_at)).scalar()
+        if since is None:
+            return 0
+    start = bucket_start(since, "day")
+    end = bucket_start(until or datetime.utcnow(), "day") + timedelta(days=1)
+
+    query = (
+        db.query(
+            SessionModel.created_at,
+            SessionModel.status,
+            SessionModel.duration_seconds,
+            SessionModel.word_count,
+            func.avg(Transcript.confidence)
+        )
+        .outerjoin(Transcript, Transcript.session_id == SessionModel.id)
+        .filter(
+            SessionModel.status.in_(FINISHED_STATUSES),
+            SessionModel.created_at >= start,
+            SessionModel.created_at < end
+        )
+        .group_by(SessionModel.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+    buckets: Dict[Tuple[str, datetime], Dict[str, float]] = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+    counted = 0
+    for created_at, status, duration, word_count, confidence in query:
+        counters = session_counters(status, duration, word_count, confidence)
+        for granularity in GRANULARITIES:
+            bucket = buckets[(granularity, bucket_start(created_at, granularity))]
+            for name in COUNTERS:
+                bucket[name] += counters[name]
+        counted += 1
+
+    session_rollup_crud.delete_range(db, start, end)
+    for (granularity, bucket), counters in buckets.items():
+        session_rollup_crud.add(db, granularity=granularity, bucket=bucket, counters=counters, commit=False)
+    db.commit()
+    logger.info(f"Rebuilt {len(buckets)} rollup buckets from {counted} sessions between {start} and {end}")
+    return counted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild session analytics rollups")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="start of the range (default: oldest session)")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="end of the range (default: now)")
+    args = parser.parse_args()
+
+    from app.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        backfill(db, args.since, args.until)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
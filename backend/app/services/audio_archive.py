@@ -0,0 +1,200 @@
+import asyncio
+import json
+import mmap
+import os
+import shutil
+import time
+from typing import Any, Dict, Iterator, List, Optional
+import logging
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+META_FILE = "meta.json"
+INDEX_FILE = "index.jsonl"
+
+
+class AudioArchiveWriter:
+    """
+    Appends a session's decoded PCM to fixed-size segment files
+
+    Audio is buffered on the event loop and handed to a worker thread once
+    flush_bytes (AUDIO_ARCHIVE_FLUSH_KB) are buffered, and on close. Batches
+    are chained so they land in order. Stream byte offset N is stored in segment N // segment_bytes at
+    position N % segment_bytes, next to an index of offsets per final chunk.
+    """
+
+    def __init__(self, directory: str, sample_rate: int, channels: int, segment_bytes: int, flush_bytes: int):
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.segment_bytes = segment_bytes
+        self.flush_bytes = flush_bytes
+        self.bytes_archived = 0
+        self._chunks: List[bytes] = []
+        self._buffered = 0
+        self._marks: List[Dict[str, Any]] = []
+        self._pending: Optional[asyncio.Future] = None
+        # Touched only by the worker thread running the current batch
+        self._written = 0
+        self._segment = None
+        self._index = None
+
+    def append(self, pcm_data: bytes):
+        """Queue decoded audio for archiving"""
+        self._chunks.append(pcm_data)
+        self._buffered += len(pcm_data)
+        self.bytes_archived += len(pcm_data)
+        if self._buffered >= self.flush_bytes:
+            self._schedule_flush()
+
+    def mark(self, offset: int, **info: Any):
+        """Record a final chunk ending at the given stream byte offset"""
+        self._marks.append({"offset": offset, **info})
+
+    def _schedule_flush(self):
+        chunks, marks = self._chunks, self._marks
+        self._chunks, self._marks, self._buffered = [], [], 0
+        self._pending = asyncio.ensure_future(self._write_after(self._pending, chunks, marks))
+
+    async def _write_after(self, previous: Optional[asyncio.Future], chunks: List[bytes], marks: List[Dict[str, Any]]):
+        if previous is not None:
+            await previous
+        try:
+            await asyncio.to_thread(self._write, chunks, marks)
+        except OSError as e:
+            logger.error(f"Error archiving audio to {self.directory}: {e}")
+
+    def _write(self, chunks: List[bytes], marks: List[Dict[str, Any]]):
+        if self._index is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._index = open(os.path.join(self.directory, INDEX_FILE), "w")
+        for chunk in chunks:
+            view = memoryview(chunk)
+            while view:
+                position = self._written % self.segment_bytes
+                if self._segment is None or position == 0:
+                    self._open_segment(self._written // self.segment_bytes)
+                room = self.segment_bytes - position
+                self._segment.write(view[:room])
+                self._written += min(room, len(view))
+                view = view[room:]
+        for entry in marks:
+            self._index.write(json.dumps(entry) + "\n")
+
+    def _open_segment(self, number: int):
+        if self._segment is not None:
+            self._segment.close()
+        self._segment = open(os.path.join(self.directory, segment_name(number)), "wb")
+
+    def _finish(self):
+        for handle in (self._segment, self._index):
+            if handle is not None:
+                handle.close()
+        with open(os.path.join(self.directory, META_FILE), "w") as f:
+            json.dump({
+                "sample_rate": self.sample_rate,
+                "channels": self.channels,
+                "segment_bytes": self.segment_bytes,
+                "total_bytes": self._written,
+                "closed_at": time.time(),
+            }, f)
+
+    async def close(self):
+        """Write any buffered audio and the archive metadata"""
+        self._schedule_flush()
+        await self._pending
+        try:
+            await asyncio.to_thread(self._finish)
+        except OSError as e:
+            logger.error(f"Error closing audio archive {self.directory}: {e}")
+
+
+class AudioArchiveReader:
+    """
+    Reads a byte range of an archived session through memory-mapped segments,
+    so playback and reprocessing never load whole files into memory
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(os.path.join(directory, META_FILE)) as f:
+            meta = json.load(f)
+        self.sample_rate = meta["sample_rate"]
+        self.channels = meta["channels"]
+        self.segment_bytes = meta["segment_bytes"]
+        self.total_bytes = meta["total_bytes"]
+
+    def byte_range(self, start: Optional[float] = None, end: Optional[float] = None) -> tuple:
+        """Convert a time range in seconds to frame-aligned stream byte offsets"""
+        frame = self.channels * 2
+
+        def to_offset(seconds: float) -> int:
+            return min(self.total_bytes, int(seconds * self.sample_rate) * frame)
+
+        return (
+            to_offset(start) if start is not None else 0,
+            to_offset(end) if end is not None else self.total_bytes,
+        )
+
+    def iter_range(self, start_byte: int, end_byte: int, chunk_bytes: int = 65536) -> Iterator[bytes]:
+        """Yield the PCM between two stream offsets in chunks of at most chunk_bytes"""
+        position = start_byte
+        while position < end_byte:
+            number, segment_start = divmod(position, self.segment_bytes)
+            segment_end = min(self.segment_bytes, segment_start + end_byte - position)
+            with open(os.path.join(self.directory, segment_name(number)), "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                segment_end = min(segment_end, len(mapped))
+                if segment_end <= segment_start:
+                    return
+                for offset in range(segment_start, segment_end, chunk_bytes):
+                    yield mapped[offset:min(offset + chunk_bytes, segment_end)]
+            position += segment_end - segment_start
+
+    def index(self) -> List[Dict[str, Any]]:
+        """Offsets and text of the archived session's final chunks"""
+        path = os.path.join(self.directory, INDEX_FILE)
+        if not os.path.exists(path):
+            return []
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+
+def segment_name(number: int) -> str:
+    return f"{number:06d}.pcm"
+
+
+class AudioArchive:
+    """Per-session raw audio archive on local disk (AUDIO_ARCHIVE_DIR/<session id>/)"""
+
+    def __init__(self, root: str = None, segment_bytes: int = None, flush_bytes: int = None):
+        self.root = root or settings.AUDIO_ARCHIVE_DIR
+        self.segment_bytes = segment_bytes or settings.AUDIO_ARCHIVE_SEGMENT_MB * 2**20
+        self.flush_bytes = flush_bytes or settings.AUDIO_ARCHIVE_FLUSH_KB * 2**10
+
+    @property
+    def enabled(self) -> bool:
+        return settings.AUDIO_ARCHIVE_ENABLED
+
+    def path(self, session_id: Any) -> str:
+        return os.path.join(self.root, str(session_id))
+
+    def writer(self, session_id: Any, sample_rate: int, channels: int = 1) -> AudioArchiveWriter:
+        # Keep segments frame-aligned so a frame never spans two files
+        segment_bytes = self.segment_bytes - self.segment_bytes % (2 * channels)
+        return AudioArchiveWriter(self.path(session_id), sample_rate, channels, segment_bytes, self.flush_bytes)
+
+    def reader(self, session_id: Any) -> Optional[AudioArchiveReader]:
+        """Open a closed archive, returns None if the session has none"""
+        try:
+            return AudioArchiveReader(self.path(session_id))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def delete(self, session_id: Any):
+        shutil.rmtree(self.path(session_id), ignore_errors=True)
+
+
+audio_archive = AudioArchive()
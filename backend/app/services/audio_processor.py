@@ -1,6 +1,10 @@
 import base64
+import io
+import struct
+import wave
+from math import gcd
 import numpy as np
-from typing import Optional
+from typing import BinaryIO, List, Optional, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,6 +34,87 @@ class AudioProcessor:
             logger.error(f"Error decoding base64 audio: {e}")
             raise ValueError("Invalid base64 audio data")
     
+    @staticmethod
+    def wav_duration(wav_file: BinaryIO) -> float:
+        """
+        Duration of a WAV file in seconds, from its header alone
+        
+        Args:
+            wav_file: Seekable WAV file, rewound afterwards
+        
+        Raises:
+            ValueError: If the file is not a WAV file
+        """
+        try:
+            with wave.open(wav_file, "rb") as wav:
+                duration = wav.getnframes() / wav.getframerate()
+        except (wave.Error, EOFError, ZeroDivisionError) as e:
+            logger.error(f"Error reading WAV header: {e}")
+            raise ValueError("Invalid WAV file")
+        finally:
+            wav_file.seek(0)
+        return duration
+    
+    @staticmethod
+    def wav_to_pcm(wav_data: Union[bytes, BinaryIO], sample_rate: int = 16000) -> bytes:
+        """
+        Decode a WAV file to normalized PCM (16-bit mono at the given rate)
+        
+        Args:
+            wav_data: WAV file contents, or a file to read them from
+            sample_rate: Target sample rate
+        
+        Returns:
+            Raw PCM bytes, downmixed and resampled as needed
+        
+        Raises:
+            ValueError: If the file is not a 16-bit PCM WAV
+        """
+        try:
+            with wave.open(io.BytesIO(wav_data) if isinstance(wav_data, bytes) else wav_data, "rb") as wav:
+                channels = wav.getnchannels()
+                sample_width = wav.getsampwidth()
+                rate = wav.getframerate()
+                frames = wav.readframes(wav.getnframes())
+        except (wave.Error, EOFError) as e:
+            logger.error(f"Error reading WAV file: {e}")
+            raise ValueError("Invalid WAV file")
+        if sample_width != 2:
+            raise ValueError("Only 16-bit PCM WAV files are supported")
+        if channels == 1 and rate == sample_rate:
+            return frames
+
+        samples = AudioProcessor.pcm_to_numpy(frames).astype(np.float32)
+        if channels > 1:
+            samples = samples.reshape(-1, channels).mean(axis=1)
+        if rate != sample_rate:
+            from scipy.signal import resample_poly
+
+            divisor = gcd(rate, sample_rate)
+            samples = resample_poly(samples, sample_rate // divisor, rate // divisor)
+        return np.clip(np.rint(samples), -32768, 32767).astype(np.int16).tobytes()
+    
+    @staticmethod
+    def wav_header(data_bytes: int, sample_rate: int = 16000, channels: int = 1) -> bytes:
+        """
+        Build a 44-byte WAV header for 16-bit PCM, so audio can be streamed after it
+        
+        Args:
+            data_bytes: Length of the PCM data that follows
+            sample_rate: Sample rate in Hz
+            channels: Number of interleaved channels
+        
+        Returns:
+            RIFF/WAVE header bytes
+        """
+        block_align = channels * 2
+        return struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF", 36 + data_bytes, b"WAVE",
+            b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, 16,
+            b"data", data_bytes
+        )
+    
     @staticmethod
     def validate_audio_format(
         audio_data: bytes, 
@@ -72,6 +157,21 @@ class AudioProcessor:
         """
         return np.frombuffer(pcm_data, dtype=dtype)
     
+    @staticmethod
+    def deinterleave(pcm_data: bytes, channels: int) -> List[np.ndarray]:
+        """
+        Split interleaved multi-channel PCM into per-channel sample arrays
+        
+        Args:
+            pcm_data: Raw interleaved PCM bytes (whole frames only)
+            channels: Number of interleaved channels
+        
+        Returns:
+            One strided view per channel over the original buffer (no copy)
+        """
+        frames = AudioProcessor.pcm_to_numpy(pcm_data).reshape(-1, channels)
+        return [frames[:, channel] for channel in range(channels)]
+    
     @staticmethod
     def calculate_duration(audio_bytes: bytes, sample_rate: int = 16000, channels: int = 1) -> float:
         """
@@ -126,12 +226,14 @@ class AudioProcessor:
         if len(audio_np) == 0:
             return True
         
-        # Calculate RMS (root mean square)
-        rms = np.sqrt(np.mean(audio_np.astype(float) ** 2))
+        # Calculate RMS (root mean square) in float32 via a dot product,
+        # avoiding float64 copies and a temporary squared array per chunk
+        samples = audio_np.astype(np.float32)
+        rms = np.sqrt(np.dot(samples, samples) / len(samples))
         max_possible = 32767  # 16-bit max
         
         normalized_rms = rms / max_possible
-        return normalized_rms < threshold
+        return bool(normalized_rms < threshold)
 
 
 audio_processor = AudioProcessor()
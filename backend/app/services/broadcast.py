@@ -0,0 +1,151 @@
+import asyncio
+import importlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Set
+import logging
+
+from app.config import settings
+from app.utils.serialization import serializer
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """
+    One viewer of a session's live events
+    Holds serialized events in a bounded buffer; a viewer that falls behind is dropped
+    """
+
+    def __init__(self, session_id: str, buffer_size: int):
+        self.session_id = session_id
+        self.buffer_size = buffer_size
+        # Bounded by offer(), so the closing sentinel always fits
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.close_reason: Optional[str] = None
+        # The watcher's loop, the producer may run on another one
+        self._loop = asyncio.get_running_loop()
+
+    def _call(self, callback, *args):
+        try:
+            same_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            same_loop = False
+        if same_loop:
+            callback(*args)
+        else:
+            self._loop.call_soon_threadsafe(callback, *args)
+
+    def offer(self, payload: str) -> bool:
+        """Queue an event without blocking, returns False if the buffer is full"""
+        if self.queue.qsize() >= self.buffer_size:
+            return False
+        self._call(self.queue.put_nowait, payload)
+        return True
+
+    def close(self, reason: str):
+        """
+        End the subscription
+
+        Events already buffered are still delivered before the end, except
+        for a slow consumer, whose backlog is discarded.
+        """
+        if self.close_reason is not None:
+            return
+        self.close_reason = reason
+        self._call(self._end, reason == "slow_consumer")
+
+    def _end(self, discard: bool):
+        if discard:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    async def get(self) -> Optional[str]:
+        """Next serialized event, or None once the subscription is closed"""
+        return await self.queue.get()
+
+
+class BroadcastBackend(ABC):
+    """
+    Interface for fanning out a session's transcript events to viewers
+
+    `publish` is called on the producer's hot path and must never block;
+    backends that talk to an external pub/sub service should buffer and
+    send from a background task.
+    """
+
+    @abstractmethod
+    def publish(self, session_id: Any, event: Dict[str, Any]):
+        ...
+
+    @abstractmethod
+    def subscribe(self, session_id: Any) -> Subscription:
+        ...
+
+    @abstractmethod
+    def unsubscribe(self, subscription: Subscription):
+        ...
+
+    @abstractmethod
+    def close_session(self, session_id: Any):
+        """Notify viewers that the session ended, after the events already published"""
+        ...
+
+
+class InMemoryBroadcastHub(BroadcastBackend):
+    """In-process broker, viewers must be connected to the producing node"""
+
+    def __init__(self, buffer_size: int = None):
+        self.buffer_size = buffer_size or settings.BROADCAST_SUBSCRIBER_BUFFER
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self.dropped_subscribers = 0
+
+    def publish(self, session_id: Any, event: Dict[str, Any]):
+        subscribers = self._subscribers.get(str(session_id))
+        if not subscribers:
+            return
+        # Serialize once for all viewers
+        payload = serializer.dumps(event)
+        for subscription in list(subscribers):
+            if subscription.close_reason is not None:
+                continue
+            if not subscription.offer(payload):
+                logger.warning(f"Dropping slow viewer of session {session_id}")
+                self.dropped_subscribers += 1
+                subscription.close("slow_consumer")
+                self.unsubscribe(subscription)
+
+    def subscribe(self, session_id: Any) -> Subscription:
+        subscription = Subscription(str(session_id), self.buffer_size)
+        self._subscribers.setdefault(subscription.session_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscribers = self._subscribers.get(subscription.session_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.session_id]
+
+    def close_session(self, session_id: Any):
+        for subscription in list(self._subscribers.pop(str(session_id), ())):
+            subscription.close("session_ended")
+
+    def subscriber_count(self, session_id: Any) -> int:
+        return len(self._subscribers.get(str(session_id), ()))
+
+
+def get_broadcast_backend(path: str = None) -> BroadcastBackend:
+    """
+    Instantiate the configured broadcast backend
+
+    Args:
+        path: Dotted path of a BroadcastBackend class (default: settings.BROADCAST_BACKEND)
+    """
+    path = path or settings.BROADCAST_BACKEND
+    module_name, _, class_name = path.rpartition(".")
+    backend_class = getattr(importlib.import_module(module_name), class_name)
+    return backend_class()
+
+
+broadcast = get_broadcast_backend()
@@ -0,0 +1,278 @@
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Hashable, Optional
+import logging
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TENANT = "default"
+PRIORITIES = ("live", "batch")
+
+
+def worker_count(workers: Optional[int] = None) -> int:
+    """Decode threads on this node (DECODE_WORKERS, 0 = one per CPU)"""
+    workers = settings.DECODE_WORKERS if workers is None else workers
+    return workers or os.cpu_count() or 1
+
+
+class _Job:
+    __slots__ = ("fn", "args", "loop", "future", "tenant", "cost", "enqueued_at", "flows")
+
+    def __init__(self, fn: Callable, args: tuple, loop, future, tenant: str, cost: float):
+        self.fn = fn
+        self.args = args
+        self.loop = loop
+        self.future = future
+        self.tenant = tenant
+        self.cost = cost
+        self.enqueued_at = time.monotonic()
+        # (tenant flow, session flow) while the job runs
+        self.flows = ()
+
+
+class _Flow:
+    """A backlog with start-time fair queuing tags (in weighted audio seconds)"""
+    __slots__ = ("weight", "start", "finish", "backlog", "running")
+
+    def __init__(self, weight: float, backlog):
+        self.weight = weight
+        self.start = 0.0
+        self.finish = 0.0
+        self.backlog = backlog
+        # Jobs of this flow on a decode thread
+        self.running = 0
+
+
+class _FairQueue:
+    """
+    Start-time fair queuing over flows
+
+    A flow that becomes backlogged starts at max(virtual time, its last
+    finish tag), so an idle flow cannot bank credit and a flow that was just
+    served cannot jump ahead. The backlogged flow with the smallest start tag
+    goes next; serving cost c advances its tags by c / weight and moves the
+    virtual time to the served start tag.
+
+    A session flow runs one job at a time, since its jobs share a recognizer,
+    which is not thread-safe. Its next job waits until the running one is done.
+    """
+
+    def __init__(self):
+        self.vtime = 0.0
+        self.flows: Dict[Hashable, _Flow] = {}
+        self.queued = 0
+
+    def flow(self, key: Hashable, weight: float, make_backlog: Callable[[], Any]) -> _Flow:
+        flow = self.flows.get(key)
+        if flow is None:
+            flow = self.flows[key] = _Flow(weight, make_backlog())
+        if not _pending(flow.backlog):
+            flow.start = max(self.vtime, flow.finish)
+        return flow
+
+    def select(self) -> Optional[_Flow]:
+        """The runnable flow with the smallest start tag, or None"""
+        best = None
+        for key, flow in list(self.flows.items()):
+            if _runnable(flow):
+                if best is None or flow.start < best.start:
+                    best = flow
+            elif not _pending(flow.backlog) and not flow.running and flow.finish <= self.vtime:
+                # Idle and owed nothing, forget it
+                del self.flows[key]
+        return best
+
+    def charge(self, flow: _Flow, cost: float):
+        self.vtime = flow.start
+        flow.finish = flow.start + cost / flow.weight
+        flow.start = flow.finish
+
+
+def _pending(backlog) -> int:
+    return backlog.queued if isinstance(backlog, _FairQueue) else len(backlog)
+
+
+def _runnable(flow: _Flow) -> bool:
+    """Whether a job of the flow can start now"""
+    if isinstance(flow.backlog, _FairQueue):
+        return any(_runnable(session_flow) for session_flow in flow.backlog.flows.values())
+    return bool(flow.backlog) and not flow.running
+
+
+class DecodeScheduler:
+    """
+    Runs recognizer calls on a fixed pool of decode threads
+
+    Jobs are queued in two classes: live streams are always served before
+    batch work (uploads, replays). Within a class, decode time is shared
+    fairly between tenants, weighted by DECODE_TENANT_WEIGHTS, and within a
+    tenant between its sessions, by start-time fair queuing on the audio
+    seconds each job decodes. A session sending faster than real time, or a
+    tenant with many sessions, only takes its share while others are waiting.
+
+    Jobs are not preempted, so batch work should be submitted in pieces.
+    Jobs of one session never run concurrently.
+    Per-tenant usage counters back GET /api/v1/admin/decode.
+    """
+
+    def __init__(self, workers: Optional[int] = None, tenant_weights: Optional[Dict[str, float]] = None):
+        self.workers = worker_count(workers)
+        self.tenant_weights = settings.DECODE_TENANT_WEIGHTS if tenant_weights is None else tenant_weights
+        self._queues = {priority: _FairQueue() for priority in PRIORITIES}
+        self._cond = threading.Condition()
+        self._threads = []
+        self._closed = False
+        self.usage: Dict[str, Dict[str, float]] = {}
+
+    def _ensure_workers(self):
+        if self._threads:
+            return
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"decode-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    async def run(
+        self,
+        fn: Callable,
+        *args: Any,
+        tenant: Optional[str] = None,
+        session: Hashable = None,
+        cost: float = 0.0,
+        priority: str = "live"
+    ) -> Any:
+        """
+        Run fn(*args) on a decode thread and wait for its result
+
+        Args:
+            tenant: Tenant the work is billed to
+            session: Flow within the tenant, run one job at a time, e.g. a
+                recognizer (default: one flow per call)
+            cost: Audio seconds decoded, used for fair sharing
+            priority: "live" or "batch"
+
+        Returns:
+            fn's return value, exceptions raised by fn propagate
+        """
+        if priority not in self._queues:
+            raise ValueError(f"Unknown decode priority: {priority}")
+        tenant = tenant or DEFAULT_TENANT
+        loop = asyncio.get_running_loop()
+        job = _Job(fn, args, loop, loop.create_future(), tenant, cost)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Decode scheduler is shut down")
+            self._ensure_workers()
+            tenants = self._queues[priority]
+            tenant_flow = tenants.flow(tenant, self.tenant_weights.get(tenant, 1.0), _FairQueue)
+            sessions = tenant_flow.backlog
+            session_flow = sessions.flow(object() if session is None else session, 1.0, deque)
+            session_flow.backlog.append(job)
+            sessions.queued += 1
+            tenants.queued += 1
+            self._counters(tenant)["queued"] += 1
+            self._cond.notify()
+        return await job.future
+
+    def _next(self) -> Optional[_Job]:
+        """Dequeue the next job by priority, then tenant, then session (lock held)"""
+        for tenants in self._queues.values():
+            if not tenants.queued:
+                continue
+            tenant_flow = tenants.select()
+            if tenant_flow is None:
+                # Every queued job waits for its session's running job
+                continue
+            sessions = tenant_flow.backlog
+            session_flow = sessions.select()
+            job = session_flow.backlog.popleft()
+            sessions.queued -= 1
+            tenants.queued -= 1
+            sessions.charge(session_flow, job.cost)
+            tenants.charge(tenant_flow, job.cost)
+            job.flows = (tenant_flow, session_flow)
+            for flow in job.flows:
+                flow.running += 1
+            return job
+        return None
+
+    def _work(self):
+        while True:
+            with self._cond:
+                job = self._next()
+                while job is None:
+                    if self._closed:
+                        return
+                    self._cond.wait()
+                    job = self._next()
+                counters = self._counters(job.tenant)
+                counters["queued"] -= 1
+                counters["wait_seconds"] += time.monotonic() - job.enqueued_at
+
+            cpu_start = time.thread_time()
+            try:
+                result, error = job.fn(*job.args), None
+            except Exception as e:
+                result, error = None, e
+            cpu_seconds = time.thread_time() - cpu_start
+
+            with self._cond:
+                counters["jobs"] += 1
+                counters["audio_seconds"] += job.cost
+                counters["cpu_seconds"] += cpu_seconds
+                for flow in job.flows:
+                    flow.running -= 1
+                # The session's next job may be waiting for this one
+                self._cond.notify()
+            try:
+                job.loop.call_soon_threadsafe(_resolve, job.future, result, error)
+            except RuntimeError:
+                # The caller's event loop is gone
+                pass
+
+    def _counters(self, tenant: str) -> Dict[str, float]:
+        counters = self.usage.get(tenant)
+        if counters is None:
+            counters = self.usage[tenant] = dict.fromkeys(
+                ("jobs", "queued", "audio_seconds", "cpu_seconds", "wait_seconds"), 0
+            )
+        return counters
+
+    def shutdown(self):
+        """Stop the decode threads once queued jobs are done"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "workers": self.workers,
+                "queued": {priority: queue.queued for priority, queue in self._queues.items()},
+                "tenants": {
+                    tenant: {
+                        **{name: round(value, 4) for name, value in counters.items()},
+                        "weight": self.tenant_weights.get(tenant, 1.0),
+                    }
+                    for tenant, counters in self.usage.items()
+                },
+            }
+
+
+def _resolve(future: asyncio.Future, result: Any, error: Optional[Exception]):
+    if future.cancelled():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+decode_scheduler = DecodeScheduler()
@@ -0,0 +1,108 @@
+import asyncio
+import signal
+import time
+from typing import Any, Dict, Optional
+import logging
+
+from app.config import settings
+from app.services.session_registry import session_registry
+
+logger = logging.getLogger(__name__)
+
+
+class DrainController:
+    """
+    Drains the node for zero-loss deploys
+
+    While draining, new sessions are refused and active ones are given until
+    the deadline to finish. Sessions still running at the deadline are stopped,
+    which flushes the recognizer's final result and persists the transcript.
+    """
+
+    def __init__(self):
+        self.draining = False
+        self.started_at: Optional[float] = None
+        self.deadline: Optional[float] = None
+        self.forced_sessions = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, timeout: float = None) -> asyncio.Task:
+        """Begin draining in the background (idempotent)"""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self.drain(timeout))
+        return self._task
+
+    async def drain(self, timeout: float = None):
+        """Stop admitting sessions, wait for active ones, then force-stop the rest"""
+        timeout = settings.DRAIN_TIMEOUT_SECONDS if timeout is None else timeout
+        self.draining = True
+        self.started_at = time.time()
+        self.deadline = self.started_at + timeout
+        logger.info(f"Draining: {len(session_registry.active())} active, "
+                    f"{len(session_registry)} detached sessions, deadline {timeout}s")
+
+        while (session_registry.active() or len(session_registry)) and time.time() < self.deadline:
+            await asyncio.sleep(settings.DRAIN_POLL_INTERVAL)
+
+        await self.force_stop_all()
+        logger.info("Drain complete")
+
+    async def force_stop_all(self):
+        """Stop every remaining session, persisting what was transcribed"""
+        remaining = session_registry.active()
+        if remaining:
+            logger.warning(f"Drain deadline reached, stopping {len(remaining)} sessions")
+            self.forced_sessions += len(remaining)
+        for session in remaining:
+            try:
+                await session.terminate()
+            except Exception as e:
+                logger.error(f"Error stopping session {session.session_id} during drain: {e}")
+        await session_registry.finalize_all()
+
+    def install_signal_handler(self, sig: int = signal.SIGTERM):
+        """
+        Drain on SIGTERM before handing the signal to the previous handler
+
+        The server's own handler (uvicorn's shutdown) runs once the drain has
+        finished, so connections stay open while sessions complete.
+        """
+        loop = asyncio.get_running_loop()
+        previous = signal.getsignal(sig)
+
+        def chain(signum, frame):
+            if callable(previous):
+                previous(signum, frame)
+            else:
+                signal.signal(signum, previous)
+                signal.raise_signal(signum)
+
+        def handler(signum, frame):
+            logger.info(f"Received signal {signum}, draining before shutdown")
+            # Restore the previous handler so a second signal skips the drain
+            signal.signal(sig, previous)
+
+            def begin():
+                self.start().add_done_callback(lambda _: chain(signum, frame))
+
+            loop.call_soon_threadsafe(begin)
+
+        try:
+            signal.signal(sig, handler)
+        except ValueError:
+            # Only the main thread may install handlers (not the case under test clients)
+            logger.warning("Not running in the main thread, drain on SIGTERM is disabled")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "draining": self.draining,
+            "started_at": self.started_at,
+            "deadline": self.deadline,
+            "active_sessions": len(session_registry.active()),
+            "detached_sessions": len(session_registry),
+            "forced_sessions": self.forced_sessions,
+            "complete": self._task is not None and self._task.done(),
+        }
+
+
+drain_controller = DrainController()
@@ -0,0 +1,95 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+Grammar = Tuple[str, ...]
+
+
+class GrammarCache:
+    """
+    LRU cache of phrase-list grammars with pools of idle recognizers
+
+    Building a grammar recognizer compiles the grammar into a decoding graph,
+    so recognizers are reset and reused by later sessions with the same
+    grammar instead of being rebuilt. Grammars are normalized (lowercased,
+    deduplicated, sorted) so equivalent phrase lists share a pool.
+    """
+
+    def __init__(
+        self,
+        create_recognizer: Callable[[List[str]], Any],
+        max_grammars: int = None,
+        pool_size: int = None,
+        named: Dict[str, List[str]] = None
+    ):
+        self.create_recognizer = create_recognizer
+        self.max_grammars = settings.GRAMMAR_CACHE_SIZE if max_grammars is None else max_grammars
+        self.pool_size = settings.GRAMMAR_POOL_SIZE if pool_size is None else pool_size
+        self.named = settings.GRAMMARS if named is None else named
+        self._pools: "OrderedDict[Grammar, List[Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def normalize(phrases: List[str]) -> Grammar:
+        return tuple(sorted({phrase.strip().lower() for phrase in phrases if phrase.strip()}))
+
+    def resolve(self, grammar: Optional[List[str]] = None, grammar_name: Optional[str] = None) -> Optional[Grammar]:
+        """
+        Resolve an inline phrase list or a named grammar from settings
+
+        Returns:
+            The normalized grammar, or None for unconstrained recognition
+
+        Raises:
+            ValueError: If the name is unknown or the phrase list is empty
+        """
+        if grammar_name is not None:
+            if grammar_name not in self.named:
+                raise ValueError(f"Unknown grammar: {grammar_name}")
+            grammar = self.named[grammar_name]
+        if grammar is None:
+            return None
+        normalized = self.normalize(grammar)
+        if not normalized:
+            raise ValueError("Grammar must contain at least one phrase")
+        return normalized
+
+    def acquire(self, grammar: Grammar) -> Any:
+        """Take an idle recognizer for the grammar, building one if none is free"""
+        pool = self._pools.get(grammar)
+        if pool is not None:
+            self._pools.move_to_end(grammar)
+            if pool:
+                self.hits += 1
+                return pool.pop()
+        else:
+            self._pools[grammar] = []
+            while len(self._pools) > self.max_grammars:
+                evicted, _ = self._pools.popitem(last=False)
+                self.evictions += 1
+                logger.info(f"Evicted grammar with {len(evicted)} phrases from cache")
+        self.misses += 1
+        return self.create_recognizer(list(grammar))
+
+    def release(self, grammar: Grammar, recognizer: Any):
+        """Reset a recognizer and return it to its grammar's pool"""
+        pool = self._pools.get(grammar)
+        if pool is None or len(pool) >= self.pool_size:
+            return
+        recognizer.Reset()
+        pool.append(recognizer)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "grammars": len(self._pools),
+            "idle_recognizers": sum(len(pool) for pool in self._pools.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,69 @@
+import time
+from typing import Optional
+
+from app.config import settings
+
+
+class Heartbeat:
+    """
+    Tracks client liveness and audio activity for one WebSocket connection
+
+    The server pings every WS_HEARTBEAT_INTERVAL seconds; any inbound message
+    (pong, audio or control) counts as a sign of life. A connection silent for
+    WS_HEARTBEAT_TIMEOUT seconds is considered dead, and an active session that
+    receives no audio for WS_AUDIO_IDLE_TIMEOUT seconds is finalized.
+    """
+
+    def __init__(self, interval: float = None, timeout: float = None, audio_idle_timeout: float = None):
+        self.interval = settings.WS_HEARTBEAT_INTERVAL if interval is None else interval
+        self.timeout = settings.WS_HEARTBEAT_TIMEOUT if timeout is None else timeout
+        self.audio_idle_timeout = (
+            settings.WS_AUDIO_IDLE_TIMEOUT if audio_idle_timeout is None else audio_idle_timeout
+        )
+        now = time.monotonic()
+        self.last_seen = now
+        self.last_audio = now
+        self.next_ping = now + self.interval if self.interval else None
+
+    def seen(self, is_audio: bool = False):
+        """Record an inbound message"""
+        now = time.monotonic()
+        self.last_seen = now
+        if is_audio:
+            self.last_audio = now
+
+    def pinged(self):
+        self.next_ping = time.monotonic() + self.interval
+
+    def ping_due(self) -> bool:
+        return self.next_ping is not None and time.monotonic() >= self.next_ping
+
+    def _deadlines(self, session_active: bool):
+        if self.next_ping is not None:
+            yield self.next_ping
+        if self.timeout:
+            yield self.last_seen + self.timeout
+        if session_active and self.audio_idle_timeout:
+            yield self.last_audio + self.audio_idle_timeout
+
+    def wait_time(self, session_active: bool) -> Optional[float]:
+        """Seconds to wait for the next message before something is due, None = forever"""
+        deadlines = list(self._deadlines(session_active))
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - time.monotonic())
+
+    def expired(self, session_active: bool) -> Optional[str]:
+        """
+        Check whether the connection or session should be reaped
+
+        Returns:
+            'heartbeat' if the client stopped responding, 'audio_idle' if an
+            active session stopped sending audio, otherwise None
+        """
+        now = time.monotonic()
+        if self.timeout and now - self.last_seen >= self.timeout:
+            return "heartbeat"
+        if session_active and self.audio_idle_timeout and now - self.last_audio >= self.audio_idle_timeout:
+            return "audio_idle"
+        return None
@@ -0,0 +1,136 @@
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+Phrases = Tuple[str, ...]
+
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton over word tokens
+
+    Finds every occurrence of every phrase in one pass over a transcript,
+    regardless of how many phrases there are. Phrases match whole words
+    only, so "cancel" does not match "cancellation".
+    """
+
+    def __init__(self, phrases: Phrases):
+        self.phrases = phrases
+        self._lengths = [len(phrase.split()) for phrase in phrases]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for index, phrase in enumerate(phrases):
+            node = 0
+            for token in phrase.split():
+                child = self._goto[node].get(token)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto[node][token] = child
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = child
+            self._out[node].append(index)
+
+        # Failure links in breadth-first order, inheriting the outputs of the
+        # longest proper suffix that is also a prefix
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for token, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(token, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find(self, tokens: List[str]) -> List[Tuple[str, int, int]]:
+        """
+        Find phrase occurrences in a token sequence
+
+        Returns:
+            (phrase, first token index, last token index) per match
+        """
+        matches = []
+        node = 0
+        for position, token in enumerate(tokens):
+            token = token.lower()
+            while node and token not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(token, 0)
+            for index in self._out[node]:
+                matches.append((self.phrases[index], position - self._lengths[index] + 1, position))
+        return matches
+
+
+class KeywordSpotter:
+    """
+    Resolves keyword lists and caches their compiled matchers
+
+    Phrase lists are normalized (lowercased, whitespace collapsed,
+    deduplicated, sorted) so sessions sharing a list, e.g. a tenant's named
+    list from KEYWORD_LISTS, share one automaton. Matchers are kept in an
+    LRU of KEYWORD_CACHE_SIZE entries.
+    """
+
+    def __init__(self, max_matchers: int = None, named: Dict[str, List[str]] = None):
+        self.max_matchers = settings.KEYWORD_CACHE_SIZE if max_matchers is None else max_matchers
+        self.named = settings.KEYWORD_LISTS if named is None else named
+        self._matchers: "OrderedDict[Phrases, PhraseMatcher]" = OrderedDict()
+        self.hits = 0
+        self.compiles = 0
+
+    @staticmethod
+    def normalize(phrases: List[str]) -> Phrases:
+        return tuple(sorted({" ".join(phrase.lower().split()) for phrase in phrases if phrase.strip()}))
+
+    def resolve(self, keywords: Optional[List[str]] = None, keyword_list: Optional[str] = None) -> Optional[PhraseMatcher]:
+        """
+        Get the matcher for inline keywords or a named list from settings
+
+        Returns:
+            The compiled matcher, or None if the session spots no keywords
+
+        Raises:
+            ValueError: If the list name is unknown or no phrases are given
+        """
+        if keyword_list is not None:
+            if keyword_list not in self.named:
+                raise ValueError(f"Unknown keyword list: {keyword_list}")
+            keywords = self.named[keyword_list]
+        if keywords is None:
+            return None
+        phrases = self.normalize(keywords)
+        if not phrases:
+            raise ValueError("Keyword list must contain at least one phrase")
+        return self.matcher(phrases)
+
+    def matcher(self, phrases: Phrases) -> PhraseMatcher:
+        matcher = self._matchers.get(phrases)
+        if matcher is not None:
+            self._matchers.move_to_end(phrases)
+            self.hits += 1
+            return matcher
+        matcher = PhraseMatcher(phrases)
+        self.compiles += 1
+        self._matchers[phrases] = matcher
+        while len(self._matchers) > self.max_matchers:
+            self._matchers.popitem(last=False)
+        return matcher
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "matchers": len(self._matchers),
+            "hits": self.hits,
+            "compiles": self.compiles,
+        }
+
+
+keyword_spotter = KeywordSpotter()
@@ -0,0 +1,139 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Set, Tuple
+import logging
+
+from app.config import settings
+from app.services.decode_scheduler import worker_count
+
+logger = logging.getLogger(__name__)
+
+
+class LoadMonitor:
+    """
+    Tracks decode real-time factor (RTF) and active sessions on this node
+    Used to refuse new sessions before the node falls behind real time
+    """
+
+    def __init__(self, window_seconds: int = None):
+        self.window_seconds = window_seconds or settings.LOAD_WINDOW_SECONDS
+        # (timestamp, decode CPU seconds, audio seconds)
+        self._samples: Deque[Tuple[float, float, float]] = deque()
+        self._active: Set[Any] = set()
+        self._lock = threading.Lock()
+        self.rejected_sessions = 0
+        # Sessions reclaimed by the heartbeat/idle watchdog, by reason
+        self.reaped_sessions: Dict[str, int] = {}
+
+    def _prune(self, now: float):
+        cutoff = now - self.window_seconds
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+
+    def record_decode(self, cpu_seconds: float, audio_seconds: float):
+        """
+        Record the cost of decoding one audio chunk
+
+        Args:
+            cpu_seconds: CPU time spent in the recognizer
+            audio_seconds: Duration of the decoded audio
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._samples.append((now, cpu_seconds, audio_seconds))
+            self._prune(now)
+
+    def session_started(self, session_id: Any):
+        """Register an admitted session"""
+        with self._lock:
+            self._active.add(session_id)
+
+    def session_ended(self, session_id: Any):
+        """Unregister a session (safe to call more than once)"""
+        with self._lock:
+            self._active.discard(session_id)
+
+    def record_reaped(self, reason: str):
+        """Count a session reclaimed because its client died or went idle"""
+        with self._lock:
+            self.reaped_sessions[reason] = self.reaped_sessions.get(reason, 0) + 1
+
+    @property
+    def active_sessions(self) -> int:
+        return len(self._active)
+
+    def _totals(self) -> Tuple[float, float]:
+        with self._lock:
+            self._prune(time.monotonic())
+            cpu = sum(sample[1] for sample in self._samples)
+            audio = sum(sample[2] for sample in self._samples)
+        return cpu, audio
+
+    def current_rtf(self) -> float:
+        """Aggregate decode CPU seconds per audio second over the window"""
+        cpu, audio = self._totals()
+        return cpu / audio if audio > 0 else 0.0
+
+    def decode_load(self) -> float:
+        """Decode CPU seconds spent per wall-clock second over the window"""
+        cpu, _ = self._totals()
+        return cpu / self.window_seconds
+
+    def projected_load(self) -> float:
+        """Decode load expected if one more average session is admitted"""
+        load = self.decode_load()
+        active = self.active_sessions
+        if active == 0:
+            return load
+        return load + load / active
+
+    @property
+    def max_decode_load(self) -> float:
+        """Admissible decode load, ADMISSION_MAX_DECODE_LOAD for each decode thread"""
+        return settings.ADMISSION_MAX_DECODE_LOAD * worker_count()
+
+    def refusal_reason(self) -> Optional[str]:
+        """Reason a new session would be refused right now, or None"""
+        if not settings.ADMISSION_CONTROL_ENABLED:
+            return None
+        if settings.ADMISSION_MAX_SESSIONS and self.active_sessions >= settings.ADMISSION_MAX_SESSIONS:
+            return f"Session limit reached ({settings.ADMISSION_MAX_SESSIONS})"
+        if self.current_rtf() > settings.ADMISSION_MAX_RTF:
+            return "Decoding is slower than real time"
+        if self.projected_load() > self.max_decode_load:
+            return "Decode capacity exceeded"
+        return None
+
+    def check_admission(self) -> Optional[str]:
+        """
+        Decide whether a new session can be admitted
+
+        Returns:
+            None if the session can be admitted, otherwise the refusal reason
+        """
+        reason = self.refusal_reason()
+        if reason:
+            with self._lock:
+                self.rejected_sessions += 1
+            logger.warning(f"Refusing new session: {reason}")
+        return reason
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current load figures for the load endpoint"""
+        return {
+            "accepting": self.refusal_reason() is None,
+            "active_sessions": self.active_sessions,
+            "rtf": round(self.current_rtf(), 4),
+            "decode_load": round(self.decode_load(), 4),
+            "projected_load": round(self.projected_load(), 4),
+            "max_decode_load": self.max_decode_load,
+            "max_rtf": settings.ADMISSION_MAX_RTF,
+            "max_sessions": settings.ADMISSION_MAX_SESSIONS,
+            "rejected_sessions": self.rejected_sessions,
+            "reaped_sessions": dict(self.reaped_sessions),
+            "window_seconds": self.window_seconds,
+        }
+
+
+load_monitor = LoadMonitor()
@@ -0,0 +1,97 @@
+from typing import Any, Dict, Optional, Tuple
+import logging
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Kaldi's online endpointing defaults, which Vosk starts with
+DEFAULT_ENDPOINTER_DELAYS = (5.0, 0.5, 20.0)
+
+
+class RecognizerProfile:
+    """
+    Latency/accuracy trade-off for a session's recognizers
+
+    Args:
+        name: Profile name selected in the start message
+        partial_words: Include word timings in partial results
+        max_alternatives: N-best alternatives in final results (0 = best only)
+        chunk_ms: Audio buffered per decode call (0 = decode each chunk as received)
+        force_final_ms: Force a final after this much audio without one (0 = never)
+        endpointer_delays: (start_max, end, max) seconds for Vosk's endpointer,
+            applied when the installed Vosk supports SetEndpointerDelays
+            (default: Vosk's own delays)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        partial_words: bool = False,
+        max_alternatives: int = 0,
+        chunk_ms: int = 0,
+        force_final_ms: int = 0,
+        endpointer_delays: Tuple[float, float, float] = DEFAULT_ENDPOINTER_DELAYS
+    ):
+        self.name = name
+        self.partial_words = partial_words
+        self.max_alternatives = max_alternatives
+        self.chunk_ms = chunk_ms
+        self.force_final_ms = force_final_ms
+        self.endpointer_delays = endpointer_delays
+
+    def options(self) -> Dict[str, Any]:
+        """Settings that change the decoded result, for transcript cache keys"""
+        return {
+            "name": self.name,
+            "partial_words": self.partial_words,
+            "max_alternatives": self.max_alternatives,
+            "chunk_ms": self.chunk_ms,
+            "force_final_ms": self.force_final_ms,
+            "endpointer_delays": list(self.endpointer_delays),
+        }
+
+    def chunk_bytes(self, channels: int = 1) -> int:
+        return settings.VOSK_SAMPLE_RATE * 2 * channels * self.chunk_ms // 1000
+
+    def apply(self, recognizer: Any):
+        """Configure a recognizer for this profile (also undoes another profile's settings)"""
+        recognizer.SetPartialWords(self.partial_words)
+        recognizer.SetMaxAlternatives(self.max_alternatives)
+        if hasattr(recognizer, "SetEndpointerDelays"):
+            recognizer.SetEndpointerDelays(*self.endpointer_delays)
+        else:
+            logger.debug(f"Vosk has no SetEndpointerDelays, profile {self.name} uses default endpointing")
+
+
+RECOGNIZER_PROFILES: Dict[str, RecognizerProfile] = {
+    # Live captioning: word timings in partials and finals within a second
+    "low_latency": RecognizerProfile(
+        "low_latency",
+        partial_words=True,
+        force_final_ms=1000,
+        endpointer_delays=(3.0, 0.3, 5.0)
+    ),
+    # Vosk defaults
+    "balanced": RecognizerProfile("balanced"),
+    # Dictation: longer utterances, N-best finals and fewer, larger decode calls
+    "accurate": RecognizerProfile(
+        "accurate",
+        max_alternatives=3,
+        chunk_ms=500,
+        endpointer_delays=(10.0, 1.0, 30.0)
+    ),
+}
+
+
+def get_profile(name: Optional[str] = None) -> RecognizerProfile:
+    """
+    Look up a recognizer profile (default: settings.RECOGNIZER_PROFILE)
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    name = name or settings.RECOGNIZER_PROFILE
+    if name not in RECOGNIZER_PROFILES:
+        raise ValueError(f"Unknown recognizer profile: {name}")
+    return RECOGNIZER_PROFILES[name]
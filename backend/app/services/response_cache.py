@@ -0,0 +1,103 @@
+import hashlib
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+import logging
+
+from fastapi import Request, Response
+from starlette import status
+
+from app.config import settings
+from app.schemas.session import SessionResponse
+
+logger = logging.getLogger(__name__)
+
+
+class CachedResponse:
+    """A serialized session with its validators"""
+
+    def __init__(self, session_id: Any, updated_at: Optional[datetime], body: bytes):
+        self.body = body
+        # Every write through session_crud bumps updated_at (stored naive, in UTC)
+        version = f"{session_id}:{updated_at.isoformat() if updated_at else ''}"
+        self.etag = f'"{hashlib.sha1(version.encode()).hexdigest()}"'
+        self.last_modified = (updated_at or datetime.utcnow()).replace(tzinfo=timezone.utc, microsecond=0)
+
+    def not_modified(self, request: Request) -> bool:
+        """Evaluate If-None-Match, or If-Modified-Since when no ETag was sent"""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or self.etag in tags
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is not None:
+            try:
+                return self.last_modified <= parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def respond(self, request: Request) -> Response:
+        headers = {
+            "ETag": self.etag,
+            "Last-Modified": format_datetime(self.last_modified, usegmt=True),
+        }
+        if self.not_modified(request):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+class SessionResponseCache:
+    """
+    LRU of serialized GET /sessions/{id} responses
+
+    Only completed sessions are cached: they do not change unless updated or
+    deleted through session_crud, which invalidates them here. The cache is
+    per process, so a session deleted through another worker may be served
+    from this one until evicted.
+    """
+
+    def __init__(self, max_entries: int = None):
+        self.max_entries = settings.SESSION_RESPONSE_CACHE_SIZE if max_entries is None else max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, session_id: Any) -> Optional[CachedResponse]:
+        key = str(session_id)
+        cached = self._entries.get(key)
+        if cached is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return cached
+
+    def build(self, session: Any) -> CachedResponse:
+        """Serialize a session with its transcripts, caching it if completed"""
+        body = SessionResponse.model_validate(session).model_dump_json(by_alias=True).encode()
+        cached = CachedResponse(session.id, session.updated_at, body)
+        if session.status == "completed" and self.max_entries > 0:
+            key = str(session.id)
+            self._entries[key] = cached
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return cached
+
+    def invalidate(self, session_id: Any):
+        self._entries.pop(str(session_id), None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+session_response_cache = SessionResponseCache()
@@ -0,0 +1,170 @@
+import asyncio
+import os
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+import logging
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process (Linux only)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class DetachedSession:
+    """A session whose socket dropped, waiting for its client to resume it"""
+
+    def __init__(self, session: Any, timer: asyncio.TimerHandle):
+        self.session = session
+        self.timer = timer
+        self.detached_at = time.time()
+
+
+class SessionRegistry:
+    """
+    Keeps the recognizer and state of dropped sessions alive for a grace period
+    so a reconnecting client can resume decoding where it left off
+
+    Also tracks attached (active) sessions so they can be drained on shutdown.
+
+    Sessions are duck-typed: they need `session_id`, `resume_token` and an
+    `expire()` coroutine that finalizes and persists them.
+    """
+
+    def __init__(self, grace_seconds: int = None, max_detached: int = None, max_rss_mb: int = None):
+        self.grace_seconds = settings.WS_RESUME_GRACE_SECONDS if grace_seconds is None else grace_seconds
+        self.max_detached = settings.WS_RESUME_MAX_DETACHED if max_detached is None else max_detached
+        self.max_rss_mb = settings.WS_RESUME_MAX_RSS_MB if max_rss_mb is None else max_rss_mb
+        self._detached: "OrderedDict[str, DetachedSession]" = OrderedDict()
+        self._active: Dict[str, Any] = {}
+        self.evicted_sessions = 0
+        self.expired_sessions = 0
+        self.resumed_sessions = 0
+
+    @staticmethod
+    def new_token() -> str:
+        return secrets.token_urlsafe(16)
+
+    @property
+    def enabled(self) -> bool:
+        return self.grace_seconds > 0 and self.max_detached > 0
+
+    def __len__(self) -> int:
+        return len(self._detached)
+
+    def add_active(self, session: Any):
+        """Track a session attached to a live socket"""
+        self._active[str(session.session_id)] = session
+
+    def remove_active(self, session: Any):
+        self._active.pop(str(session.session_id), None)
+
+    def active(self) -> List[Any]:
+        return list(self._active.values())
+
+    def get(self, session_id: Any) -> Optional[Any]:
+        """A running session, attached or detached, or None"""
+        key = str(session_id)
+        entry = self._detached.get(key)
+        return self._active.get(key) or (entry.session if entry else None)
+
+    def _memory_pressure(self) -> bool:
+        if not self.max_rss_mb:
+            return False
+        rss = current_rss_bytes()
+        return rss is not None and rss > self.max_rss_mb * 2**20
+
+    def detach(self, session: Any) -> bool:
+        """
+        Keep a session alive after its socket dropped
+
+        Evicts the least recently detached sessions when over the count
+        limit or the memory limit.
+
+        Returns:
+            False if resuming is disabled and the caller should stop the session
+        """
+        if not self.enabled:
+            return False
+
+        key = str(session.session_id)
+        loop = asyncio.get_running_loop()
+        timer = loop.call_later(self.grace_seconds, lambda: asyncio.ensure_future(self._expire(key)))
+        self._detached[key] = DetachedSession(session, timer)
+        self._detached.move_to_end(key)
+
+        while len(self._detached) > self.max_detached:
+            self._evict_oldest()
+        # Memory is only released once the evicted session is finalized,
+        # so evict one session per detach rather than draining the registry
+        if len(self._detached) > 1 and self._memory_pressure():
+            self._evict_oldest()
+        logger.info(f"Session {key} detached, resumable for {self.grace_seconds}s")
+        return True
+
+    def _evict_oldest(self):
+        key, entry = self._detached.popitem(last=False)
+        self.evicted_sessions += 1
+        logger.warning(f"Evicting detached session {key}")
+        asyncio.ensure_future(self._finalize_entry(key, entry))
+
+    def resume(self, session_id: Any, resume_token: str) -> Optional[Any]:
+        """
+        Take a detached session back for a reconnecting client
+
+        Returns:
+            The session, or None if it is unknown, expired or the token is wrong
+        """
+        key = str(session_id)
+        entry = self._detached.get(key)
+        if entry is None or not secrets.compare_digest(entry.session.resume_token.encode(), resume_token.encode()):
+            return None
+        del self._detached[key]
+        entry.timer.cancel()
+        self.resumed_sessions += 1
+        logger.info(f"Session {key} resumed after {time.time() - entry.detached_at:.1f}s")
+        return entry.session
+
+    async def _expire(self, key: str):
+        if key in self._detached:
+            self.expired_sessions += 1
+            logger.info(f"Detached session {key} expired")
+            await self._finalize(key)
+
+    async def _finalize(self, key: str):
+        entry = self._detached.pop(key, None)
+        if entry is not None:
+            await self._finalize_entry(key, entry)
+
+    async def _finalize_entry(self, key: str, entry: DetachedSession):
+        entry.timer.cancel()
+        try:
+            await entry.session.expire()
+        except Exception as e:
+            logger.error(f"Error finalizing detached session {key}: {e}")
+
+    async def finalize_all(self):
+        """Finalize every detached session, e.g. on shutdown"""
+        await asyncio.gather(*(self._finalize(key) for key in list(self._detached)))
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "attached_sessions": len(self._active),
+            "detached_sessions": len(self._detached),
+            "max_detached": self.max_detached,
+            "resumed_sessions": self.resumed_sessions,
+            "expired_sessions": self.expired_sessions,
+            "evicted_sessions": self.evicted_sessions,
+        }
+
+
+session_registry = SessionRegistry()
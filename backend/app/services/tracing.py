@@ -0,0 +1,131 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager, nullcontext
+from typing import Any, Deque, Dict, Optional, Tuple
+import logging
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Reused for every stage when tracing is off, so disabled sessions pay one call
+_NULL_CONTEXT = nullcontext()
+
+
+class NullTracer:
+    """Tracer used when a session is not being traced, records nothing"""
+
+    enabled = False
+
+    def stage(self, name: str, **args):
+        return _NULL_CONTEXT
+
+
+NULL_TRACER = NullTracer()
+
+
+class SessionTracer:
+    """
+    Records pipeline stage timings for one session
+    Events go into a bounded ring so long sessions keep only the latest ones
+    """
+
+    enabled = True
+
+    def __init__(self, session_id: Any, capacity: int = None):
+        self.session_id = session_id
+        self.capacity = capacity or settings.TRACE_RING_SIZE
+        # (stage name, start perf_counter, duration seconds, args)
+        self.events: Deque[Tuple[str, float, float, Dict[str, Any]]] = deque(maxlen=self.capacity)
+        self.recorded = 0
+        self.origin = time.perf_counter()
+        self.started_at = time.time()
+
+    @contextmanager
+    def stage(self, name: str, **args):
+        """Time the enclosed block as one stage event"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.events.append((name, start, time.perf_counter() - start, args))
+            self.recorded += 1
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Export events in Chrome trace format (chrome://tracing, Perfetto)
+
+        Returns:
+            dict with 'traceEvents' as complete ('X') events in microseconds
+        """
+        events = [
+            {
+                "name": name,
+                "cat": "session",
+                "ph": "X",
+                "ts": round((start - self.origin) * 1e6, 1),
+                "dur": round(duration * 1e6, 1),
+                "pid": 1,
+                "tid": 1,
+                "args": args,
+            }
+            for name, start, duration, args in list(self.events)
+        ]
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "session_id": str(self.session_id),
+                "started_at": self.started_at,
+                "recorded_events": self.recorded,
+                "dropped_events": self.recorded - len(events),
+            },
+        }
+
+
+class TraceRegistry:
+    """
+    Keeps traces of recent sessions for retrieval after they end
+    Bounded to the most recent TRACE_MAX_SESSIONS traced sessions
+    """
+
+    def __init__(self, max_sessions: int = None):
+        self.max_sessions = max_sessions or settings.TRACE_MAX_SESSIONS
+        self._traces: "OrderedDict[str, SessionTracer]" = OrderedDict()
+        # Session IDs an operator asked to trace, picked up by the session
+        self.pending: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def request(self, session_id: Any):
+        """Ask for a session to be traced from its next audio chunk on"""
+        with self._lock:
+            self.pending[str(session_id)] = None
+            while len(self.pending) > self.max_sessions:
+                self.pending.popitem(last=False)
+
+    def start(self, session_id: Any) -> SessionTracer:
+        """Create and register a tracer for a session"""
+        key = str(session_id)
+        tracer = SessionTracer(session_id)
+        with self._lock:
+            self.pending.pop(key, None)
+            self._traces[key] = tracer
+            self._traces.move_to_end(key)
+            while len(self._traces) > self.max_sessions:
+                self._traces.popitem(last=False)
+        logger.info(f"Tracing enabled for session {session_id}")
+        return tracer
+
+    def claim(self, session_id: Any) -> Optional[SessionTracer]:
+        """Start tracing if an operator requested it for this session"""
+        if str(session_id) in self.pending:
+            return self.start(session_id)
+        return None
+
+    def get(self, session_id: Any) -> Optional[SessionTracer]:
+        with self._lock:
+            return self._traces.get(str(session_id))
+
+
+trace_registry = TraceRegistry()
@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.crud import transcript_cache_crud
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptCache:
+    """
+    Content-addressed cache of transcripts for repeated audio
+
+    Entries are keyed by a sha256 of the model id, the recognizer options and
+    the normalized PCM (16-bit mono at the model's sample rate), so the same
+    recording hits regardless of its container or how it was chunked. Lookups
+    go to an in-memory LRU first, then to the transcript_cache table.
+    Database errors are logged and treated as misses.
+    """
+
+    def __init__(self, max_entries: int = None, model_id: str = None):
+        self.max_entries = settings.TRANSCRIPT_CACHE_SIZE if max_entries is None else max_entries
+        self.model_id = model_id or os.path.basename(settings.VOSK_MODEL_PATH.rstrip("/"))
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.TRANSCRIPT_CACHE_ENABLED
+
+    def hasher(self, options: Dict[str, Any]):
+        """
+        Start a cache key for audio decoded with the given options
+
+        Feed the normalized PCM to the returned hash with update(), then
+        pass hexdigest() to get() or put().
+        """
+        header = json.dumps({"model": self.model_id, **options}, sort_keys=True)
+        digest = hashlib.sha256(header.encode())
+        digest.update(b"\0")
+        return digest
+
+    def _remember(self, key: str, result: Dict[str, Any]):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, db: Session, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached result, returns None on a miss"""
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+            self.memory_hits += 1
+            return result
+        try:
+            entry = transcript_cache_crud.get(db, key)
+            if entry is not None:
+                transcript_cache_crud.record_hit(db, entry)
+        except SQLAlchemyError as e:
+            logger.warning(f"Transcript cache lookup failed: {e}")
+            db.rollback()
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        result = {
+            "text": entry.transcript_text,
+            "confidence": entry.confidence,
+            "word_count": entry.word_count,
+            "audio_duration": entry.audio_duration,
+            "words": entry.words or [],
+        }
+        self._remember(key, result)
+        self.db_hits += 1
+        return result
+
+    def put(self, db: Session, key: str, result: Dict[str, Any]):
+        """Store a result in both tiers"""
+        self._remember(key, result)
+        self.stores += 1
+        try:
+            transcript_cache_crud.put(db, id=key, result=result)
+        except SQLAlchemyError as e:
+            logger.warning(f"Transcript cache store failed: {e}")
+            db.rollback()
+
+    def snapshot(self) -> Dict[str, Any]:
+        hits = self.memory_hits + self.db_hits
+        lookups = hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "model_id": self.model_id,
+            "memory_entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "hit_ratio": round(hits / lookups, 4) if lookups else None,
+        }
+
+
+transcript_cache = TranscriptCache()
@@ -1,9 +1,11 @@
-import json
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from vosk import Model, KaldiRecognizer
 import logging
 from app.config import settings
+from app.services.tracing import NULL_TRACER
+from app.services.grammar_cache import GrammarCache
+from app.utils.serialization import serializer
 
 logger = logging.getLogger(__name__)
 
@@ -43,47 +45,86 @@ class VoskTranscriptionService:
         self._model = Model(model_path)
         logger.info("Vosk model loaded successfully")
     
-    def create_recognizer(self, sample_rate: int = None) -> KaldiRecognizer:
+    def create_recognizer(self, sample_rate: int = None, grammar: Optional[List[str]] = None) -> KaldiRecognizer:
         """
         Create a new recognizer instance for a session
         Each WebSocket connection should have its own recognizer
+        
+        Args:
+            sample_rate: Audio sample rate (default: settings.VOSK_SAMPLE_RATE)
+            grammar: Phrases to constrain recognition to, decoded much faster
+                than the full language model
         """
         if sample_rate is None:
             sample_rate = settings.VOSK_SAMPLE_RATE
         
-        recognizer = KaldiRecognizer(self._model, sample_rate)
+        if grammar:
+            recognizer = KaldiRecognizer(self._model, sample_rate, serializer.dumps(grammar))
+        else:
+            recognizer = KaldiRecognizer(self._model, sample_rate)
         recognizer.SetWords(True)  # Enable word-level timestamps
         
         return recognizer
     
     @staticmethod
-    def process_audio_chunk(recognizer: KaldiRecognizer, audio_data: bytes) -> Dict[str, Any]:
+    def process_audio_chunk(recognizer: KaldiRecognizer, audio_data: bytes, tracer=NULL_TRACER) -> Dict[str, Any]:
         """
         Process audio chunk and return result
         
         Args:
             recognizer: KaldiRecognizer instance
             audio_data: Raw audio bytes (PCM 16-bit)
+            tracer: Session tracer timing the decode and parse stages
         
         Returns:
             dict with 'type' (partial/final) and 'text'
         """
-        if recognizer.AcceptWaveform(audio_data):
-            # Final result for this chunk
-            result = json.loads(recognizer.Result())
+        with tracer.stage("accept_waveform", bytes=len(audio_data)):
+            is_final = recognizer.AcceptWaveform(audio_data)
+
+        with tracer.stage("parse_result"):
+            if is_final:
+                # Final result for this chunk
+                return VoskTranscriptionService.parse_final(recognizer.Result())
+            else:
+                # Partial result
+                partial = serializer.loads(recognizer.PartialResult())
+                result = {
+                    "type": "partial",
+                    "text": partial.get("partial", "")
+                }
+                if "partial_result" in partial:
+                    result["words"] = partial["partial_result"]
+                return result
+    
+    @staticmethod
+    def parse_final(raw: str) -> Dict[str, Any]:
+        """
+        Parse a Vosk final result, with or without N-best alternatives
+        
+        With alternatives enabled, the best one supplies the text and words
+        and all of them are listed under 'alternatives'.
+        """
+        result = serializer.loads(raw)
+        alternatives = result.get("alternatives")
+        if alternatives is None:
             return {
                 "type": "final",
                 "text": result.get("text", ""),
                 "confidence": result.get("confidence", None),
                 "words": result.get("result", [])
             }
-        else:
-            # Partial result
-            partial = json.loads(recognizer.PartialResult())
-            return {
-                "type": "partial",
-                "text": partial.get("partial", "")
-            }
+        best = alternatives[0] if alternatives else {}
+        return {
+            "type": "final",
+            "text": best.get("text", ""),
+            "confidence": best.get("confidence", None),
+            "words": best.get("result", []),
+            "alternatives": [
+                {"text": alternative.get("text", ""), "confidence": alternative.get("confidence")}
+                for alternative in alternatives
+            ]
+        }
     
     @staticmethod
     def get_final_result(recognizer: KaldiRecognizer) -> Dict[str, Any]:
@@ -91,14 +132,67 @@ class VoskTranscriptionService:
         Get final result when stream ends
         Call this when WebSocket connection closes
         """
-        result = json.loads(recognizer.FinalResult())
+        return VoskTranscriptionService.parse_final(recognizer.FinalResult())
+    
+    @staticmethod
+    def transcribe_step(recognizer: KaldiRecognizer, pcm_data: bytes, last: bool = False) -> List[Dict[str, Any]]:
+        """
+        Decode the next piece of a complete recording
+        
+        Args:
+            recognizer: Recognizer fed the whole recording in order
+            pcm_data: Normalized PCM (16-bit mono at settings.VOSK_SAMPLE_RATE)
+            last: Whether this is the last piece, which flushes the recognizer
+        
+        Returns:
+            Vosk results of the utterances this piece ended
+        """
+        results = []
+        if pcm_data and recognizer.AcceptWaveform(pcm_data):
+            results.append(serializer.loads(recognizer.Result()))
+        if last:
+            results.append(serializer.loads(recognizer.FinalResult()))
+        return results
+    
+    def combine_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Join the utterance results of a recording decoded with transcribe_step
+        
+        Returns:
+            dict with 'text', 'words' (timings), 'confidence' and 'word_count'
+        """
+        texts = [result.get("text", "").strip() for result in results]
+        words = [word for result in results for word in result.get("result", [])]
+        text = " ".join(t for t in texts if t)
         return {
-            "type": "final",
-            "text": result.get("text", ""),
-            "confidence": result.get("confidence", None),
-            "words": result.get("result", [])
+            "text": text,
+            "words": words,
+            "confidence": self.calculate_confidence(words),
+            "word_count": self.calculate_word_count(text)
         }
     
+    @staticmethod
+    def merge_channel_segments(segments: List[Dict[str, Any]], labels: List[str]) -> str:
+        """
+        Merge per-channel final segments into a speaker-attributed transcript
+        
+        Args:
+            segments: Final segments with 'channel', 'start' (seconds) and 'text'
+            labels: Speaker label for each channel
+        
+        Returns:
+            One "<speaker>: <text>" line per speaker turn, in start time order
+        """
+        lines = []
+        last_channel = None
+        for segment in sorted(segments, key=lambda s: (s["start"], s["channel"])):
+            if segment["channel"] == last_channel:
+                lines[-1] += " " + segment["text"]
+            else:
+                lines.append(f"{labels[segment['channel']]}: {segment['text']}")
+                last_channel = segment["channel"]
+        return "\n".join(lines)
+    
     @staticmethod
     def calculate_word_count(text: str) -> int:
         """Calculate word count from transcript text"""
@@ -119,3 +213,6 @@ class VoskTranscriptionService:
 
 # Global instance
 transcription_service = VoskTranscriptionService()
+
+# Pools of grammar recognizers shared across sessions
+grammar_cache = GrammarCache(lambda grammar: transcription_service.create_recognizer(grammar=grammar))
@@ -0,0 +1,117 @@
+"""
+Pluggable serialization for WebSocket messages and Vosk results
+
+orjson or msgspec are used when installed (see the `speedups` extra), with
+the standard library json module as fallback. MessagePack is available as an
+optional wire encoding when msgpack or msgspec is installed.
+"""
+import json
+from typing import Any, Callable, Optional
+import logging
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Serializer:
+    """JSON codec with a uniform interface over the available backends"""
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[Any], Any],
+        dumps: Callable[[Any], str],
+        packb: Optional[Callable[[Any], bytes]] = None,
+        unpackb: Optional[Callable[[bytes], Any]] = None,
+    ):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+        self.packb = packb
+        self.unpackb = unpackb
+
+    @property
+    def supports_msgpack(self) -> bool:
+        return self.packb is not None
+
+
+def _stdlib_json():
+    dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+    return "json", json.loads, dumps
+
+
+def _orjson():
+    import orjson
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    return "orjson", orjson.loads, dumps
+
+
+def _msgspec_json():
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def dumps(obj: Any) -> str:
+        return encoder.encode(obj).decode()
+
+    return "msgspec", decoder.decode, dumps
+
+
+def _msgpack():
+    try:
+        import msgspec
+
+        return msgspec.msgpack.Encoder().encode, msgspec.msgpack.Decoder().decode
+    except ImportError:
+        pass
+    try:
+        import msgpack
+
+        return msgpack.packb, msgpack.unpackb
+    except ImportError:
+        return None, None
+
+
+JSON_BACKENDS = {
+    "orjson": _orjson,
+    "msgspec": _msgspec_json,
+    "json": _stdlib_json,
+}
+
+
+def get_serializer(backend: str = None) -> Serializer:
+    """
+    Build a serializer for the requested backend
+
+    Args:
+        backend: 'auto', 'orjson', 'msgspec' or 'json' (default: settings.JSON_BACKEND)
+
+    Returns:
+        Serializer using the first available backend
+
+    Raises:
+        ValueError: If the backend is not one of the above
+    """
+    backend = backend or settings.JSON_BACKEND
+    if backend != "auto" and backend not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON backend {backend!r}, expected one of: auto, {', '.join(JSON_BACKENDS)}")
+    candidates = ["orjson", "msgspec", "json"] if backend == "auto" else [backend, "json"]
+
+    for candidate in candidates:
+        try:
+            name, loads, dumps = JSON_BACKENDS[candidate]()
+            break
+        except ImportError:
+            if backend != "auto":
+                logger.warning(f"JSON backend '{candidate}' is not installed, falling back")
+    packb, unpackb = _msgpack()
+    logger.info(f"Using {name} for JSON serialization (msgpack: {packb is not None})")
+    return Serializer(name, loads, dumps, packb, unpackb)
+
+
+serializer = get_serializer()
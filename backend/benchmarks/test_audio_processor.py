@@ -0,0 +1,51 @@
+"""
+Micro-benchmarks for AudioProcessor hot paths
+
+Run with pytest-benchmark, see benchmarks/README.md for baseline comparison.
+"""
+import base64
+
+import numpy as np
+import pytest
+
+from app.services.audio_processor import AudioProcessor
+
+# Samples per chunk: 100 ms, the web client's 4096-sample buffer, and 1 s at 16 kHz
+CHUNK_SAMPLES = [1600, 4096, 16000]
+
+
+def make_pcm(samples: int) -> bytes:
+    rng = np.random.default_rng(samples)
+    t = np.arange(samples) / 16000
+    signal = 6000 * np.sin(2 * np.pi * 220 * t) + rng.normal(0, 500, samples)
+    return signal.astype(np.int16).tobytes()
+
+
+@pytest.mark.parametrize("samples", CHUNK_SAMPLES)
+def test_base64_to_pcm(benchmark, samples):
+    encoded = base64.b64encode(make_pcm(samples)).decode()
+    assert len(benchmark(AudioProcessor.base64_to_pcm, encoded)) == samples * 2
+
+
+@pytest.mark.parametrize("samples", CHUNK_SAMPLES)
+def test_pcm_to_numpy(benchmark, samples):
+    pcm = make_pcm(samples)
+    assert len(benchmark(AudioProcessor.pcm_to_numpy, pcm)) == samples
+
+
+@pytest.mark.parametrize("samples", CHUNK_SAMPLES)
+def test_detect_silence(benchmark, samples):
+    pcm = make_pcm(samples)
+    assert not benchmark(AudioProcessor.detect_silence, pcm)
+
+
+@pytest.mark.parametrize("samples", CHUNK_SAMPLES)
+def test_normalize_audio(benchmark, samples):
+    audio = AudioProcessor.pcm_to_numpy(make_pcm(samples))
+    assert benchmark(AudioProcessor.normalize_audio, audio).dtype == np.int16
+
+
+@pytest.mark.parametrize("samples", CHUNK_SAMPLES)
+def test_validate_audio_format(benchmark, samples):
+    pcm = make_pcm(samples)
+    assert benchmark(AudioProcessor.validate_audio_format, pcm) is True
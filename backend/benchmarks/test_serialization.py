@@ -0,0 +1,37 @@
+"""
+Micro-benchmarks for the WebSocket/Vosk serialization backends
+"""
+import json
+
+import pytest
+
+from app.utils.serialization import JSON_BACKENDS, get_serializer
+
+VOSK_RESULT = json.dumps({
+    "result": [{"conf": 0.95, "start": i * 0.3, "end": i * 0.3 + 0.25, "word": "word"} for i in range(20)],
+    "text": " ".join(["word"] * 20),
+}, indent=2)
+OUTBOUND = {"type": "final_chunk", "text": " ".join(["word"] * 20), "confidence": 0.95}
+
+
+def available_backends():
+    backends = []
+    for name in JSON_BACKENDS:
+        try:
+            JSON_BACKENDS[name]()
+            backends.append(name)
+        except ImportError:
+            pass
+    return backends
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_parse_vosk_result(benchmark, backend):
+    codec = get_serializer(backend)
+    assert len(benchmark(codec.loads, VOSK_RESULT)["result"]) == 20
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_dump_outbound_message(benchmark, backend):
+    codec = get_serializer(backend)
+    assert benchmark(codec.dumps, OUTBOUND)
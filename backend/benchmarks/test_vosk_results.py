@@ -0,0 +1,61 @@
+"""
+Micro-benchmarks for VoskTranscriptionService result handling
+
+A fake recognizer returns canned Vosk JSON so only the service's own
+per-frame work (result parsing and shaping) is measured. Needs the Vosk
+model to be importable, like the rest of the service.
+"""
+import json
+
+import pytest
+
+from app.services.transcription import VoskTranscriptionService
+
+WORDS = ["the", "quick", "brown", "fox", "jumps", "over", "the", "lazy", "dog"]
+
+
+def vosk_result(word_count: int) -> str:
+    words = [WORDS[i % len(WORDS)] for i in range(word_count)]
+    return json.dumps({
+        "result": [
+            {"conf": 0.95, "start": i * 0.3, "end": i * 0.3 + 0.25, "word": word}
+            for i, word in enumerate(words)
+        ],
+        "text": " ".join(words),
+    }, indent=2)
+
+
+class FakeRecognizer:
+    def __init__(self, final: bool, word_count: int):
+        self.final = final
+        self.result = vosk_result(word_count)
+        self.partial = json.dumps({"partial": " ".join(WORDS[:min(word_count, 9)])}, indent=2)
+
+    def AcceptWaveform(self, data):
+        return self.final
+
+    def Result(self):
+        return self.result
+
+    def PartialResult(self):
+        return self.partial
+
+    def FinalResult(self):
+        return self.result
+
+
+@pytest.mark.parametrize("word_count", [5, 40])
+def test_process_audio_chunk_partial(benchmark, word_count):
+    recognizer = FakeRecognizer(False, word_count)
+    assert benchmark(VoskTranscriptionService.process_audio_chunk, recognizer, b"")["type"] == "partial"
+
+
+@pytest.mark.parametrize("word_count", [5, 40])
+def test_process_audio_chunk_final(benchmark, word_count):
+    recognizer = FakeRecognizer(True, word_count)
+    assert len(benchmark(VoskTranscriptionService.process_audio_chunk, recognizer, b"")["words"]) == word_count
+
+
+def test_calculate_confidence(benchmark):
+    words = json.loads(vosk_result(40))["result"]
+    assert benchmark(VoskTranscriptionService.calculate_confidence, words) == pytest.approx(0.95)
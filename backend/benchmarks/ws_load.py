@@ -0,0 +1,445 @@
+"""
+Load-generation and latency benchmark for /ws/transcribe
+
+Replays WAV fixtures over N concurrent WebSocket clients, at real-time or
+accelerated pace, and reports partial/final latency percentiles, real-time
+factor and server CPU/RSS per session. Results are written as JSON so runs
+can be compared against a stored baseline.
+
+Usage (from the backend directory):
+    python -m benchmarks.ws_load --spawn-server --clients 8 --output results.json
+    python -m benchmarks.ws_load --url ws://localhost:8000 --server-pid 1234 \\
+        --clients 50 --speed 4 --wav fixtures/ --compare baseline.json
+"""
+import argparse
+import asyncio
+import base64
+import json
+import math
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+import wave
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import websockets
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2
+
+# Metrics compared against a baseline, with the direction that counts as worse
+COMPARED_METRICS = {
+    "partial_latency_ms.p50": "higher",
+    "partial_latency_ms.p95": "higher",
+    "partial_latency_ms.p99": "higher",
+    "final_chunk_latency_ms.p95": "higher",
+    "final_latency_ms.p95": "higher",
+    "start_latency_ms.p95": "higher",
+    "server.rtf": "higher",
+    "server.cpu_seconds_per_session": "higher",
+    "server.rss_mb_per_session": "higher",
+    "errors": "higher",
+}
+
+
+def load_wav(path: Path) -> bytes:
+    """Load a 16 kHz mono 16-bit WAV file as raw PCM"""
+    with wave.open(str(path), "rb") as wav:
+        if (wav.getframerate(), wav.getnchannels(), wav.getsampwidth()) != (SAMPLE_RATE, 1, SAMPLE_WIDTH):
+            raise ValueError(
+                f"{path}: expected {SAMPLE_RATE} Hz mono 16-bit PCM, got "
+                f"{wav.getframerate()} Hz, {wav.getnchannels()} channel(s), {wav.getsampwidth() * 8}-bit"
+            )
+        return wav.readframes(wav.getnframes())
+
+
+def synthetic_fixture(seconds: float, seed: int = 0) -> bytes:
+    """Generate a speech-band tone sweep with noise when no WAV fixture is given"""
+    rng = random.Random(seed)
+    samples = array("h")
+    for i in range(int(seconds * SAMPLE_RATE)):
+        t = i / SAMPLE_RATE
+        freq = 200 + 150 * math.sin(2 * math.pi * 0.5 * t)
+        envelope = 0.5 + 0.5 * math.sin(2 * math.pi * 2 * t)
+        value = 8000 * envelope * math.sin(2 * math.pi * freq * t) + rng.gauss(0, 300)
+        samples.append(max(-32768, min(32767, int(value))))
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def collect_fixtures(paths: List[str], synthetic_seconds: float) -> List[bytes]:
+    fixtures = []
+    for raw in paths:
+        path = Path(raw)
+        files = sorted(path.glob("*.wav")) if path.is_dir() else [path]
+        fixtures.extend(load_wav(f) for f in files)
+    if not fixtures:
+        fixtures.append(synthetic_fixture(synthetic_seconds))
+    return fixtures
+
+
+def percentiles(values: List[float]) -> Dict[str, Optional[float]]:
+    """p50/p95/p99/max using nearest-rank, in the unit of the input"""
+    if not values:
+        return {"count": 0, "p50": None, "p95": None, "p99": None, "max": None}
+    ordered = sorted(values)
+
+    def rank(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))], 3)
+
+    return {
+        "count": len(ordered),
+        "p50": rank(0.50),
+        "p95": rank(0.95),
+        "p99": rank(0.99),
+        "max": round(ordered[-1], 3),
+    }
+
+
+class ProcessSampler:
+    """Samples CPU time and RSS of the server process from /proc (Linux only)"""
+
+    def __init__(self, pid: Optional[int]):
+        self.pid = pid
+        self.peak_rss = 0
+        self.available = pid is not None and Path(f"/proc/{pid}/stat").exists()
+
+    def cpu_seconds(self) -> Optional[float]:
+        if not self.available:
+            return None
+        fields = Path(f"/proc/{self.pid}/stat").read_text().rsplit(")", 1)[1].split()
+        ticks = os.sysconf("SC_CLK_TCK")
+        return (int(fields[11]) + int(fields[12])) / ticks
+
+    def rss_bytes(self) -> Optional[int]:
+        if not self.available:
+            return None
+        for line in Path(f"/proc/{self.pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                rss = int(line.split()[1]) * 1024
+                self.peak_rss = max(self.peak_rss, rss)
+                return rss
+        return None
+
+    async def track_peak(self, interval: float = 0.2):
+        while True:
+            self.rss_bytes()
+            await asyncio.sleep(interval)
+
+
+class ServerProcess:
+    """Runs the API under uvicorn against a throwaway SQLite database"""
+
+    def __init__(self, port: int, database_url: Optional[str]):
+        self.port = port
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.database_url = database_url or f"sqlite:///{self.tmpdir.name}/benchmark.db"
+        self.process: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> "ServerProcess":
+        env = dict(os.environ, DATABASE_URL=self.database_url)
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app",
+             "--host", "127.0.0.1", "--port", str(self.port), "--log-level", "warning"],
+            cwd=BACKEND_DIR,
+            env=env,
+        )
+        deadline = time.time() + 60
+        while time.time() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError("Server exited during startup")
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{self.port}/", timeout=1)
+                return self
+            except OSError:
+                time.sleep(0.25)
+        self.__exit__(None, None, None)
+        raise RuntimeError("Server did not start within 60s")
+
+    def __exit__(self, *exc):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.tmpdir.cleanup()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process else None
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def fetch_load(http_url: str) -> Optional[Dict[str, Any]]:
+    """Read the node's decode load figures, if the endpoint is reachable"""
+    try:
+        with urllib.request.urlopen(f"{http_url}/api/v1/admin/load", timeout=5) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        # 503 still carries the load snapshot
+        return json.loads(e.read())
+    except OSError:
+        return None
+
+
+async def run_client(
+    index: int,
+    ws_url: str,
+    pcm: bytes,
+    chunk_ms: int,
+    speed: float,
+) -> Dict[str, Any]:
+    """Stream one fixture through a session and time every server reply"""
+    chunk_bytes = SAMPLE_RATE * SAMPLE_WIDTH * chunk_ms // 1000
+    chunks = [pcm[i:i + chunk_bytes] for i in range(0, len(pcm), chunk_bytes)]
+    chunk_seconds = chunk_ms / 1000
+    result: Dict[str, Any] = {
+        "client": index,
+        "audio_seconds": len(pcm) / (SAMPLE_RATE * SAMPLE_WIDTH),
+        "partial_latency_ms": [],
+        "final_chunk_latency_ms": [],
+        "start_latency_ms": None,
+        "final_latency_ms": None,
+        "errors": [],
+    }
+    # The server answers every audio message with exactly one partial or
+    # final_chunk, in order, so replies are matched to sends FIFO
+    pending: List[float] = []
+    final_received = asyncio.Event()
+    started = asyncio.Event()
+    stop_sent_at = 0.0
+    start_sent_at = 0.0
+
+    async with websockets.connect(f"{ws_url}/ws/transcribe", max_size=None) as ws:
+        async def receive():
+            async for raw in ws:
+                now = time.perf_counter()
+                message = json.loads(raw)
+                kind = message.get("type")
+                if kind == "session_started":
+                    result["session_id"] = message.get("session_id")
+                    result["start_latency_ms"] = (now - start_sent_at) * 1000
+                    started.set()
+                elif kind in ("partial", "final_chunk") and pending:
+                    latency = (now - pending.pop(0)) * 1000
+                    result[f"{kind}_latency_ms"].append(latency)
+                elif kind == "final":
+                    result["final_latency_ms"] = (now - stop_sent_at) * 1000
+                    final_received.set()
+                    return
+                elif kind == "error":
+                    result["errors"].append(message.get("message"))
+                    if pending and started.is_set():
+                        # An audio message answered with an error instead of a result
+                        pending.pop(0)
+                    if not started.is_set():
+                        started.set()
+                        final_received.set()
+                        return
+
+        receiver = asyncio.create_task(receive())
+        start_sent_at = time.perf_counter()
+        await ws.send(json.dumps({"type": "start"}))
+        await started.wait()
+
+        if not result["errors"]:
+            begin = time.perf_counter()
+            for n, chunk in enumerate(chunks):
+                # Pace sends against the audio clock so jitter does not accumulate
+                delay = begin + n * chunk_seconds / speed - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                pending.append(time.perf_counter())
+                await ws.send(json.dumps({"type": "audio", "data": base64.b64encode(chunk).decode()}))
+            stop_sent_at = time.perf_counter()
+            await ws.send(json.dumps({"type": "stop"}))
+            try:
+                await asyncio.wait_for(final_received.wait(), timeout=60)
+            except asyncio.TimeoutError:
+                result["errors"].append("timed out waiting for final result")
+        receiver.cancel()
+
+    return result
+
+
+async def run_benchmark(args: argparse.Namespace, server_pid: Optional[int]) -> Dict[str, Any]:
+    fixtures = collect_fixtures(args.wav, args.synthetic_seconds)
+    http_url = args.url.replace("ws://", "http://").replace("wss://", "https://")
+    sampler = ProcessSampler(server_pid)
+    cpu_before = sampler.cpu_seconds()
+    rss_before = sampler.rss_bytes()
+    tracker = asyncio.create_task(sampler.track_peak()) if sampler.available else None
+
+    started_at = time.perf_counter()
+    sessions = []
+    for offset in range(0, args.clients, args.ramp_batch):
+        batch = range(offset, min(args.clients, offset + args.ramp_batch))
+        sessions.extend(
+            asyncio.create_task(run_client(i, args.url, fixtures[i % len(fixtures)], args.chunk_ms, args.speed))
+            for i in batch
+        )
+        if args.ramp_interval:
+            await asyncio.sleep(args.ramp_interval)
+    outcomes = await asyncio.gather(*sessions, return_exceptions=True)
+    wall_seconds = time.perf_counter() - started_at
+
+    if tracker:
+        tracker.cancel()
+    cpu_after = sampler.cpu_seconds()
+    load = fetch_load(http_url)
+
+    clients = []
+    for i, outcome in enumerate(outcomes):
+        if isinstance(outcome, Exception):
+            clients.append({"client": i, "errors": [repr(outcome)]})
+        else:
+            clients.append(outcome)
+
+    def gather(key: str) -> List[float]:
+        values = []
+        for client in clients:
+            value = client.get(key)
+            if isinstance(value, list):
+                values.extend(value)
+            elif value is not None:
+                values.append(value)
+        return values
+
+    audio_seconds = sum(c.get("audio_seconds", 0) for c in clients)
+    server: Dict[str, Any] = {"decode_rtf": load.get("rtf") if load else None}
+    if cpu_before is not None and cpu_after is not None:
+        cpu = cpu_after - cpu_before
+        server["cpu_seconds"] = round(cpu, 3)
+        server["cpu_seconds_per_session"] = round(cpu / args.clients, 4)
+        server["rtf"] = round(cpu / audio_seconds, 4) if audio_seconds else None
+        server["rss_mb_baseline"] = round(rss_before / 2**20, 2)
+        server["rss_mb_peak"] = round(sampler.peak_rss / 2**20, 2)
+        server["rss_mb_per_session"] = round((sampler.peak_rss - rss_before) / 2**20 / args.clients, 3)
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "host": platform.node(),
+            "python": platform.python_version(),
+            "url": args.url,
+            "clients": args.clients,
+            "speed": args.speed,
+            "chunk_ms": args.chunk_ms,
+            "fixtures": len(fixtures),
+        },
+        "wall_seconds": round(wall_seconds, 3),
+        "audio_seconds": round(audio_seconds, 3),
+        "partial_latency_ms": percentiles(gather("partial_latency_ms")),
+        "final_chunk_latency_ms": percentiles(gather("final_chunk_latency_ms")),
+        "final_latency_ms": percentiles(gather("final_latency_ms")),
+        "start_latency_ms": percentiles(gather("start_latency_ms")),
+        "server": server,
+        "load": load,
+        "errors": sum(len(c.get("errors", [])) for c in clients),
+        "sessions": [
+            {key: value for key, value in c.items() if not isinstance(value, list) or key == "errors"}
+            for c in clients
+        ],
+    }
+
+
+def lookup(results: Dict[str, Any], dotted: str) -> Optional[float]:
+    value: Any = results
+    for part in dotted.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value if isinstance(value, (int, float)) else None
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """List metrics that regressed by more than `threshold` (a fraction) against the baseline"""
+    regressions = []
+    for metric, worse in COMPARED_METRICS.items():
+        current, previous = lookup(results, metric), lookup(baseline, metric)
+        if current is None or previous is None:
+            continue
+        if previous == 0:
+            regressed = current > 0 if worse == "higher" else False
+        else:
+            change = (current - previous) / previous
+            regressed = change > threshold if worse == "higher" else change < -threshold
+        if regressed:
+            regressions.append(f"{metric}: {previous} -> {current}")
+    return regressions
+
+
+def print_summary(results: Dict[str, Any]):
+    print(f"{results['meta']['clients']} clients, {results['audio_seconds']}s audio "
+          f"in {results['wall_seconds']}s, {results['errors']} errors")
+    for key in ("start_latency_ms", "partial_latency_ms", "final_chunk_latency_ms", "final_latency_ms"):
+        stats = results[key]
+        print(f"  {key:24} p50={stats['p50']} p95={stats['p95']} p99={stats['p99']} (n={stats['count']})")
+    for key, value in results["server"].items():
+        print(f"  server.{key:17} {value}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="ws://127.0.0.1:8000", help="WebSocket base URL of the server")
+    parser.add_argument("--spawn-server", action="store_true", help="Start a local server on SQLite")
+    parser.add_argument("--database-url", help="Database for the spawned server (default: temporary SQLite)")
+    parser.add_argument("--server-pid", type=int, help="PID of an already running server, for CPU/RSS")
+    parser.add_argument("--clients", type=int, default=10, help="Concurrent sessions")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed, 1.0 = real time")
+    parser.add_argument("--chunk-ms", type=int, default=256, help="Audio per message in milliseconds")
+    parser.add_argument("--wav", nargs="*", default=[], help="WAV fixtures or directories of fixtures")
+    parser.add_argument("--synthetic-seconds", type=float, default=10.0,
+                        help="Length of the generated fixture when no WAV is given")
+    parser.add_argument("--ramp-batch", type=int, default=10, help="Clients connected per ramp step")
+    parser.add_argument("--ramp-interval", type=float, default=0.0, help="Seconds between ramp steps")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--compare", help="Baseline JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed relative regression before failing (default 10%%)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.spawn_server:
+        port = free_port()
+        args.url = f"ws://127.0.0.1:{port}"
+        with ServerProcess(port, args.database_url) as server:
+            results = asyncio.run(run_benchmark(args, server.pid))
+    else:
+        results = asyncio.run(run_benchmark(args, args.server_pid))
+
+    print_summary(results)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    if args.compare:
+        regressions = compare(results, json.loads(Path(args.compare).read_text()), args.threshold)
+        if regressions:
+            print("Regressions against baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+from datetime import datetime
+
+import pytest
+
+from app.crud.session_rollup import bucket_start, session_rollup_crud
+from app.models.session import Session as SessionModel
+from app.models.transcript import Transcript
+from app.services.analytics import backfill
+
+DAY = datetime(2026, 3, 1)
+
+
+def add_session(db, created_at, status, duration=10.0, word_count=5, confidence=None):
+    session = SessionModel(created_at=created_at, status=status, duration_seconds=duration, word_count=word_count)
+    db.add(session)
+    db.flush()
+    if confidence is not None:
+        db.add(Transcript(session_id=session.id, transcript_text="hello", confidence=confidence))
+    db.commit()
+
+
+def test_bucket_start_truncates_to_hour_and_day():
+    timestamp = datetime(2026, 3, 1, 14, 35, 12, 500)
+    assert bucket_start(timestamp, "hour") == datetime(2026, 3, 1, 14)
+    assert bucket_start(timestamp, "day") == datetime(2026, 3, 1)
+
+
+def test_record_session_increments_hour_and_day_buckets(db):
+    session_rollup_crud.record_session(
+        db, created_at=DAY.replace(hour=9, minute=5), status="completed", duration=30.0, word_count=12, confidence=0.9
+    )
+    session_rollup_crud.record_session(
+        db, created_at=DAY.replace(hour=9, minute=50), status="failed", duration=6.0, word_count=0
+    )
+    session_rollup_crud.record_session(
+        db, created_at=DAY.replace(hour=17), status="completed", duration=60.0, word_count=20, confidence=0.7
+    )
+
+    hours = session_rollup_crud.get_range(db, "hour", DAY, DAY.replace(day=2))
+    assert [(h.bucket_start.hour, h.sessions, h.completed, h.failed) for h in hours] == [(9, 2, 1, 1), (17, 1, 1, 0)]
+
+    [day] = session_rollup_crud.get_range(db, "day", DAY, DAY.replace(day=2))
+    assert (day.sessions, day.completed, day.failed, day.words) == (3, 2, 1, 32)
+    assert day.duration_seconds == pytest.approx(96.0)
+    assert day.confidence_sum / day.confidence_count == pytest.approx(0.8)
+
+
+def test_backfill_rebuilds_buckets_from_sessions(db):
+    add_session(db, DAY.replace(hour=9), "completed", confidence=0.6)
+    add_session(db, DAY.replace(hour=10), "failed")
+    add_session(db, DAY.replace(hour=11), "in_progress")
+    add_session(db, DAY.replace(day=2, hour=8), "completed", confidence=1.0)
+    # A stale bucket from before the rebuild is replaced, not added to
+    session_rollup_crud.record_session(db, created_at=DAY.replace(hour=9), status="completed", duration=1.0, word_count=1)
+
+    assert backfill(db, since=DAY, until=DAY.replace(day=2)) == 3
+
+    days = session_rollup_crud.get_range(db, "day", DAY, DAY.replace(day=3))
+    assert [(d.sessions, d.completed, d.failed, d.words) for d in days] == [(2, 1, 1, 10), (1, 1, 0, 5)]
+    assert [d.confidence_count for d in days] == [1, 1]
+    assert len(session_rollup_crud.get_range(db, "hour", DAY, DAY.replace(day=3))) == 3
+
+
+def test_backfill_without_sessions_is_a_noop(db):
+    assert backfill(db) == 0
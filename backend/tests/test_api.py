@@ -15,3 +15,23 @@ def test_get_sessions():
     assert "sessions" in response.json()
     assert isinstance(response.json()["total"], int)
     assert isinstance(response.json()["sessions"], list)
+
+def test_get_sessions_filters():
+    response = client.get("/api/v1/sessions", params={"status": "completed", "metadata": "tenant:acme"})
+    assert response.status_code == 200
+    assert all(session["status"] == "completed" for session in response.json()["sessions"])
+
+    # Values are parsed as JSON, so booleans and numbers match
+    response = client.get("/api/v1/sessions", params={"metadata": ["source:upload", "cached:true"]})
+    assert response.status_code == 200
+    assert all(session["session_metadata"]["cached"] is True for session in response.json()["sessions"])
+
+    response = client.get("/api/v1/sessions", params={"metadata": "tenant"})
+    assert response.status_code == 400
+
+def test_analytics_range_starts_on_a_bucket_boundary():
+    response = client.get("/api/v1/analytics", params={
+        "granularity": "day", "start": "2026-03-01T12:30:00", "end": "2026-03-03T00:00:00"
+    })
+    assert response.status_code == 200
+    assert response.json()["start"] == "2026-03-01T00:00:00"
@@ -0,0 +1,59 @@
+import io
+import os
+import wave
+
+import pytest
+
+from app.services.audio_archive import AudioArchive
+from app.services.audio_processor import AudioProcessor
+
+
+async def archive_session(root, chunks, channels=1):
+    archive = AudioArchive(root=str(root), segment_bytes=10, flush_bytes=4)
+    writer = archive.writer("s1", sample_rate=4, channels=channels)
+    offset = 0
+    for chunk in chunks:
+        writer.append(chunk)
+        offset += len(chunk)
+        writer.mark(offset, channel=0, text=f"chunk {offset}")
+    await writer.close()
+    return archive
+
+
+@pytest.mark.asyncio
+async def test_ranges_read_back_across_segments(tmp_path):
+    pcm = bytes(range(30))
+    archive = await archive_session(tmp_path, [pcm[:6], pcm[6:13], pcm[13:]])
+    assert sorted(os.listdir(tmp_path / "s1")) == [
+        "000000.pcm", "000001.pcm", "000002.pcm", "index.jsonl", "meta.json"
+    ]
+
+    reader = archive.reader("s1")
+    assert reader.total_bytes == 30
+    assert b"".join(reader.iter_range(0, 30, chunk_bytes=4)) == pcm
+    assert b"".join(reader.iter_range(8, 23)) == pcm[8:23]
+    # 4 Hz mono: one second is 8 bytes
+    assert reader.byte_range(1, 2) == (8, 16)
+    assert reader.byte_range(None, 100) == (0, 30)
+    assert [entry["offset"] for entry in reader.index()] == [6, 13, 30]
+
+
+@pytest.mark.asyncio
+async def test_segments_stay_frame_aligned(tmp_path):
+    archive = await archive_session(tmp_path, [bytes(24)], channels=4)
+    reader = archive.reader("s1")
+    assert reader.segment_bytes == 8
+    # 4 Hz, 4 channels: half a second is 2 frames of 8 bytes
+    assert reader.byte_range(0.5, None) == (16, 24)
+
+
+def test_missing_archive(tmp_path):
+    assert AudioArchive(root=str(tmp_path)).reader("nope") is None
+
+
+def test_wav_header_is_readable():
+    pcm = bytes(range(16))
+    data = AudioProcessor.wav_header(len(pcm), sample_rate=8000, channels=2) + pcm
+    with wave.open(io.BytesIO(data)) as wav:
+        assert (wav.getnchannels(), wav.getframerate(), wav.getsampwidth()) == (2, 8000, 2)
+        assert wav.readframes(wav.getnframes()) == pcm
@@ -0,0 +1,34 @@
+import io
+import wave
+
+import numpy as np
+
+from app.services.audio_processor import AudioProcessor
+
+
+def test_deinterleave_returns_channel_views():
+    frames = np.array([[1, -1], [2, -2], [3, -3]], dtype=np.int16)
+    pcm = frames.tobytes()
+    left, right = AudioProcessor.deinterleave(pcm, 2)
+    assert left.tolist() == [1, 2, 3]
+    assert right.tolist() == [-1, -2, -3]
+    # Views over the received buffer, not copies
+    assert not left.flags.owndata and not right.flags.owndata
+
+
+def test_deinterleave_mono_is_identity():
+    pcm = np.arange(5, dtype=np.int16).tobytes()
+    (mono,) = AudioProcessor.deinterleave(pcm, 1)
+    assert mono.tobytes() == pcm
+
+
+def test_wav_to_pcm_normalizes_stereo():
+    frames = np.array([[100, 300], [-200, -400]], dtype=np.int16)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(frames.tobytes())
+    pcm = AudioProcessor.wav_to_pcm(buffer.getvalue())
+    assert np.frombuffer(pcm, dtype=np.int16).tolist() == [200, -300]
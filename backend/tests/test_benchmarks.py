@@ -0,0 +1,21 @@
+from benchmarks.ws_load import compare, percentiles, synthetic_fixture
+
+
+def test_percentiles_nearest_rank():
+    stats = percentiles([float(v) for v in range(1, 101)])
+    assert stats["count"] == 100
+    assert stats["p50"] == 50
+    assert stats["p95"] == 95
+    assert stats["p99"] == 99
+    assert percentiles([])["p50"] is None
+
+
+def test_compare_flags_regressions_over_threshold():
+    baseline = {"partial_latency_ms": {"p95": 100.0}, "server": {"rtf": 0.2}, "errors": 0}
+    current = {"partial_latency_ms": {"p95": 105.0}, "server": {"rtf": 0.3}, "errors": 0}
+    regressions = compare(current, baseline, threshold=0.1)
+    assert regressions == ["server.rtf: 0.2 -> 0.3"]
+
+
+def test_synthetic_fixture_length():
+    assert len(synthetic_fixture(0.5)) == 16000
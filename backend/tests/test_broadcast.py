@@ -0,0 +1,55 @@
+import pytest
+
+from app.services.broadcast import BroadcastBackend, InMemoryBroadcastHub, get_broadcast_backend
+
+
+@pytest.mark.asyncio
+async def test_every_watcher_receives_events():
+    hub = InMemoryBroadcastHub(buffer_size=10)
+    watchers = [hub.subscribe("s1"), hub.subscribe("s1")]
+    other = hub.subscribe("s2")
+    hub.publish("s1", {"type": "partial", "text": "hello"})
+    for watcher in watchers:
+        assert await watcher.get() == '{"type":"partial","text":"hello"}'
+    assert other.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_slow_watcher_is_dropped_without_affecting_others():
+    hub = InMemoryBroadcastHub(buffer_size=2)
+    slow = hub.subscribe("s1")
+    fast = hub.subscribe("s1")
+    for i in range(3):
+        hub.publish("s1", {"type": "partial", "text": str(i)})
+        await fast.get()
+    assert await slow.get() is None
+    assert slow.close_reason == "slow_consumer"
+    assert hub.subscriber_count("s1") == 1
+    assert hub.dropped_subscribers == 1
+
+
+@pytest.mark.asyncio
+async def test_close_session_ends_subscriptions():
+    hub = InMemoryBroadcastHub(buffer_size=10)
+    watcher = hub.subscribe("s1")
+    hub.publish("s1", {"type": "final", "text": "done"})
+    hub.close_session("s1")
+    # Events published before the end are still delivered
+    assert await watcher.get() == '{"type":"final","text":"done"}'
+    assert await watcher.get() is None
+    assert watcher.close_reason == "session_ended"
+    assert hub.subscriber_count("s1") == 0
+
+
+def test_backend_is_loaded_from_dotted_path():
+    backend = get_broadcast_backend("app.services.broadcast.InMemoryBroadcastHub")
+    assert isinstance(backend, InMemoryBroadcastHub)
+
+
+def test_backend_interface_is_abstract():
+    class Incomplete(BroadcastBackend):
+        def publish(self, session_id, event):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.decode_scheduler import DecodeScheduler
+
+
+class FakeRecognizer:
+    """Records the order in which sessions' audio reaches the decode threads"""
+
+    def __init__(self, log, name):
+        self.log = log
+        self.name = name
+
+    def AcceptWaveform(self, data):
+        self.log.append(self.name)
+        return False
+
+
+async def run_queued(scheduler, jobs):
+    """
+    Hold the single decode thread while all jobs are queued, then release it
+
+    Args:
+        jobs: (recognizer, tenant, session, priority) per job, in submit order
+    """
+    gate = threading.Event()
+    try:
+        blocker = asyncio.ensure_future(scheduler.run(gate.wait, tenant="blocker"))
+        await asyncio.sleep(0.05)
+        pending = [
+            asyncio.ensure_future(scheduler.run(
+                recognizer.AcceptWaveform, b"\0" * 3200, tenant=tenant, session=session, cost=0.1, priority=priority
+            ))
+            for recognizer, tenant, session, priority in jobs
+        ]
+        await asyncio.sleep(0.05)
+        gate.set()
+        await asyncio.gather(blocker, *pending)
+    finally:
+        scheduler.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_tenants_share_decode_time_fairly():
+    log = []
+    bulk, live = FakeRecognizer(log, "bulk"), FakeRecognizer(log, "live")
+    jobs = [(bulk, "acme", "replay", "live")] * 6 + [(live, "globex", "captions", "live")] * 2
+    await run_queued(DecodeScheduler(workers=1), jobs)
+    assert log == ["bulk", "live", "bulk", "live", "bulk", "bulk", "bulk", "bulk"]
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_their_tenants_time():
+    log = []
+    first, second, other = FakeRecognizer(log, "a1"), FakeRecognizer(log, "a2"), FakeRecognizer(log, "b1")
+    jobs = [(first, "acme", "a1", "live")] * 4 + [(second, "acme", "a2", "live")] * 2 + [(other, "globex", "b1", "live")] * 3
+    await run_queued(DecodeScheduler(workers=1), jobs)
+    # acme's half of the decode time alternates between its two sessions
+    assert log[:6] == ["a1", "b1", "a2", "b1", "a1", "b1"]
+
+
+@pytest.mark.asyncio
+async def test_tenant_weights():
+    log = []
+    heavy, light = FakeRecognizer(log, "heavy"), FakeRecognizer(log, "light")
+    jobs = [(heavy, "heavy", "h", "live")] * 4 + [(light, "light", "l", "live")] * 4
+    await run_queued(DecodeScheduler(workers=1, tenant_weights={"heavy": 2.0}), jobs)
+    assert log[:6] == ["heavy", "light", "heavy", "heavy", "light", "heavy"]
+
+
+@pytest.mark.asyncio
+async def test_live_before_batch():
+    log = []
+    upload, captions = FakeRecognizer(log, "batch"), FakeRecognizer(log, "live")
+    jobs = [(upload, "acme", None, "batch")] * 2 + [(captions, "globex", "c", "live")] * 2
+    await run_queued(DecodeScheduler(workers=1), jobs)
+    assert log == ["live", "live", "batch", "batch"]
+
+
+class SingleThreadedRecognizer:
+    """Fails like an unsafe Vosk recognizer if two threads use it at once"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = 0
+
+    def AcceptWaveform(self, data):
+        if not self.lock.acquire(blocking=False):
+            raise RuntimeError("recognizer used concurrently")
+        try:
+            time.sleep(0.002)
+            self.calls += 1
+            return False
+        finally:
+            self.lock.release()
+
+
+@pytest.mark.asyncio
+async def test_jobs_of_a_session_never_overlap():
+    scheduler = DecodeScheduler(workers=2)
+    recognizer, other = SingleThreadedRecognizer(), SingleThreadedRecognizer()
+    try:
+        await asyncio.gather(*(
+            scheduler.run(recognizer.AcceptWaveform, b"\0" * 3200, tenant="acme", session="S", cost=0.1)
+            for _ in range(20)
+        ), *(
+            scheduler.run(other.AcceptWaveform, b"\0" * 3200, tenant="acme", session="T", cost=0.1)
+            for _ in range(20)
+        ))
+    finally:
+        scheduler.shutdown()
+    assert recognizer.calls == other.calls == 20
+
+
+@pytest.mark.asyncio
+async def test_usage_counters_and_errors():
+    scheduler = DecodeScheduler(workers=2)
+
+    def fail():
+        raise RuntimeError("decoder crashed")
+
+    try:
+        assert await scheduler.run(sum, [1, 2], tenant="acme", cost=0.5) == 3
+        with pytest.raises(RuntimeError):
+            await scheduler.run(fail, tenant="acme", cost=0.25)
+        with pytest.raises(ValueError):
+            await scheduler.run(sum, [], priority="urgent")
+    finally:
+        scheduler.shutdown()
+
+    usage = scheduler.snapshot()["tenants"]["acme"]
+    assert usage["jobs"] == 2
+    assert usage["queued"] == 0
+    assert usage["audio_seconds"] == pytest.approx(0.75)
+    assert usage["weight"] == 1.0
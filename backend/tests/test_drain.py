@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from app.services.drain import DrainController
+from app.services.session_registry import session_registry
+
+
+class FakeSession:
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.terminated = False
+
+    async def terminate(self):
+        self.terminated = True
+        session_registry.remove_active(self)
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_sessions_that_finish_in_time():
+    controller = DrainController()
+    session = FakeSession("finishes")
+    session_registry.add_active(session)
+    asyncio.get_running_loop().call_later(0.05, session_registry.remove_active, session)
+
+    await controller.drain(timeout=5)
+    assert controller.draining
+    assert not session.terminated
+    assert controller.forced_sessions == 0
+
+
+@pytest.mark.asyncio
+async def test_drain_force_stops_sessions_at_deadline():
+    controller = DrainController()
+    session = FakeSession("lingers")
+    session_registry.add_active(session)
+
+    await controller.drain(timeout=0)
+    assert session.terminated
+    assert controller.forced_sessions == 1
+    assert not session_registry.active()
@@ -0,0 +1,60 @@
+import pytest
+
+from app.services.grammar_cache import GrammarCache
+
+
+class FakeRecognizer:
+    def __init__(self, grammar):
+        self.grammar = grammar
+        self.resets = 0
+
+    def Reset(self):
+        self.resets += 1
+
+
+def make_cache(**kwargs):
+    return GrammarCache(FakeRecognizer, **{"max_grammars": 2, "pool_size": 2, "named": {}, **kwargs})
+
+
+def test_resolve_normalizes_inline_and_named_grammars():
+    cache = make_cache(named={"yes_no": ["Yes", "no", "yes "]})
+    assert cache.resolve(["no", "yes"]) == ("no", "yes")
+    assert cache.resolve(grammar_name="yes_no") == ("no", "yes")
+    assert cache.resolve() is None
+    with pytest.raises(ValueError):
+        cache.resolve(grammar_name="missing")
+    with pytest.raises(ValueError):
+        cache.resolve([" "])
+
+
+def test_released_recognizers_are_reset_and_reused():
+    cache = make_cache()
+    grammar = cache.resolve(["yes", "no"])
+    recognizer = cache.acquire(grammar)
+    assert recognizer.grammar == ["no", "yes"]
+    cache.release(grammar, recognizer)
+    assert recognizer.resets == 1
+    assert cache.acquire(grammar) is recognizer
+    assert cache.acquire(grammar) is not recognizer
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_least_recently_used_grammar_is_evicted():
+    cache = make_cache()
+    first, second, third = ("a",), ("b",), ("c",)
+    recognizer = cache.acquire(first)
+    cache.acquire(second)
+    cache.acquire(third)
+    assert cache.evictions == 1
+    # Recognizers of an evicted grammar are not pooled
+    cache.release(first, recognizer)
+    assert cache.snapshot()["idle_recognizers"] == 0
+
+
+def test_pool_size_is_bounded():
+    cache = make_cache(pool_size=1)
+    grammar = ("a",)
+    recognizers = [cache.acquire(grammar), cache.acquire(grammar)]
+    for recognizer in recognizers:
+        cache.release(grammar, recognizer)
+    assert cache.snapshot()["idle_recognizers"] == 1
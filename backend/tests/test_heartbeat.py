@@ -0,0 +1,32 @@
+import time
+
+from app.services.heartbeat import Heartbeat
+
+
+def test_wait_time_is_bounded_by_next_ping():
+    heartbeat = Heartbeat(interval=5, timeout=60, audio_idle_timeout=120)
+    assert 4 < heartbeat.wait_time(session_active=True) <= 5
+
+
+def test_nothing_due_when_disabled():
+    heartbeat = Heartbeat(interval=0, timeout=0, audio_idle_timeout=0)
+    assert heartbeat.wait_time(session_active=True) is None
+    assert heartbeat.expired(session_active=True) is None
+
+
+def test_silent_client_is_reaped():
+    heartbeat = Heartbeat(interval=0, timeout=0.01, audio_idle_timeout=0)
+    time.sleep(0.02)
+    assert heartbeat.expired(session_active=False) == "heartbeat"
+    heartbeat.seen()
+    assert heartbeat.expired(session_active=False) is None
+
+
+def test_audio_idle_only_applies_to_active_sessions():
+    heartbeat = Heartbeat(interval=0, timeout=60, audio_idle_timeout=0.01)
+    time.sleep(0.02)
+    heartbeat.seen()  # a pong keeps the connection alive but is not audio
+    assert heartbeat.expired(session_active=False) is None
+    assert heartbeat.expired(session_active=True) == "audio_idle"
+    heartbeat.seen(is_audio=True)
+    assert heartbeat.expired(session_active=True) is None
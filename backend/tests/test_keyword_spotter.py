@@ -0,0 +1,38 @@
+import pytest
+
+from app.services.keyword_spotter import KeywordSpotter, PhraseMatcher
+
+
+def test_matcher_finds_overlapping_phrases():
+    matcher = PhraseMatcher(("account", "cancel my account", "my account"))
+    tokens = "please cancel my account today".split()
+    assert sorted(matcher.find(tokens)) == [
+        ("account", 3, 3),
+        ("cancel my account", 1, 3),
+        ("my account", 2, 3),
+    ]
+
+
+def test_matcher_follows_failure_links():
+    matcher = PhraseMatcher(("a b c", "b c d"))
+    assert matcher.find("a b c d".split()) == [("a b c", 0, 2), ("b c d", 1, 3)]
+    # Whole words only, case-insensitive
+    assert matcher.find(["Cancel"]) == []
+    assert PhraseMatcher(("cancel",)).find(["Cancel", "cancellation"]) == [("cancel", 0, 0)]
+
+
+def test_spotter_caches_normalized_lists():
+    spotter = KeywordSpotter(max_matchers=1, named={"tenant": ["Refund", "  speak to   a manager "]})
+    phrases = ["speak to a manager", "refund"]
+    matcher = spotter.resolve(phrases)
+    assert spotter.resolve(keyword_list="tenant") is matcher
+    assert matcher.phrases == ("refund", "speak to a manager")
+    assert (spotter.compiles, spotter.hits) == (1, 1)
+
+    spotter.resolve(["other"])
+    assert spotter.resolve(phrases) is not matcher
+    assert spotter.resolve() is None
+    with pytest.raises(ValueError):
+        spotter.resolve(keyword_list="missing")
+    with pytest.raises(ValueError):
+        spotter.resolve([" "])
@@ -0,0 +1,36 @@
+from app.config import settings
+from app.services.load_monitor import LoadMonitor
+
+
+def test_rtf_is_cpu_per_audio_second():
+    monitor = LoadMonitor(window_seconds=10)
+    monitor.record_decode(cpu_seconds=0.5, audio_seconds=1.0)
+    monitor.record_decode(cpu_seconds=0.1, audio_seconds=1.0)
+    assert abs(monitor.current_rtf() - 0.3) < 1e-9
+    assert abs(monitor.decode_load() - 0.06) < 1e-9
+
+
+def test_admission_refused_when_projected_load_exceeds_capacity(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_MAX_DECODE_LOAD", 1.0)
+    monkeypatch.setattr(settings, "DECODE_WORKERS", 1)
+    monkeypatch.setattr(settings, "ADMISSION_MAX_RTF", 10.0)
+    monitor = LoadMonitor(window_seconds=10)
+    monitor.session_started("a")
+    monitor.record_decode(cpu_seconds=4.0, audio_seconds=10.0)
+    assert monitor.check_admission() is None
+
+    monitor.session_started("b")
+    monitor.record_decode(cpu_seconds=3.0, audio_seconds=10.0)
+    assert monitor.check_admission() is not None
+    assert monitor.rejected_sessions == 1
+    assert monitor.snapshot()["accepting"] is False
+
+
+def test_session_limit(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_MAX_SESSIONS", 1)
+    monitor = LoadMonitor(window_seconds=10)
+    monitor.session_started("a")
+    assert monitor.check_admission() is not None
+    monitor.session_ended("a")
+    monitor.session_ended("a")
+    assert monitor.check_admission() is None
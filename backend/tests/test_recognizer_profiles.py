@@ -0,0 +1,50 @@
+import pytest
+
+from app.services.recognizer_profiles import DEFAULT_ENDPOINTER_DELAYS, RecognizerProfile, get_profile
+
+
+class FakeRecognizer:
+    """Recognizer of a Vosk release without SetEndpointerDelays"""
+
+    def SetPartialWords(self, enabled):
+        self.partial_words = enabled
+
+    def SetMaxAlternatives(self, alternatives):
+        self.max_alternatives = alternatives
+
+
+class EndpointerRecognizer(FakeRecognizer):
+    def SetEndpointerDelays(self, start_max, end, max_duration):
+        self.delays = (start_max, end, max_duration)
+
+
+def test_profiles_configure_recognizers():
+    recognizer = EndpointerRecognizer()
+    get_profile("accurate").apply(recognizer)
+    assert recognizer.max_alternatives == 3
+    assert recognizer.delays == (10.0, 1.0, 30.0)
+
+    # Switching profile on a pooled recognizer resets the other settings
+    get_profile("low_latency").apply(recognizer)
+    assert (recognizer.partial_words, recognizer.max_alternatives) == (True, 0)
+    assert recognizer.delays == (3.0, 0.3, 5.0)
+
+    get_profile("balanced").apply(recognizer)
+    assert (recognizer.partial_words, recognizer.max_alternatives) == (False, 0)
+    assert recognizer.delays == DEFAULT_ENDPOINTER_DELAYS
+
+
+def test_endpointer_delays_skipped_without_vosk_support():
+    recognizer = FakeRecognizer()
+    get_profile("low_latency").apply(recognizer)
+    assert recognizer.partial_words
+    assert not hasattr(recognizer, "delays")
+
+
+def test_chunk_bytes_and_lookup():
+    profile = RecognizerProfile("test", chunk_ms=500)
+    assert profile.chunk_bytes() == 16000
+    assert profile.chunk_bytes(channels=2) == 32000
+    assert get_profile().name == "balanced"
+    with pytest.raises(ValueError):
+        get_profile("fastest")
@@ -0,0 +1,76 @@
+from starlette.requests import Request
+
+from app.crud import session_crud, transcript_crud
+from app.models.session import Session as SessionModel
+from app.services.response_cache import SessionResponseCache, session_response_cache
+
+
+def make_request(**headers):
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+def make_session(db, status="completed"):
+    session = SessionModel(status=status, word_count=2, session_metadata={"source": "test"})
+    db.add(session)
+    db.commit()
+    transcript_crud.create_for_session(db, session_id=session.id, text="hello world", confidence=0.9)
+    return session_crud.get_with_transcripts(db, session.id)
+
+
+def test_caches_only_completed_sessions(db):
+    cache = SessionResponseCache(max_entries=2)
+    completed = make_session(db)
+    in_progress = make_session(db, status="in_progress")
+
+    cache.build(completed)
+    cache.build(in_progress)
+
+    assert cache.get(completed.id).body == cache.build(completed).body
+    assert b'"transcript_text":"hello world"' in cache.get(completed.id).body
+    assert cache.get(in_progress.id) is None
+
+
+def test_evicts_least_recently_used(db):
+    cache = SessionResponseCache(max_entries=2)
+    first, second, third = (make_session(db) for _ in range(3))
+    cache.build(first)
+    cache.build(second)
+    cache.get(first.id)
+    cache.build(third)
+
+    assert cache.get(second.id) is None
+    assert cache.get(first.id) is not None
+    assert cache.snapshot()["entries"] == 2
+
+
+def test_conditional_requests(db):
+    cached = SessionResponseCache(max_entries=2).build(make_session(db))
+
+    response = cached.respond(make_request())
+    assert response.status_code == 200
+    etag, last_modified = response.headers["etag"], response.headers["last-modified"]
+
+    assert cached.respond(make_request(if_none_match=etag)).status_code == 304
+    assert cached.respond(make_request(if_none_match=f'"other", W/{etag}')).status_code == 304
+    assert cached.respond(make_request(if_none_match='"other"')).status_code == 200
+    assert cached.respond(make_request(if_modified_since=last_modified)).status_code == 304
+    assert cached.respond(make_request(if_modified_since="Sat, 01 Jan 2000 00:00:00 GMT")).status_code == 200
+    # If-None-Match takes precedence over If-Modified-Since
+    assert cached.respond(make_request(if_none_match='"other"', if_modified_since=last_modified)).status_code == 200
+
+
+def test_crud_writes_invalidate_cached_response(db):
+    session = make_session(db)
+    old_etag = session_response_cache.build(session).etag
+
+    session_crud.update(db, db_obj=session, obj_in={"word_count": 3})
+    assert session_response_cache.get(session.id) is None
+    assert session_response_cache.build(session_crud.get_with_transcripts(db, session.id)).etag != old_etag
+
+    session_crud.delete(db, id=session.id)
+    assert session_response_cache.get(session.id) is None
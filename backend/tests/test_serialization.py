@@ -0,0 +1,29 @@
+import pytest
+
+from app.utils.serialization import get_serializer, serializer
+
+MESSAGE = {"type": "final_chunk", "text": "héllo wörld", "confidence": 0.91, "words": [{"word": "a", "conf": 1.0}]}
+
+
+@pytest.mark.parametrize("backend", ["auto", "orjson", "msgspec", "json"])
+def test_json_roundtrip(backend):
+    codec = get_serializer(backend)
+    encoded = codec.dumps(MESSAGE)
+    assert isinstance(encoded, str)
+    assert codec.loads(encoded) == MESSAGE
+    assert codec.loads(encoded.encode()) == MESSAGE
+
+
+def test_explicit_json_backend_is_stdlib():
+    assert get_serializer("json").name == "json"
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="orjson, msgspec, json"):
+        get_serializer("simplejson")
+
+
+def test_msgpack_roundtrip():
+    if not serializer.supports_msgpack:
+        pytest.skip("msgpack is not installed")
+    assert serializer.unpackb(serializer.packb(MESSAGE)) == MESSAGE
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from app.services.session_registry import SessionRegistry
+
+
+class FakeSession:
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.resume_token = SessionRegistry.new_token()
+        self.expired = False
+
+    async def expire(self):
+        self.expired = True
+
+
+@pytest.mark.asyncio
+async def test_resume_requires_matching_token():
+    registry = SessionRegistry(grace_seconds=30, max_detached=10, max_rss_mb=0)
+    session = FakeSession("a")
+    assert registry.detach(session)
+    assert registry.resume("a", "wrong-token") is None
+    assert registry.resume("a", session.resume_token) is session
+    assert registry.resume("a", session.resume_token) is None
+    assert len(registry) == 0
+
+
+@pytest.mark.asyncio
+async def test_detached_sessions_expire_after_grace_period():
+    registry = SessionRegistry(grace_seconds=0.01, max_detached=10, max_rss_mb=0)
+    session = FakeSession("a")
+    registry.detach(session)
+    await asyncio.sleep(0.05)
+    assert session.expired
+    assert registry.expired_sessions == 1
+    assert registry.resume("a", session.resume_token) is None
+
+
+@pytest.mark.asyncio
+async def test_oldest_detached_session_is_evicted_over_limit():
+    registry = SessionRegistry(grace_seconds=30, max_detached=2, max_rss_mb=0)
+    sessions = [FakeSession(name) for name in "abc"]
+    for session in sessions:
+        registry.detach(session)
+    await asyncio.sleep(0)
+    assert sessions[0].expired
+    assert not sessions[2].expired
+    assert registry.evicted_sessions == 1
+    await registry.finalize_all()
+    assert all(session.expired for session in sessions)
+
+
+@pytest.mark.asyncio
+async def test_disabled_when_grace_is_zero():
+    registry = SessionRegistry(grace_seconds=0, max_detached=10, max_rss_mb=0)
+    assert not registry.detach(FakeSession("a"))
+
+
+@pytest.mark.asyncio
+async def test_get_finds_active_and_detached_sessions():
+    registry = SessionRegistry(grace_seconds=30, max_detached=10, max_rss_mb=0)
+    active, detached = FakeSession("a"), FakeSession("b")
+    registry.add_active(active)
+    registry.detach(detached)
+    assert registry.get("a") is active
+    assert registry.get("b") is detached
+    assert registry.get("c") is None
+    registry.remove_active(active)
+    assert registry.get("a") is None
@@ -0,0 +1,55 @@
+from datetime import datetime
+
+import pytest
+
+from app.crud import session_crud
+from app.models.session import Session as SessionModel
+
+
+@pytest.fixture
+def db(db):
+    """The test database with five sessions, one per day from March 1"""
+    for day, status, metadata in [
+        (1, "completed", {"tenant": "acme", "campaign": "spring"}),
+        (2, "failed", {"tenant": "acme"}),
+        (3, "completed", {"tenant": "globex", "campaign": "spring"}),
+        (4, "in_progress", None),
+        (5, "completed", {"tenant": "2", "channels": 2, "cached": True, "audio_archive": False}),
+    ]:
+        db.add(SessionModel(created_at=datetime(2026, 3, day), status=status, session_metadata=metadata))
+    db.commit()
+    return db
+
+
+def days(sessions):
+    return [session.created_at.day for session in sessions]
+
+
+def test_search_without_filters_lists_newest_first(db):
+    sessions, total = session_crud.search(db, limit=2)
+    assert days(sessions) == [5, 4]
+    assert total == 5
+
+
+def test_search_filters_combine(db):
+    assert days(session_crud.search(db, status="completed")[0]) == [5, 3, 1]
+    assert days(session_crud.search(db, created_after=datetime(2026, 3, 2), created_before=datetime(2026, 3, 4))[0]) == [3, 2]
+    assert days(session_crud.search(db, metadata={"tenant": "acme"})[0]) == [2, 1]
+    assert session_crud.search(db, status="completed", metadata={"tenant": "acme", "campaign": "spring"})[1] == 1
+    assert session_crud.search(db, metadata={"tenant": "initech"}) == ([], 0)
+
+
+def test_search_matches_typed_metadata_values(db):
+    assert days(session_crud.search(db, metadata={"channels": 2, "cached": True, "audio_archive": False})[0]) == [5]
+    assert session_crud.search(db, metadata={"channels": "2"})[1] == 0
+    assert session_crud.search(db, metadata={"cached": 1})[1] == 0
+    assert days(session_crud.search(db, metadata={"tenant": "2"})[0]) == [5]
+    assert session_crud.search(db, metadata={"tenant": 2})[1] == 0
+
+
+def test_new_sessions_do_not_share_a_metadata_dict(db):
+    first, second = SessionModel(), SessionModel()
+    db.add_all([first, second])
+    db.commit()
+    first.session_metadata["tenant"] = "acme"
+    assert second.session_metadata == {}
@@ -0,0 +1,32 @@
+from app.services.tracing import NULL_TRACER, SessionTracer, TraceRegistry
+
+
+def test_null_tracer_records_nothing():
+    with NULL_TRACER.stage("decode_b64"):
+        pass
+    assert NULL_TRACER.enabled is False
+
+
+def test_ring_keeps_latest_events_and_exports_chrome_trace():
+    tracer = SessionTracer("abc", capacity=2)
+    for name in ("receive", "decode_b64", "send"):
+        with tracer.stage(name, bytes=10):
+            pass
+    trace = tracer.to_chrome_trace()
+    assert [e["name"] for e in trace["traceEvents"]] == ["decode_b64", "send"]
+    assert trace["traceEvents"][0]["ph"] == "X"
+    assert trace["traceEvents"][0]["args"] == {"bytes": 10}
+    assert trace["otherData"]["dropped_events"] == 1
+
+
+def test_registry_claims_requested_sessions_and_evicts_oldest():
+    registry = TraceRegistry(max_sessions=2)
+    assert registry.claim("a") is None
+    registry.request("a")
+    assert registry.claim("a") is not None
+    assert not registry.pending
+
+    registry.start("b")
+    registry.start("c")
+    assert registry.get("a") is None
+    assert registry.get("c") is not None
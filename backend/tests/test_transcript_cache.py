@@ -0,0 +1,54 @@
+from app.models.transcript_cache import TranscriptCacheEntry
+from app.services.recognizer_profiles import get_profile
+from app.services.transcript_cache import TranscriptCache
+
+RESULT = {
+    "text": "hello world",
+    "confidence": 0.8,
+    "word_count": 2,
+    "audio_duration": 1.0,
+    "words": [{"word": "hello", "start": 0.1, "end": 0.4, "conf": 0.8}],
+}
+
+
+def make_key(cache, pcm, **options):
+    digest = cache.hasher({"sample_rate": 16000, "channels": 1, "grammar": None, **options})
+    digest.update(pcm)
+    return digest.hexdigest()
+
+
+def test_key_depends_on_audio_model_and_options():
+    cache = TranscriptCache(max_entries=4, model_id="model-a")
+    key = make_key(cache, b"\x01\x00")
+    assert key == make_key(cache, b"\x01\x00")
+    assert key != make_key(cache, b"\x02\x00")
+    assert key != make_key(cache, b"\x01\x00", grammar=["yes", "no"])
+    balanced = make_key(cache, b"\x01\x00", profile=get_profile("balanced").options())
+    assert balanced != make_key(cache, b"\x01\x00", profile=get_profile("low_latency").options())
+    assert key != make_key(TranscriptCache(max_entries=4, model_id="model-b"), b"\x01\x00")
+
+
+def test_hits_memory_then_database_tier(db):
+    cache = TranscriptCache(max_entries=4, model_id="model")
+    key = make_key(cache, b"\x01\x00")
+    assert cache.get(db, key) is None
+    cache.put(db, key, RESULT)
+    assert cache.get(db, key) == RESULT
+
+    # A fresh process only has the database tier
+    restarted = TranscriptCache(max_entries=4, model_id="model")
+    assert restarted.get(db, key) == RESULT
+    assert restarted.get(db, key) == RESULT
+    assert (restarted.db_hits, restarted.memory_hits) == (1, 1)
+    assert db.get(TranscriptCacheEntry, key).hit_count == 1
+    assert cache.snapshot()["hit_ratio"] == 0.5
+
+
+def test_memory_tier_is_bounded(db):
+    cache = TranscriptCache(max_entries=1, model_id="model")
+    cache.put(db, "a", RESULT)
+    cache.put(db, "b", RESULT)
+    assert cache.snapshot()["memory_entries"] == 1
+    assert cache.get(db, "a") == RESULT
+    assert cache.db_hits == 1
+
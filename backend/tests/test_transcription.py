@@ -0,0 +1,63 @@
+import json
+
+from app.services.transcription import VoskTranscriptionService
+
+
+class FakeRecognizer:
+    """Stands in for KaldiRecognizer, returning canned Vosk JSON"""
+
+    def __init__(self, accept: bool):
+        self.accept = accept
+
+    def AcceptWaveform(self, data):
+        return self.accept
+
+    def Result(self):
+        return json.dumps({
+            "text": "hello world",
+            "result": [{"word": "hello", "conf": 0.9}, {"word": "world", "conf": 0.7}],
+        })
+
+    def PartialResult(self):
+        return json.dumps({"partial": "hello"})
+
+
+def test_process_audio_chunk_final():
+    result = VoskTranscriptionService.process_audio_chunk(FakeRecognizer(True), b"\x00\x00")
+    assert result["type"] == "final"
+    assert result["text"] == "hello world"
+    assert len(result["words"]) == 2
+
+
+def test_process_audio_chunk_partial():
+    result = VoskTranscriptionService.process_audio_chunk(FakeRecognizer(False), b"\x00\x00")
+    assert result == {"type": "partial", "text": "hello"}
+
+
+def test_word_count_and_confidence():
+    assert VoskTranscriptionService.calculate_word_count("one two  three") == 3
+    assert VoskTranscriptionService.calculate_word_count("") == 0
+    assert abs(VoskTranscriptionService.calculate_confidence([{"conf": 0.9}, {"conf": 0.7}]) - 0.8) < 1e-9
+    assert VoskTranscriptionService.calculate_confidence([]) is None
+
+
+def test_merge_channel_segments_by_start_time():
+    segments = [
+        {"channel": 1, "start": 2.0, "text": "i need help"},
+        {"channel": 0, "start": 0.5, "text": "hello"},
+        {"channel": 0, "start": 1.0, "text": "how can i help"},
+        {"channel": 0, "start": 3.5, "text": "sure"},
+    ]
+    transcript = VoskTranscriptionService.merge_channel_segments(segments, ["agent", "customer"])
+    assert transcript == "agent: hello how can i help\ncustomer: i need help\nagent: sure"
+
+
+def test_parse_final_with_alternatives():
+    raw = json.dumps({"alternatives": [
+        {"text": "recognize speech", "confidence": 210.5, "result": [{"word": "recognize"}]},
+        {"text": "wreck a nice beach", "confidence": 180.1},
+    ]})
+    result = VoskTranscriptionService.parse_final(raw)
+    assert result["text"] == "recognize speech"
+    assert result["words"] == [{"word": "recognize"}]
+    assert [a["text"] for a in result["alternatives"]] == ["recognize speech", "wreck a nice beach"]
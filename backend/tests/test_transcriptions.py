@@ -0,0 +1,54 @@
+import io
+import os
+import wave
+
+from fastapi.testclient import TestClient
+from app.config import settings
+from app.main import app
+
+client = TestClient(app)
+
+
+def make_wav(pcm: bytes, sample_rate: int = 16000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm)
+    return buffer.getvalue()
+
+
+def upload(data: bytes, **params):
+    return client.post("/api/v1/transcriptions", files={"file": ("audio.wav", data, "audio/wav")}, params=params)
+
+
+def test_upload_is_transcribed_then_cached():
+    # Random audio, so the first upload misses a cache kept from earlier runs
+    wav = make_wav(os.urandom(2 * 24000))
+
+    response = upload(wav, tenant="uploader")
+    assert response.status_code == 201
+    result = response.json()
+    assert result["cached"] is False
+    assert result["audio_duration"] == 1.5
+    assert client.get(f"/api/v1/sessions/{result['session_id']}").json()["status"] == "completed"
+    # Two one-second batch jobs, the second flushing the recognizer
+    assert client.get("/api/v1/admin/decode").json()["tenants"]["uploader"]["jobs"] == 2
+
+    cached = upload(wav).json()
+    assert cached["cached"] is True
+    assert cached["text"] == result["text"]
+    assert cached["session_id"] != result["session_id"]
+
+
+def test_upload_rejects_invalid_audio():
+    assert upload(b"not a wav file").status_code == 400
+    assert upload(make_wav(b"")).status_code == 400
+
+
+def test_upload_rejects_long_recordings(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_AUDIO_DURATION", 1)
+    response = upload(make_wav(b"\x00\x00" * 32000))
+    assert response.status_code == 413
+    assert "1 seconds" in response.json()["detail"]
@@ -0,0 +1,248 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+import uuid
+
+import pytest
+
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+from app.api.v1 import websocket as websocket_module
+from app.api.v1.websocket import TranscriptionSession
+from app.database import SessionLocal
+from app.main import app
+from app.services.decode_scheduler import DecodeScheduler
+from app.services.keyword_spotter import keyword_spotter
+from app.services.session_registry import session_registry
+
+client = TestClient(app)
+
+# 0.5s of 16 kHz 16-bit mono silence
+SILENCE = base64.b64encode(b"\x00\x00" * 8000).decode()
+
+
+def test_transcribe_session_roundtrip():
+    with client.websocket_connect("/ws/transcribe") as ws:
+        ws.send_json({"type": "start"})
+        started = ws.receive_json()
+        assert started["type"] == "session_started"
+        assert started["session_id"]
+
+        ws.send_json({"type": "audio", "data": SILENCE})
+        assert ws.receive_json()["type"] in ("partial", "final_chunk")
+
+        ws.send_json({"type": "stop"})
+        final = ws.receive_json()
+        assert final["type"] == "final"
+        assert final["word_count"] == 0
+
+
+def test_unknown_message_type():
+    with client.websocket_connect("/ws/transcribe") as ws:
+        ws.send_json({"type": "bogus"})
+        message = ws.receive_json()
+        assert message["type"] == "error"
+        assert "bogus" in message["message"]
+
+
+def test_start_with_client_session_id():
+    session_id = str(uuid.uuid4())
+    with client.websocket_connect("/ws/transcribe") as ws:
+        ws.send_json({"type": "start", "session_id": session_id})
+        started = ws.receive_json()
+        assert started["type"] == "session_started"
+        assert started["session_id"] == session_id
+        assert started["resume_token"]
+        ws.send_json({"type": "stop"})
+        assert ws.receive_json()["type"] == "final"
+
+    response = client.get(f"/api/v1/sessions/{session_id}")
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+
+
+def test_watcher_receives_session_events():
+    with client.websocket_connect("/ws/transcribe") as ws:
+        ws.send_json({"type": "start"})
+        session_id = ws.receive_json()["session_id"]
+
+        with client.websocket_connect(f"/ws/sessions/{session_id}/watch") as watcher:
+            assert watcher.receive_json() == {"type": "watching", "session_id": session_id}
+            ws.send_json({"type": "audio", "data": SILENCE})
+            event = ws.receive_json()
+            assert watcher.receive_json() == event
+
+            ws.send_json({"type": "stop"})
+            final = ws.receive_json()
+            assert final["type"] == "final"
+            assert watcher.receive_json() == final
+            with pytest.raises(WebSocketDisconnect) as closed:
+                watcher.receive_json()
+            assert closed.value.code == 1000
+
+
+def test_session_decodes_are_billed_to_its_tenant():
+    with client.websocket_connect("/ws/transcribe") as ws:
+        ws.send_json({"type": "start", "tenant": "acme"})
+        session_id = ws.receive_json()["session_id"]
+        ws.send_json({"type": "audio", "data": SILENCE})
+        ws.receive_json()
+        ws.send_json({"type": "stop"})
+        assert ws.receive_json()["type"] == "final"
+
+    assert client.get(f"/api/v1/sessions/{session_id}").json()["session_metadata"]["tenant"] == "acme"
+    # The audio frame and the final flush
+    assert client.get("/api/v1/admin/decode").json()["tenants"]["acme"]["jobs"] == 2
+
+
+def test_binary_audio_frames():
+    with client.websocket_connect("/ws/transcribe") as ws:
+        ws.send_json({"type": "start"})
+        assert ws.receive_json()["type"] == "session_started"
+        ws.send_bytes(b"\x00\x00" * 8000)
+        assert ws.receive_json()["offset"] == 16000
+        ws.send_json({"type": "stop"})
+        assert ws.receive_json()["type"] == "final"
+
+
+def test_watching_an_unknown_session_is_refused():
+    with client.websocket_connect(f"/ws/sessions/{uuid.uuid4()}/watch") as watcher:
+        with pytest.raises(WebSocketDisconnect) as closed:
+            watcher.receive_json()
+        assert closed.value.code == 4404
+
+
+def test_resume_decodes_all_audio_after_the_reported_offset():
+    with client.websocket_connect("/ws/transcribe") as ws:
+        ws.send_json({"type": "start"})
+        started = ws.receive_json()
+        ws.send_json({"type": "audio", "data": SILENCE})
+        assert ws.receive_json()["offset"] == 16000
+        # Each test connection runs its own event loop, let the background
+        # session row write finish before this one closes
+        while client.get(f"/api/v1/sessions/{started['session_id']}").status_code == 404:
+            time.sleep(0.01)
+
+    with client.websocket_connect("/ws/transcribe") as ws:
+        ws.send_json({
+            "type": "resume",
+            "session_id": started["session_id"],
+            "resume_token": started["resume_token"]
+        })
+        resumed = ws.receive_json()
+        assert resumed["type"] == "session_resumed"
+        assert resumed["offset"] == 16000
+        ws.send_json({"type": "audio", "data": SILENCE})
+        assert ws.receive_json()["offset"] == 32000
+        ws.send_json({"type": "audio", "data": SILENCE})
+        assert ws.receive_json()["offset"] == 48000
+        ws.send_json({"type": "stop"})
+        assert ws.receive_json()["type"] == "final"
+
+
+def test_start_refuses_a_session_id_in_use():
+    session_id = str(uuid.uuid4())
+    with client.websocket_connect("/ws/transcribe") as ws:
+        ws.send_json({"type": "start", "session_id": session_id})
+        assert ws.receive_json()["type"] == "session_started"
+
+        with client.websocket_connect("/ws/transcribe") as other:
+            other.send_json({"type": "start", "session_id": session_id})
+            assert "already running" in other.receive_json()["message"]
+
+        ws.send_json({"type": "stop"})
+        assert ws.receive_json()["type"] == "final"
+
+    # Checked in the background, after session_started
+    with client.websocket_connect("/ws/transcribe") as ws:
+        ws.send_json({"type": "start", "session_id": session_id})
+        assert ws.receive_json()["type"] == "session_started"
+        assert "already ended" in ws.receive_json()["message"]
+        ws.send_json({"type": "stop"})
+
+    assert client.get(f"/api/v1/sessions/{session_id}").json()["status"] == "completed"
+    assert session_registry.get(session_id) is None
+
+
+def test_malformed_frame_releases_the_session():
+    with client.websocket_connect("/ws/transcribe") as ws:
+        ws.send_json({"type": "start"})
+        session_id = ws.receive_json()["session_id"]
+        ws.send_text("{not json")
+        assert ws.receive_json()["type"] == "error"
+
+    assert session_id not in [str(s.session_id) for s in session_registry.active()]
+
+
+class SlowRecognizer:
+    """Decodes slowly and fails if flushed while a decode is running"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = []
+
+    def AcceptWaveform(self, data):
+        with self.lock:
+            time.sleep(0.1)
+            self.calls.append("accept")
+            return False
+
+    def PartialResult(self):
+        return '{"partial": ""}'
+
+    def FinalResult(self):
+        if not self.lock.acquire(blocking=False):
+            raise RuntimeError("recognizer flushed mid-decode")
+        self.lock.release()
+        self.calls.append("final")
+        return '{"text": ""}'
+
+
+@pytest.mark.asyncio
+async def test_terminate_waits_for_the_decode_in_flight(monkeypatch):
+    # Two decode threads, so an unguarded flush could overlap the decode
+    scheduler = DecodeScheduler(workers=2)
+    monkeypatch.setattr(websocket_module, "decode_scheduler", scheduler)
+    session = TranscriptionSession(None, SessionLocal())
+    await session.start()
+    recognizer = session.recognizers[0] = SlowRecognizer()
+
+    try:
+        decode = asyncio.ensure_future(session.process_audio(b"\x00\x00" * 8000))
+        await asyncio.sleep(0.02)
+        await session.terminate()
+        await decode
+    finally:
+        scheduler.shutdown()
+    assert recognizer.calls == ["accept", "final"]
+
+
+class FlushRecognizer:
+    """Holds one utterance that only the final flush returns"""
+
+    def FinalResult(self):
+        words = [{"word": word, "start": i * 0.5, "end": i * 0.5 + 0.4, "conf": 0.9}
+                 for i, word in enumerate(["an", "urgent", "refund"])]
+        return json.dumps({"text": "an urgent refund", "result": words})
+
+
+@pytest.mark.asyncio
+async def test_keywords_in_the_flushed_utterance_are_spotted():
+    session = TranscriptionSession(None, SessionLocal())
+    await session.start(keyword_matcher=keyword_spotter.resolve(["urgent refund"]))
+    session.recognizers[0] = FlushRecognizer()
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    session.send = send
+    await session.stop()
+
+    hit = next(message for message in sent if message["type"] == "keyword_hit")
+    assert (hit["phrase"], hit["start"], hit["end"]) == ("urgent refund", 0.5, 1.4)
+    assert sent[-1]["type"] == "final"
+    keywords = client.get(f"/api/v1/sessions/{session.session_id}/keywords").json()
+    assert [keyword["phrase"] for keyword in keywords] == ["urgent refund"]
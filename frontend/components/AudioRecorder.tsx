@@ -51,9 +51,9 @@ export function AudioRecorder() {
     }
   };
 
-  const handleStopRecording = () => {
-    // Stop recording
-    stopRecording();
+  const handleStopRecording = async () => {
+    // Stop recording, sending the last captured audio before the stop message
+    await stopRecording();
     toast.info('Audio transcription stopped.');
     // Stop transcription session
     stopSession();
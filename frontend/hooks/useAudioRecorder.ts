@@ -5,13 +5,26 @@ interface UseAudioRecorderReturn {
   duration: number;
   error: string | null;
   startRecording: () => Promise<void>;
-  stopRecording: () => void;
+  stopRecording: () => Promise<void>;
   pauseRecording: () => void;
   resumeRecording: () => void;
 }
 
+interface UseAudioRecorderOptions {
+  // Duration of each PCM frame handed to onAudioData
+  frameMs?: number;
+}
+
+const WORKLET_URL = '/worklets/pcm-capture-processor.js';
+// How long stopRecording waits for the worklet's last partial frame
+const FLUSH_TIMEOUT_MS = 500;
+
+// Captures 16 kHz mono audio in an AudioWorklet, which converts it to 16-bit
+// PCM and batches it into frames off the main thread. Each frame's buffer is
+// transferred, so onAudioData owns it and can send it as is.
 export function useAudioRecorder(
-  onAudioData?: (audioData: Float32Array) => void
+  onAudioData?: (pcmData: ArrayBuffer) => void,
+  { frameMs = 100 }: UseAudioRecorderOptions = {}
 ): UseAudioRecorderReturn {
   const [isRecording, setIsRecording] = useState(false);
   const [duration, setDuration] = useState(0);
@@ -23,11 +36,10 @@ export function useAudioRecorder(
     isRecordingRef.current = isRecording;
   }, [isRecording]);
 
-  const mediaRecorderRef = useRef<MediaRecorder | null>(null);
   const audioContextRef = useRef<AudioContext | null>(null);
   const streamRef = useRef<MediaStream | null>(null);
   const durationIntervalRef = useRef<NodeJS.Timeout | null>(null);
-  const processorRef = useRef<ScriptProcessorNode | null>(null);
+  const processorRef = useRef<AudioWorkletNode | null>(null);
 
   const startRecording = useCallback(async () => {
     try {
@@ -49,17 +61,22 @@ export function useAudioRecorder(
       const audioContext = new AudioContext({ sampleRate: 16000 });
       audioContextRef.current = audioContext;
 
+      await audioContext.audioWorklet.addModule(WORKLET_URL);
       const source = audioContext.createMediaStreamSource(stream);
-      const processor = audioContext.createScriptProcessor(4096, 1, 1);
+      const processor = new AudioWorkletNode(audioContext, 'pcm-capture-processor', {
+        channelCount: 1,
+        channelCountMode: 'explicit',
+        processorOptions: { frameMs },
+      });
       processorRef.current = processor;
 
-      processor.onaudioprocess = (e) => {
+      processor.port.onmessage = (e: MessageEvent<ArrayBuffer>) => {
         if (onAudioData && isRecordingRef.current) {
-          const inputData = e.inputBuffer.getChannelData(0);
-          onAudioData(inputData);
+          onAudioData(e.data);
         }
       };
 
+      // The worklet outputs silence; connecting it keeps it processing
       source.connect(processor);
       processor.connect(audioContext.destination);
 
@@ -74,17 +91,33 @@ export function useAudioRecorder(
       console.error('Error starting recording:', err);
       setError('Failed to access microphone. Please check permissions.');
     }
-  }, [onAudioData]);
+  }, [onAudioData, frameMs]);
 
-  const stopRecording = useCallback(() => {
+  // Resolves once the audio captured before the call has reached onAudioData
+  const stopRecording = useCallback(async () => {
     if (streamRef.current) {
       streamRef.current.getTracks().forEach((track) => track.stop());
       streamRef.current = null;
     }
 
-    if (processorRef.current) {
-      processorRef.current.disconnect();
-      processorRef.current = null;
+    const processor = processorRef.current;
+    processorRef.current = null;
+    if (processor) {
+      // Ask the worklet for its partial frame, which arrives before 'stopped'
+      await new Promise<void>((resolve) => {
+        const timeout = setTimeout(resolve, FLUSH_TIMEOUT_MS);
+        processor.port.onmessage = (e: MessageEvent<ArrayBuffer | string>) => {
+          if (e.data === 'stopped') {
+            clearTimeout(timeout);
+            resolve();
+          } else if (onAudioData && typeof e.data !== 'string') {
+            onAudioData(e.data);
+          }
+        };
+        processor.port.postMessage('stop');
+      });
+      processor.port.onmessage = null;
+      processor.disconnect();
     }
 
     if (audioContextRef.current) {
@@ -99,7 +132,7 @@ export function useAudioRecorder(
 
     setIsRecording(false);
     setDuration(0);
-  }, []);
+  }, [onAudioData]);
 
   const pauseRecording = useCallback(() => {
     if (audioContextRef.current && isRecording) {
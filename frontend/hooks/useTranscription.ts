@@ -11,7 +11,7 @@ interface UseTranscriptionReturn {
   error: string | null;
   connect: () => Promise<void>;
   disconnect: () => void;
-  sendAudio: (audioData: Float32Array) => void;
+  sendAudio: (pcmData: ArrayBuffer) => void;
   startSession: () => void;
   stopSession: () => void;
 }
@@ -94,20 +94,10 @@ export function useTranscription(): UseTranscriptionReturn {
     }
   }, []);
 
-  const sendAudio = useCallback((audioData: Float32Array) => {
+  // pcmData is 16-bit mono PCM from useAudioRecorder, sent as a binary frame
+  const sendAudio = useCallback((pcmData: ArrayBuffer) => {
     if (wsRef.current && wsRef.current.isConnected()) {
-      // Convert Float32Array to PCM Int16
-      const pcmData = new Int16Array(audioData.length);
-      for (let i = 0; i < audioData.length; i++) {
-        const s = Math.max(-1, Math.min(1, audioData[i]));
-        pcmData[i] = s < 0 ? s * 0x8000 : s * 0x7fff;
-      }
-
-      // Convert to base64
-      const uint8Array = new Uint8Array(pcmData.buffer);
-      const base64 = btoa(String.fromCharCode(...uint8Array));
-
-      wsRef.current.sendAudio(base64);
+      wsRef.current.sendAudioBinary(pcmData);
     }
   }, []);
 
@@ -27,6 +27,7 @@ export class TranscriptionWebSocket {
       try {
         this.messageHandler = onMessage;
         this.ws = new WebSocket(`${WS_URL}/ws/transcribe`);
+        this.ws.binaryType = 'arraybuffer';
 
         this.ws.onopen = () => {
           this.reconnectAttempts = 0;
@@ -34,8 +35,17 @@ export class TranscriptionWebSocket {
         };
 
         this.ws.onmessage = (event) => {
+          if (typeof event.data !== 'string') {
+            // Binary frames are only sent to MessagePack sessions
+            return;
+          }
           try {
             const data = JSON.parse(event.data);
+            if (data.type === 'ping') {
+              // Answer server heartbeats so the session is not reaped
+              this.send({ type: 'pong' });
+              return;
+            }
             if (this.messageHandler) {
               this.messageHandler(data);
             }
@@ -80,6 +90,15 @@ export class TranscriptionWebSocket {
     this.send(message);
   }
 
+  // Send raw 16-bit PCM as a binary frame, without base64 or JSON overhead
+  sendAudioBinary(pcmData: ArrayBuffer): void {
+    if (this.ws && this.ws.readyState === WebSocket.OPEN) {
+      this.ws.send(pcmData);
+    } else {
+      console.error('WebSocket is not connected');
+    }
+  }
+
   stopSession(): void {
     const message: WSStopMessage = { type: 'stop' };
     this.send(message);
@@ -0,0 +1,59 @@
+// Captures mono 16-bit PCM off the main thread.
+//
+// Float samples are converted to int16 as they arrive and batched into
+// frames of `frameMs` milliseconds; each full frame's buffer is transferred
+// (not copied) to the main thread through the node's port.
+//
+// Posting 'stop' to the port flushes the partial frame, if any, followed by
+// a 'stopped' reply, after which the processor ends.
+
+class PcmCaptureProcessor extends AudioWorkletProcessor {
+  constructor(options) {
+    super();
+    const frameMs = (options.processorOptions && options.processorOptions.frameMs) || 100;
+    this.frameSamples = Math.max(128, Math.round((sampleRate * frameMs) / 1000));
+    this.frame = new Int16Array(this.frameSamples);
+    this.filled = 0;
+    this.stopped = false;
+    this.port.onmessage = (e) => {
+      if (e.data === 'stop') {
+        this.stop();
+      }
+    };
+  }
+
+  stop() {
+    if (this.filled > 0) {
+      const tail = this.frame.slice(0, this.filled);
+      this.port.postMessage(tail.buffer, [tail.buffer]);
+      this.filled = 0;
+    }
+    this.stopped = true;
+    this.port.postMessage('stopped');
+  }
+
+  process(inputs) {
+    if (this.stopped) {
+      return false;
+    }
+    const input = inputs[0] && inputs[0][0];
+    if (!input) {
+      // No input connected yet, keep the node alive
+      return true;
+    }
+
+    for (let i = 0; i < input.length; i++) {
+      const s = input[i] < -1 ? -1 : input[i] > 1 ? 1 : input[i];
+      this.frame[this.filled++] = s < 0 ? s * 0x8000 : s * 0x7fff;
+
+      if (this.filled === this.frameSamples) {
+        this.port.postMessage(this.frame.buffer, [this.frame.buffer]);
+        this.frame = new Int16Array(this.frameSamples);
+        this.filled = 0;
+      }
+    }
+    return true;
+  }
+}
+
+registerProcessor('pcm-capture-processor', PcmCaptureProcessor);
@@ -45,12 +45,19 @@ export interface WSStopMessage extends WSMessage {
 export interface WSPartialResult extends WSMessage {
   type: 'partial';
   text: string;
+  offset?: number; // PCM bytes decoded so far
+  channel?: number; // multi-channel sessions only
+  words?: Array<{ word: string; start: number; end: number; conf?: number }>; // low_latency profile
 }
 
 export interface WSFinalChunk extends WSMessage {
   type: 'final_chunk';
   text: string;
   confidence?: number;
+  offset?: number;
+  channel?: number;
+  alternatives?: Array<{ text: string; confidence?: number }>; // accurate profile
+  forced?: boolean; // finalized by the profile's forced-final interval
 }
 
 export interface WSFinalResult extends WSMessage {
@@ -59,11 +66,30 @@ export interface WSFinalResult extends WSMessage {
   word_count: number;
   duration: number;
   confidence?: number;
+  segments?: WSChannelSegment[]; // multi-channel sessions only
+}
+
+export interface WSChannelSegment {
+  channel: number;
+  speaker: string;
+  start: number;
+  text: string;
 }
 
 export interface WSSessionStarted extends WSMessage {
   type: 'session_started';
   session_id: string;
+  resume_token?: string;
+}
+
+export interface WSKeywordHit extends WSMessage {
+  type: 'keyword_hit';
+  phrase: string;
+  start?: number | null; // seconds into the stream
+  end?: number | null;
+  offset?: number;
+  channel?: number;
+  partial?: boolean; // spotted in a partial result
 }
 
 export interface WSError extends WSMessage {